@@ -0,0 +1,48 @@
+"""
+Moves closed jobs past the retention age, with their applications, into
+`jobs_archive` / `applications_archive` (see archive_service).
+
+Closed jobs move once closed for that long and no application is still
+in progress, taking all their applications along; applications of open
+jobs stay hot. Each batch is one transaction, so the script can be
+interrupted and re-run at any time. Requires a replica set (transactions).
+
+Usage:
+    python scripts/archive_old_records.py [--retention-days 180] [--job-batch-size 25] [--dry-run]
+"""
+import os
+import sys
+import argparse
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.db import ensure_archive_indexes
+from src.backend.services import archive_service
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--retention-days", type=int, default=archive_service.ARCHIVE_RETENTION_DAYS)
+    parser.add_argument("--job-batch-size", type=int, default=archive_service.ARCHIVE_JOB_BATCH_SIZE, help="Jobs per transaction.")
+    parser.add_argument("--dry-run", action="store_true", help="Count candidates without moving anything.")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"🗄️  ARCHIVE RECORDS OLDER THAN {args.retention_days} DAYS{' (DRY RUN)' if args.dry_run else ''}")
+    print("=" * 60)
+    ensure_archive_indexes()
+
+    if args.dry_run:
+        counts = archive_service.pending(args.retention_days)
+        print(f"✅ Up to {counts['jobs']} closed jobs are due (jobs with applications in progress are kept).")
+        print("=" * 60)
+        return
+
+    stats = archive_service.run(args.retention_days, args.job_batch_size)
+    print(f"✅ Jobs archived: {stats['jobs']} (with {stats['jobApplications']} applications)")
+    if stats["blockedJobs"]:
+        print(f"⏭️  {stats['blockedJobs']} closed jobs kept: applications still in progress.")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Stamps updatedAt on interviews booked before the calendar feed existed.
+
+The ICS feed's sync tokens and ETags are built from the newest updatedAt
+among a person's interviews, so every interview needs one. Legacy
+documents get the current server time, which makes existing calendar
+clients refetch once. Only documents still missing the field are
+touched, so the script is idempotent and safe to run while the API is live.
+
+Usage:
+    python scripts/backfill_interview_updated_at.py [--batch-size 1000] [--dry-run]
+"""
+import os
+import sys
+import argparse
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.db import interviews_collection
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing.")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"🗓️ BACKFILL INTERVIEW updatedAt{' (DRY RUN)' if args.dry_run else ''}")
+    print("=" * 60)
+
+    missing = {"updatedAt": None}
+    stamped = 0
+    last_id = None
+    while True:
+        q = missing if last_id is None else {"$and": [missing, {"_id": {"$gt": last_id}}]}
+        ids = [d["_id"] for d in interviews_collection().find(q, {"_id": 1}).sort("_id", 1).limit(args.batch_size)]
+        if not ids: break
+        last_id = ids[-1]
+
+        if args.dry_run:
+            stamped += len(ids)
+        else:
+            # Re-check the filter: an interview updated since the read already has its own timestamp.
+            stamped += interviews_collection().update_many(
+                {"_id": {"$in": ids}, "updatedAt": None}, {"$currentDate": {"updatedAt": True}}
+            ).modified_count
+        print(f"   ... {stamped} stamped")
+
+    verb = "Would stamp" if args.dry_run else "Stamped"
+    print(f"✅ {verb} {stamped} interviews.")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
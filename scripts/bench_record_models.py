@@ -0,0 +1,171 @@
+"""
+Benchmark for the slotted record models (src/backend/models).
+
+Converts N synthetic users, jobs and applications (BSON-shaped dicts with
+datetimes, as find() returns them) twice: through the old per-row dict
+converters, kept verbatim below as the reference, and through
+User/Job/Application.from_bson. Reports the best build time over --repeat
+runs, plus the memory and live allocations retained by the list of
+N outputs (tracemalloc). Every record must match its reference dict.
+
+Usage:
+    python scripts/bench_record_models.py --rows 100000 --repeat 3
+"""
+import os
+import sys
+import gc
+import time
+import random
+import argparse
+import tracemalloc
+from datetime import datetime, timedelta
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.db import to_iso_string, POSTED_AT_FORMAT, SUBMITTED_AT_FORMAT
+from src.backend.models.user import User
+from src.backend.models.job import Job
+from src.backend.models.application import Application
+
+# --- Reference: the dict converters the models replaced ---
+def legacy_to_user_output(doc: dict):
+    if not doc: return None
+    return {
+        "UserID": doc.get("UserID"), "email": doc.get("email"), "firstName": doc.get("firstName"),
+        "lastName": doc.get("lastName"), "role": doc.get("role"), "phone_number": doc.get("phone_number"),
+        "city": doc.get("city"), "state_province": doc.get("state_province"), "country": doc.get("country"),
+        "linkedin_profile": doc.get("linkedin_profile"), "portfolio_url": doc.get("portfolio_url"),
+        "highest_qualification": doc.get("highest_qualification"), "years_of_experience": doc.get("years_of_experience"),
+        "createdAt": to_iso_string(doc.get("createdAt")), "dob": doc.get("dob"), "skills": doc.get("skills"),
+        "professionalTitle": doc.get("professionalTitle"), "is_us_citizen": doc.get("is_us_citizen"),
+        "highest_degree_year": doc.get("highest_degree_year")
+    }
+
+def legacy_to_job_output(doc: dict):
+    if not doc: return None
+    return {
+        "jobId": int(doc.get("jobId")) if doc.get("jobId") is not None else None,
+        "title": doc.get("title"), "company": doc.get("company"), "location": doc.get("location"),
+        "salaryRange": doc.get("salaryRange"), "skillsRequired": doc.get("skillsRequired"),
+        "description": doc.get("description"), "postedAt": to_iso_string(doc.get("postedAt"), POSTED_AT_FORMAT),
+        "requires_us_citizenship": doc.get("requires_us_citizenship"),
+        "minimum_degree_year": doc.get("minimum_degree_year"),
+        "status": doc.get("status"),
+        "posterUserId": doc.get("posterUserId"),
+        "posterName": doc.get("posterName"),
+        "hiringManagerId": doc.get("hiringManagerId"),
+        "hiringManagerName": doc.get("hiringManagerName"),
+        "archivedAt": to_iso_string(doc.get("archivedAt"), SUBMITTED_AT_FORMAT),
+    }
+
+def legacy_to_application_output(doc: dict):
+    if not doc:
+        return None
+    return {
+        "appId": int(doc.get("appId")) if doc.get("appId") is not None else None,
+        "userId": int(doc.get("userId")) if doc.get("userId") is not None else None,
+        "jobId": int(doc.get("jobId")) if doc.get("jobId") is not None else None,
+        "status": doc.get("status"),
+        "submittedAt": to_iso_string(doc.get("submittedAt"), SUBMITTED_AT_FORMAT),
+        "noteCount": doc.get("noteCount"),
+        "archivedAt": to_iso_string(doc.get("archivedAt"), SUBMITTED_AT_FORMAT),
+        "userName": doc.get("userName"),
+        "jobTitle": doc.get("jobTitle"),
+        "companyName": doc.get("companyName"),
+        "emailSent": doc.get("emailSent"),
+    }
+
+# --- Synthetic documents ---
+SKILLS = ["Python", "Java", "SQL", "React", "AWS", "Docker", "Kubernetes", "Go"]
+STATUSES = ["Applied", "Interviewing", "Offered", "Rejected", "Hired"]
+
+def make_users(n, base):
+    return [{
+        "UserID": i, "email": f"user{i}@example.com", "firstName": f"First{i}", "lastName": f"Last{i}",
+        "role": "Applicant", "phone_number": "555-0100", "city": "Austin", "state_province": "TX",
+        "country": "USA", "linkedin_profile": None, "portfolio_url": None,
+        "highest_qualification": "Bachelors", "years_of_experience": i % 20,
+        "createdAt": base + timedelta(minutes=i), "dob": "1990-01-01",
+        "skills": random.sample(SKILLS, 3), "professionalTitle": "Engineer",
+        "is_us_citizen": bool(i % 2), "highest_degree_year": 2010 + i % 12,
+    } for i in range(1, n + 1)]
+
+def make_jobs(n, base):
+    return [{
+        "jobId": i, "title": f"Engineer {i}", "company": f"Company {i % 500}", "location": "Remote",
+        "salaryRange": "100k-150k", "skillsRequired": random.sample(SKILLS, 4),
+        "description": "Build and run services.", "postedAt": base + timedelta(hours=i % 5000),
+        "requires_us_citizenship": False, "minimum_degree_year": None, "status": "Open",
+        "posterUserId": 1, "posterName": "Rita Recruiter", "hiringManagerId": 2, "hiringManagerName": "Max Manager",
+    } for i in range(1, n + 1)]
+
+def make_applications(n, base):
+    return [{
+        "appId": i, "userId": i % 5000 + 1, "jobId": i % 800 + 1, "status": random.choice(STATUSES),
+        "submittedAt": base + timedelta(minutes=i), "noteCount": i % 4,
+        "userName": f"First{i} Last{i}", "jobTitle": f"Engineer {i % 800 + 1}",
+        "companyName": f"Company {i % 500}", "emailSent": None,
+    } for i in range(1, n + 1)]
+
+# --- Measurement ---
+def best_time(convert, docs, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = [convert(d) for d in docs]
+        best = min(best, time.perf_counter() - start)
+        del out
+    return best
+
+def retained(convert, docs):
+    """Bytes and live allocations held by the converted list (GC off so nothing is collected mid-build)."""
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        out = [convert(d) for d in docs]
+        snapshot = tracemalloc.take_snapshot()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return out, size, blocks
+
+def compare(kind, docs, legacy, model, repeat):
+    ref, ref_bytes, ref_blocks = retained(legacy, docs)
+    recs, rec_bytes, rec_blocks = retained(model, docs)
+    for expected, record in zip(ref, recs):
+        if any(record[k] != v for k, v in expected.items()):
+            print(f"❌ {kind}: record differs from the dict converter: {expected!r}")
+            sys.exit(1)
+    del ref, recs
+
+    t_ref = best_time(legacy, docs, repeat)
+    t_rec = best_time(model, docs, repeat)
+    n = len(docs)
+    print(f"\n{kind} ({n} rows)")
+    print(f"  {'':<16} {'build ms':>10} {'rows/s':>12} {'retained MB':>12} {'bytes/row':>10} {'allocs/row':>10}")
+    for label, t, size, blocks in (("dict", t_ref, ref_bytes, ref_blocks), ("slotted record", t_rec, rec_bytes, rec_blocks)):
+        print(f"  {label:<16} {t * 1000:10.1f} {n / t:12,.0f} {size / 1e6:12.1f} {size / n:10.0f} {blocks / n:10.2f}")
+    print(f"  ✅ identical fields, {t_ref / t_rec:.2f}x throughput, {ref_bytes / rec_bytes:.2f}x less memory")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(7)
+    base = datetime(2030, 1, 1)
+    print("=" * 60)
+    print(f"📊 RECORD MODELS vs DICT OUTPUTS ({args.rows} rows each)")
+    print("=" * 60)
+    compare("users", make_users(args.rows, base), legacy_to_user_output, User.from_bson, args.repeat)
+    compare("jobs", make_jobs(args.rows, base), legacy_to_job_output, Job.from_bson, args.repeat)
+    compare("applications", make_applications(args.rows, base), legacy_to_application_output, Application.from_bson, args.repeat)
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
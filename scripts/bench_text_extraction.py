@@ -0,0 +1,122 @@
+"""
+Micro-benchmark for resume text extraction.
+
+Generates a corpus of multi-page PDFs and DOCX files, then compares the legacy
+serial pypdf loop against text_extraction_service (process pool + budgets).
+
+Usage:
+    python scripts/bench_text_extraction.py --docs 20 --pages 40
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+import argparse
+
+import pypdf
+import docx
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.services import text_extraction_service
+
+WORDS = ("python java react mongodb kubernetes led team delivered platform migration "
+         "analytics pipeline customers revenue designed implemented reduced latency").split()
+
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def write_pdf(path, pages, lines_per_page=45):
+    """Writes a minimal text-only PDF (Helvetica, one content stream per page)."""
+    objects = []
+    font_id = 3
+    page_ids = []
+    contents = []
+    for p in range(pages):
+        lines = [f"Page {p + 1} " + " ".join(random.choices(WORDS, k=12)) for _ in range(lines_per_page)]
+        body = "BT /F1 10 Tf 40 800 Td 14 TL " + " ".join(f"({_pdf_escape(l)}) '" for l in lines) + " ET"
+        contents.append(body.encode("latin-1"))
+
+    # 1: catalog, 2: pages, 3: font, then (page, content) pairs
+    next_id = 4
+    for _ in range(pages):
+        page_ids.append(next_id)
+        next_id += 2
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for pid, stream in zip(page_ids, contents):
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {pid + 1} 0 R >>".encode()
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    with open(path, "wb") as f:
+        f.write(out)
+
+def write_docx(path, paragraphs):
+    document = docx.Document()
+    for i in range(paragraphs):
+        document.add_paragraph(f"Paragraph {i} " + " ".join(random.choices(WORDS, k=20)))
+    document.save(path)
+
+def legacy_pdf(path):
+    with open(path, 'rb') as f:
+        reader = pypdf.PdfReader(f)
+        return "".join(page.extract_text() for page in reader.pages)
+
+def legacy_docx(path):
+    return "\n".join(p.text for p in docx.Document(path).paragraphs)
+
+def bench(label, fn, paths):
+    start = time.perf_counter()
+    chars = sum(len(fn(p)) for p in paths)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f}s  {len(paths) / elapsed:8.2f} docs/s  {elapsed / len(paths) * 1000:8.1f} ms/doc  chars={chars}")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--paragraphs", type=int, default=400)
+    args = parser.parse_args()
+
+    random.seed(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Generating {args.docs} PDFs x {args.pages} pages and {args.docs} DOCX x {args.paragraphs} paragraphs...")
+        pdfs, docxs = [], []
+        for i in range(args.docs):
+            pdfs.append(os.path.join(tmp, f"cv_{i}.pdf"))
+            write_pdf(pdfs[-1], args.pages)
+            docxs.append(os.path.join(tmp, f"cv_{i}.docx"))
+            write_docx(docxs[-1], args.paragraphs)
+
+        print(f"\nPDF (budget: {text_extraction_service.RESUME_MAX_PAGES} pages / {text_extraction_service.RESUME_MAX_CHARS} chars, "
+              f"{text_extraction_service.RESUME_EXTRACT_WORKERS} workers)")
+        # Warm the pool so worker start-up is not billed to the first document.
+        "".join(text_extraction_service.iter_pdf_text(pdfs[0]))
+        bench("legacy serial (all pages)", legacy_pdf, pdfs)
+        bench("pooled + budgets", lambda p: "".join(text_extraction_service.iter_pdf_text(p)), pdfs)
+
+        print("\nDOCX")
+        bench("legacy", legacy_docx, docxs)
+        bench("streamed + budget", lambda p: "".join(text_extraction_service.iter_docx_text(p)), docxs)
+
+if __name__ == "__main__":
+    main()
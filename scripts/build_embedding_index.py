@@ -0,0 +1,41 @@
+"""
+Rebuilds the job and candidate matching indexes from MongoDB.
+
+Re-encodes every open job and every applicant (profile + resume library),
+recomputes the IDF weights and writes the .npz files to EMBEDDING_INDEX_DIR.
+Incremental updates from the API keep the indexes fresh between rebuilds;
+run this after bulk imports or when the vocabulary has drifted.
+
+Usage:
+    python scripts/build_embedding_index.py
+    python scripts/build_embedding_index.py --only jobs
+"""
+import os
+import sys
+import time
+import argparse
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.services import embedding_service
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", choices=["jobs", "candidates"], help="Rebuild a single index")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧭 BUILD EMBEDDING INDEX")
+    print("=" * 60)
+    print(f"Dimension: {embedding_service.EMBEDDING_DIM}  Directory: {os.path.abspath(embedding_service.EMBEDDING_INDEX_DIR)}")
+
+    steps = [("jobs", embedding_service.rebuild_job_index), ("candidates", embedding_service.rebuild_candidate_index)]
+    for name, rebuild in steps:
+        if args.only and args.only != name: continue
+        start = time.perf_counter()
+        count = rebuild()
+        print(f"  ✅ {name}: {count} vectors in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
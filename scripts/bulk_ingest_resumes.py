@@ -0,0 +1,232 @@
+"""
+Bulk resume ingestion.
+
+Loads a directory or manifest of CVs into the resume library without going
+through the HTTP upload endpoint one file at a time.
+
+  * Directory mode: file names must start with the owner's UserID,
+    e.g. "335_jane_doe.pdf" or "user_335_cv.docx".
+  * Manifest mode: a .csv with "path,userId" columns or a .jsonl file with
+    {"path": ..., "userId": ...} per line. Relative paths are resolved
+    against the manifest's folder.
+
+Files are hashed and de-duplicated, text is extracted in a process pool,
+LLM parsing runs with bounded concurrency (identical files are parsed once
+and served from the parse cache afterwards), and resumes + user profile
+updates are written with bulk_write per batch, and ingested candidates are
+added to the matching index. A checkpoint file records every
+(userId, contentHash) written, so an interrupted run can be re-run with the
+same arguments and will skip what is already done. Every write step is
+idempotent (resumes are upserted on (userId, contentHash), profile and
+skill updates are $set/$addToSet), so a batch interrupted before its
+checkpoint line is simply written again.
+
+Usage:
+    python scripts/bulk_ingest_resumes.py ./cvs --workers 4 --llm-concurrency 8
+    python scripts/bulk_ingest_resumes.py manifest.csv --checkpoint run1.ckpt
+"""
+import os
+import re
+import sys
+import csv
+import json
+import time
+import shutil
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.services import text_extraction_service
+
+ALLOWED_EXTENSIONS = {'.pdf', '.docx'}
+RESUME_FOLDER = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'backend', 'resumes'))
+USER_ID_IN_NAME = re.compile(r"^(?:user_)?(\d+)[_\-]")
+
+# --- Discovery ---
+def discover_directory(directory):
+    entries = []
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() not in ALLOWED_EXTENSIONS: continue
+            match = USER_ID_IN_NAME.match(name)
+            if not match:
+                print(f"  ⚠️ Skipping {name}: no UserID prefix in file name.")
+                continue
+            entries.append({"path": os.path.join(root, name), "userId": int(match.group(1))})
+    return entries
+
+def discover_manifest(manifest):
+    base = os.path.dirname(os.path.abspath(manifest))
+    with open(manifest, newline='', encoding='utf-8') as f:
+        if manifest.lower().endswith('.jsonl'):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+    entries = []
+    for row in rows:
+        path = row["path"] if os.path.isabs(row["path"]) else os.path.join(base, row["path"])
+        if os.path.splitext(path)[1].lower() not in ALLOWED_EXTENSIONS:
+            print(f"  ⚠️ Skipping {path}: unsupported file type.")
+            continue
+        entries.append({"path": path, "userId": int(row["userId"])})
+    return entries
+
+# --- Checkpoint ---
+def load_checkpoint(path):
+    done = set()
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    rec = json.loads(line)
+                    done.add((rec["userId"], rec["contentHash"]))
+    return done
+
+def append_checkpoint(handle, entries):
+    for e in entries:
+        handle.write(json.dumps({"userId": e["userId"], "contentHash": e["contentHash"]}) + "\n")
+    handle.flush()
+    os.fsync(handle.fileno())
+
+# --- Stats ---
+class StageTimer:
+    def __init__(self):
+        self.totals = defaultdict(float)
+
+    def run(self, stage, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.totals[stage] += time.perf_counter() - start
+
+def chunked(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+# --- Pipeline ---
+def ingest_batch(batch, extract_pool, llm_pool, timer, copy_files):
+    """Runs one batch through cache lookup -> extraction -> LLM parse -> bulk write. Returns entries written."""
+    from src.backend.services import resume_parser_service, skill_service, embedding_service
+    from src.backend.repository import resume_repo, resume_cache_repo, user_repo
+
+    # 1. Parse cache: one $in query for the whole batch
+    hashes = {e["contentHash"] for e in batch}
+    cached = timer.run("cache", resume_cache_repo.find_cached_parses, hashes, resume_parser_service.PROMPT_VERSION)
+    parsed = {h: (doc.get("rawText") or "", doc["parsedData"]) for h, doc in cached.items()}
+
+    # 2. Extraction in the process pool (one representative file per unseen hash)
+    todo = {}
+    for e in batch:
+        if e["contentHash"] not in parsed: todo.setdefault(e["contentHash"], e["path"])
+    texts = timer.run("extract", lambda: dict(zip(todo, extract_pool.map(text_extraction_service.extract_resume_text, todo.values()))))
+
+    # 3. LLM parsing with bounded concurrency
+    def _parse(item):
+        content_hash, raw_text = item
+        return content_hash, raw_text, (resume_parser_service.parse_and_cache_text(raw_text, content_hash) if raw_text else None)
+    for content_hash, raw_text, parsed_data in timer.run("parse", lambda: list(llm_pool.map(_parse, texts.items()))):
+        if parsed_data: parsed[content_hash] = (raw_text, parsed_data)
+
+    # 4. Bulk write resumes + profile updates
+    ready = [e for e in batch if e["contentHash"] in parsed]
+    for e in batch:
+        if e["contentHash"] not in parsed: print(f"  ❌ Could not parse {e['path']}")
+    if not ready: return []
+
+    def _write():
+        first_id = resume_repo.reserve_resume_ids(len(ready))
+        resume_docs, user_updates = [], []
+        for offset, e in enumerate(ready):
+            raw_text, parsed_data = parsed[e["contentHash"]]
+            original = os.path.basename(e["path"])
+            filename = f"library_user_{e['userId']}_{e['contentHash'][:12]}_{original}"
+            if copy_files: shutil.copyfile(e["path"], os.path.join(RESUME_FOLDER, filename))
+            resume_docs.append(resume_parser_service.build_resume_doc(
+                first_id + offset, e["userId"], original, f"/resumes/{filename}", raw_text, parsed_data, e["contentHash"]
+            ))
+            set_fields, skills = resume_parser_service.build_user_update(parsed_data)
+            user_updates.append((e["userId"], set_fields, skills))
+        resume_repo.upsert_resumes(resume_docs)
+        user_repo.bulk_update_users(user_updates)
+        skill_service.record_many(skill_service.USER, [(user_id, skills) for user_id, _, skills in user_updates])
+    timer.run("write", _write)
+
+    def _index():
+        for user_id in {e["userId"] for e in ready}: embedding_service.index_candidate(user_id)
+        # Persist before the checkpoint line: the debounced save timer does not outlive the script.
+        embedding_service.get_candidate_index().save()
+    timer.run("index", _index)
+    return ready
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="Directory of CVs or a .csv/.jsonl manifest")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="Extraction processes")
+    parser.add_argument("--llm-concurrency", type=int, default=4, help="Concurrent LLM requests")
+    parser.add_argument("--batch-size", type=int, default=50, help="Documents per bulk write / checkpoint")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file (default: <source>.ingest.ckpt)")
+    parser.add_argument("--no-copy", action="store_true", help="Do not copy files into the resumes folder")
+    args = parser.parse_args()
+
+    from src.backend.db import ensure_resume_content_index
+    from src.backend.repository.user_repo import find_users_by_ids
+    from src.backend.services.resume_parser_service import hash_file
+
+    checkpoint_path = args.checkpoint or os.path.abspath(args.source).rstrip(os.sep) + ".ingest.ckpt"
+    os.makedirs(RESUME_FOLDER, exist_ok=True)
+    timer = StageTimer()
+    started = time.perf_counter()
+
+    print("=" * 60)
+    print("📥 BULK RESUME INGEST")
+    print("=" * 60)
+    ensure_resume_content_index()  # Backs the (userId, contentHash) upserts
+
+    entries = timer.run("discover", discover_directory if os.path.isdir(args.source) else discover_manifest, args.source)
+    print(f"Discovered {len(entries)} files.")
+
+    # Hash + dedupe (same content for the same user is only ingested once)
+    with ThreadPoolExecutor(max_workers=8) as io_pool:
+        digests = timer.run("hash", lambda: list(io_pool.map(hash_file, [e["path"] for e in entries])))
+    done = load_checkpoint(checkpoint_path)
+    seen, pending = set(done), []
+    for e, digest in zip(entries, digests):
+        e["contentHash"] = digest
+        key = (e["userId"], digest)
+        if key in seen: continue
+        seen.add(key)
+        pending.append(e)
+    skipped = len(entries) - len(pending)
+
+    # Resumes are only attached to existing users; unknown owners are reported, not parsed.
+    known = {u["UserID"] for u in find_users_by_ids({e["userId"] for e in pending}, {"_id": 0, "UserID": 1})}
+    for e in pending:
+        if e["userId"] not in known: print(f"  ⚠️ Skipping {e['path']}: no user with UserID {e['userId']}.")
+    orphans = sum(1 for e in pending if e["userId"] not in known)
+    pending = [e for e in pending if e["userId"] in known]
+    print(f"{len(pending)} to ingest, {skipped} skipped (duplicates or already checkpointed), {orphans} without a user.")
+
+    written = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as extract_pool, \
+         ThreadPoolExecutor(max_workers=args.llm_concurrency) as llm_pool, \
+         open(checkpoint_path, "a", encoding="utf-8") as ckpt:
+        for batch in chunked(pending, args.batch_size):
+            ok = ingest_batch(batch, extract_pool, llm_pool, timer, not args.no_copy)
+            append_checkpoint(ckpt, ok)
+            written += len(ok)
+            elapsed = time.perf_counter() - started
+            print(f"  ✅ {written}/{len(pending)} written  ({written / elapsed:.2f} docs/s)")
+
+    elapsed = time.perf_counter() - started
+    print("\n" + "-" * 60)
+    print(f"Ingested {written} resumes in {elapsed:.1f}s ({(written / elapsed) if elapsed else 0:.2f} docs/s)")
+    for stage in ("discover", "hash", "cache", "extract", "parse", "write", "index"):
+        print(f"  {stage:<9} {timer.totals.get(stage, 0.0):8.2f}s")
+    print(f"Checkpoint: {checkpoint_path}")
+
+if __name__ == "__main__":
+    main()
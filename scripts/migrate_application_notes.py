@@ -0,0 +1,71 @@
+"""
+Converts legacy application notes (one growing string) into the
+append-only array of {author, authorId, role, createdAt, text} entries.
+
+Manager notes written as '--- Recruiter Note (YYYY-MM-DD): ...' become
+their own dated entries; any other text has no recoverable boundaries
+and is kept as a single entry stamped with the submission time. Both
+`applications` and `applications_archive` are converted. Each
+update is conditional on the old string, so the script is idempotent and
+can run while the API is live (appends also convert lazily).
+
+Usage:
+    python scripts/migrate_application_notes.py [--batch-size 500] [--dry-run]
+"""
+import os
+import sys
+import argparse
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pymongo import UpdateOne
+from src.backend.db import applications_collection, applications_archive_collection, parse_datetime
+from src.backend.repository.application_repo import parse_legacy_notes, LEGACY_NOTES_FILTER
+
+def migrate(collection, batch_size: int, dry_run: bool):
+    """Converts one collection in _id order. Returns (scanned, converted, entries)."""
+    legacy = LEGACY_NOTES_FILTER
+    scanned = converted = entries = 0
+    last_id = None
+    while True:
+        q = legacy if last_id is None else {"$and": [legacy, {"_id": {"$gt": last_id}}]}
+        batch = list(collection.find(q, {"notes": 1, "submittedAt": 1}).sort("_id", 1).limit(batch_size))
+        if not batch: break
+        last_id = batch[-1]["_id"]
+
+        ops = []
+        for doc in batch:
+            scanned += 1
+            old = doc.get("notes")
+            new = old if isinstance(old, list) else parse_legacy_notes(old, parse_datetime(doc.get("submittedAt")))
+            entries += len(new) if not isinstance(old, list) else 0
+            # Matching the old value keeps a concurrent append from being overwritten.
+            match = {"_id": doc["_id"], "notes": old} if "notes" in doc else {"_id": doc["_id"], "notes": {"$exists": False}}
+            ops.append(UpdateOne(match, {"$set": {"notes": new, "noteCount": len(new)}}))
+
+        if dry_run:
+            converted += len(ops)
+        elif ops:
+            converted += collection.bulk_write(ops, ordered=False).modified_count
+        print(f"   ... {scanned} scanned in {collection.name}")
+    return scanned, converted, entries
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing.")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"📝 MIGRATE APPLICATION NOTES{' (DRY RUN)' if args.dry_run else ''}")
+    print("=" * 60)
+
+    verb = "Would convert" if args.dry_run else "Converted"
+    for collection in (applications_collection(), applications_archive_collection()):
+        _, converted, entries = migrate(collection, args.batch_size, args.dry_run)
+        print(f"✅ {verb} {converted} {collection.name} ({entries} note entries from legacy strings).")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
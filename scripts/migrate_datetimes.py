@@ -0,0 +1,95 @@
+"""
+Converts time fields stored as ISO strings into native BSON datetimes and
+creates the compound range indexes that use them.
+
+    interviews.startTime / endTime
+    applications.submittedAt
+    jobs.postedAt
+    users.createdAt
+
+Only string values are touched (matched with $type), and each update is
+conditional on the old string, so the script is idempotent and safe to
+run while the API is serving writes. Documents are paged by _id and
+written with one unordered bulk_write per batch. Values that do not parse
+are left as they are and reported.
+
+Usage:
+    python scripts/migrate_datetimes.py [--batch-size 1000] [--dry-run]
+"""
+import os
+import sys
+import argparse
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pymongo import UpdateOne
+from src.backend.db import (
+    interviews_collection, applications_collection, jobs_collection, users_collection,
+    ensure_datetime_indexes, parse_datetime,
+)
+
+FIELDS = [
+    ("interviews", interviews_collection, ["startTime", "endTime"]),
+    ("applications", applications_collection, ["submittedAt"]),
+    ("jobs", jobs_collection, ["postedAt"]),
+    ("users", users_collection, ["createdAt"]),
+]
+
+def migrate_collection(collection, fields: list, batch_size: int, dry_run: bool) -> dict:
+    stats = {"scanned": 0, "converted": 0, "unparseable": 0}
+    query = {"$or": [{f: {"$type": "string"}} for f in fields]}
+    projection = {f: 1 for f in fields}
+    last_id = None
+
+    while True:
+        page_query = query if last_id is None else {"$and": [query, {"_id": {"$gt": last_id}}]}
+        batch = list(collection.find(page_query, projection).sort("_id", 1).limit(batch_size))
+        if not batch: break
+        last_id = batch[-1]["_id"]
+
+        ops = []
+        for doc in batch:
+            stats["scanned"] += 1
+            for field in fields:
+                value = doc.get(field)
+                if not isinstance(value, str): continue
+                try:
+                    converted = parse_datetime(value)
+                except ValueError:
+                    stats["unparseable"] += 1
+                    print(f"   ⚠️  _id={doc['_id']} {field}={value!r} is not ISO 8601; left as is.")
+                    continue
+                # Conditional on the old value so a concurrent write is never overwritten.
+                ops.append(UpdateOne({"_id": doc["_id"], field: value}, {"$set": {field: converted}}))
+
+        if ops and not dry_run:
+            stats["converted"] += collection.bulk_write(ops, ordered=False).modified_count
+        elif dry_run:
+            stats["converted"] += len(ops)
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing.")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"🕒 MIGRATE ISO STRINGS TO BSON DATETIMES{' (DRY RUN)' if args.dry_run else ''}")
+    print("=" * 60)
+
+    for name, collection_fn, fields in FIELDS:
+        stats = migrate_collection(collection_fn(), fields, args.batch_size, args.dry_run)
+        verb = "would convert" if args.dry_run else "converted"
+        print(f"✅ {name}: scanned {stats['scanned']}, {verb} {stats['converted']} values, "
+              f"{stats['unparseable']} unparseable ({', '.join(fields)})")
+
+    if not args.dry_run:
+        ensure_datetime_indexes()
+        print("✅ Range indexes ensured.")
+
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
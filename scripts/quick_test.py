@@ -64,7 +64,8 @@ mutation {
   ) {
     appId
     userName
-    notes
+    noteCount
+    notes { items { text } }
   }
 }
 """
@@ -82,7 +83,7 @@ if "data" in result2 and result2["data"]["addManagerNoteToApplication"]:
     print(f"✅ SUCCESS!")
     print(f"   App ID: {app['appId']}")
     print(f"   User: {app['userName']}")
-    print(f"   Notes: ...{app['notes'][-50:]}")  # Last 50 chars
+    print(f"   Notes: {app['noteCount']} (first: {app['notes']['items'][0]['text'][:50] if app['notes']['items'] else '-'})")
 else:
     print(f"❌ FAILED: {result2}")
 
@@ -0,0 +1,73 @@
+"""
+Canonicalises stored skills and rebuilds the skill posting lists.
+
+1. Rewrites users.skills and jobs.skillsRequired to canonical display
+   names ("python3" -> "Python"), de-duplicating aliases.
+2. Rebuilds skill_postings (one id list per skill per kind, bucketed by
+   id range) from the canonical data and marks each kind as built, which
+   switches the users(skills:, skillsAny:) filters over to posting-list
+   intersection. Lists in an older layout are replaced; until this has
+   run, the filters keep using a collection scan.
+
+Safe to re-run. Writes that land while the rebuild is running are picked
+up by the next run.
+
+Usage:
+    python scripts/rebuild_skill_postings.py
+    python scripts/rebuild_skill_postings.py --dry-run
+"""
+import os
+import sys
+import time
+import argparse
+from collections import defaultdict
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pymongo import UpdateOne
+from src.backend.db import users_collection, jobs_collection
+from src.backend.repository import skill_repo
+from src.backend.services import skill_service
+
+BATCH_SIZE = 1000
+
+def rebuild(kind, collection, id_field, skills_field, dry_run):
+    postings = defaultdict(list)
+    ops, scanned, rewritten = [], 0, 0
+    cursor = collection.find({}, {"_id": 0, id_field: 1, skills_field: 1}).sort(id_field, 1).batch_size(BATCH_SIZE)
+    for doc in cursor:
+        scanned += 1
+        item_id = doc.get(id_field)
+        if item_id is None: continue
+        original = doc.get(skills_field) or []
+        canonical = skill_service.canonicalize_skills(original)
+        if canonical != original:
+            rewritten += 1
+            ops.append(UpdateOne({id_field: item_id}, {"$set": {skills_field: canonical}}))
+        for sid in {skill_service.skill_id(s) for s in canonical}:
+            postings[sid].append(int(item_id))
+        if len(ops) >= BATCH_SIZE:
+            if not dry_run: collection.bulk_write(ops, ordered=False)
+            ops = []
+    if ops and not dry_run: collection.bulk_write(ops, ordered=False)
+
+    if not dry_run:
+        skill_repo.replace_all_postings(kind, postings)
+    print(f"  ✅ {kind}: scanned {scanned}, canonicalised {rewritten}, {len(postings)} posting lists")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🏷️  REBUILD SKILL POSTINGS" + (" (dry run)" if args.dry_run else ""))
+    print("=" * 60)
+    start = time.perf_counter()
+    rebuild(skill_service.USER, users_collection(), "UserID", "skills", args.dry_run)
+    rebuild(skill_service.JOB, jobs_collection(), "jobId", "skillsRequired", args.dry_run)
+    print(f"Done in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
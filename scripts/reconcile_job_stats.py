@@ -0,0 +1,119 @@
+"""
+Rebuilds the per-job application counters in `job_stats` from scratch.
+
+One aggregation over `jobs` counts each job's applications per status
+(jobId-indexed $lookup), takes the latest application event as the last
+activity, and $merges the result into job_stats on jobId. A second one
+does the same for `jobs_archive` against `applications_archive`
+(applications are only ever archived with their job). Jobs with no
+applications get zeroed stats; stats of deleted jobs are removed.
+
+Use it once after deploying job_stats (older jobs, and jobs whose stats
+were only upserted as `partial` deltas, are counted on read until then)
+and whenever the counters are suspected to have drifted.
+Counter updates that land while the aggregation runs can be overwritten,
+so prefer a quiet moment; running it again is always safe.
+
+Usage:
+    python scripts/reconcile_job_stats.py [--dry-run]
+"""
+import os
+import sys
+import argparse
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.db import (
+    jobs_collection, jobs_archive_collection, applications_collection, applications_archive_collection,
+    job_stats_collection, ensure_job_stats_index,
+)
+
+def sources() -> list:
+    """(jobs collection, the collection holding its applications) pairs."""
+    return [(jobs_collection(), applications_collection()), (jobs_archive_collection(), applications_archive_collection())]
+
+def stats_pipeline(applications: str = "applications") -> list:
+    return [
+        {"$project": {"_id": 0, "jobId": 1}},
+        {"$lookup": {
+            "from": applications,
+            "let": {"jobId": "$jobId"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$jobId", "$$jobId"]}}},
+                {"$group": {"_id": {"$ifNull": ["$status", "Applied"]}, "count": {"$sum": 1}, "last": {"$max": "$submittedAt"}}},
+            ],
+            "as": "counts",
+        }},
+        {"$lookup": {
+            "from": "application_events",
+            "let": {"jobId": "$jobId"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$meta.jobId", "$$jobId"]}}},
+                {"$sort": {"ts": -1}},
+                {"$limit": 1},
+                {"$project": {"_id": 0, "ts": 1}},
+            ],
+            "as": "latest",
+        }},
+        {"$project": {
+            "jobId": 1,
+            "total": {"$sum": "$counts.count"},
+            # Same field-name rule as job_stats_service.status_key
+            "byStatus": {"$arrayToObject": {"$map": {
+                "input": "$counts", "as": "c",
+                "in": {"k": {"$replaceAll": {"input": {"$toString": "$$c._id"}, "find": ".", "replacement": "_"}}, "v": "$$c.count"},
+            }}},
+            "lastActivityAt": {"$max": [{"$max": "$counts.last"}, {"$first": "$latest.ts"}]},
+        }},
+    ]
+
+def report_drift() -> int:
+    current = {d["jobId"]: d for d in job_stats_collection().find({}, {"_id": 0})}
+    drifted = 0
+    for jobs, applications in sources():
+        for row in jobs.aggregate(stats_pipeline(applications.name)):
+            old = current.get(row["jobId"])
+            old_counts = {k: v for k, v in ((old or {}).get("byStatus") or {}).items() if v}
+            if old is None or old.get("partial") or old.get("total") != row["total"] or old_counts != row["byStatus"]:
+                drifted += 1
+                print(f"   ✏️  job {row['jobId']}: {old and old.get('total')} -> {row['total']} {row['byStatus']}")
+    return drifted
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Show which jobs would change without writing.")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"🧮 RECONCILE JOB STATS{' (DRY RUN)' if args.dry_run else ''}")
+    print("=" * 60)
+    ensure_job_stats_index()
+
+    if args.dry_run:
+        print(f"✅ {report_drift()} jobs would change.")
+        print("=" * 60)
+        return
+
+    known = set()
+    for jobs, applications in sources():
+        jobs.aggregate(stats_pipeline(applications.name) + [{"$merge": {
+            "into": "job_stats",
+            "on": "jobId",
+            # lastActivityAt only moves forward; counts are replaced.
+            "whenMatched": [{"$set": {
+                "total": "$$new.total",
+                "byStatus": "$$new.byStatus",
+                "lastActivityAt": {"$max": ["$lastActivityAt", "$$new.lastActivityAt"]},
+                "partial": "$$REMOVE",
+            }}],
+            "whenNotMatched": "insert",
+        }}])
+        known.update(jobs.distinct("jobId"))
+    # Archived jobs keep their stats (Job.stats with includeArchived).
+    removed = job_stats_collection().delete_many({"jobId": {"$nin": list(known)}}).deleted_count
+    print(f"✅ Stats rebuilt for {job_stats_collection().count_documents({})} jobs; {removed} orphaned removed.")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
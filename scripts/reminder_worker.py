@@ -0,0 +1,67 @@
+"""
+Sends interview reminders from the `reminders` due-time queue.
+
+Each tick leases the earliest due batch (see reminder_service), emails
+the participants and settles the batch; the loop keeps draining while
+full batches come back and sleeps otherwise. Several workers can run
+side by side, because each reminder is leased to one worker at a time.
+
+--backfill enqueues reminders for future interviews booked before the
+queue existed (safe to repeat: reminders are unique per interview,
+recipient and lead time).
+
+Usage:
+    python scripts/reminder_worker.py [--interval 30] [--batch-size 100] [--once] [--backfill]
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.db import interviews_collection, ensure_reminder_indexes
+from src.backend.services import reminder_service
+
+def backfill(batch_size: int) -> int:
+    now = datetime.utcnow()
+    enqueued, batch = 0, []
+    for interview in interviews_collection().find({"startTime": {"$gt": now}}, {"_id": 0}):
+        batch.append(interview)
+        if len(batch) >= batch_size:
+            enqueued += reminder_service.schedule_interview_reminders(batch)
+            batch = []
+    return enqueued + reminder_service.schedule_interview_reminders(batch)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=float, default=30, help="Seconds to sleep when the queue is drained.")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--once", action="store_true", help="Run a single tick and exit.")
+    parser.add_argument("--backfill", action="store_true", help="Enqueue reminders for existing future interviews first.")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"⏰ INTERVIEW REMINDER WORKER (leads: {reminder_service.REMINDER_LEAD_MINUTES} min)")
+    print("=" * 60)
+    ensure_reminder_indexes()
+
+    if args.backfill:
+        print(f"✅ Backfill enqueued {backfill(args.batch_size)} reminders.")
+
+    try:
+        while True:
+            stats = reminder_service.process_due(args.batch_size)
+            if stats["claimed"]:
+                print(f"📨 {datetime.utcnow():%H:%M:%S} claimed {stats['claimed']}: sent {stats['sent']}, "
+                      f"skipped {stats['skipped']}, retried {stats['retried']}, failed {stats['failed']}")
+            if args.once: break
+            # A full batch means more are probably due: go again without sleeping.
+            if stats["claimed"] < args.batch_size: time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\n🛑 Worker stopped.")
+
+if __name__ == "__main__":
+    main()
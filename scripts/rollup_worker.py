@@ -0,0 +1,52 @@
+"""
+Keeps the daily hiring rollups behind hiringMetrics up to date.
+
+Each tick aggregates application events newer than the rollup watermark
+into the `rollups` collection (see rollup_service) and advances the
+watermark. Ticks are idempotent, so a crashed or overlapping run is
+harmless; --rebuild drops all buckets and aggregates every event again
+(e.g. after changing the funnel definition).
+
+Usage:
+    python scripts/rollup_worker.py [--interval 300] [--once] [--rebuild]
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+
+# --- Setup Project Path ---
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backend.db import ensure_application_events_collection, ensure_rollup_indexes
+from src.backend.services import rollup_service
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=float, default=300, help="Seconds between runs.")
+    parser.add_argument("--once", action="store_true", help="Run a single tick and exit.")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute all rollups from scratch first.")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"📈 HIRING ROLLUP WORKER (safety lag: {rollup_service.ROLLUP_SAFETY_LAG_SECONDS}s)")
+    print("=" * 60)
+    ensure_application_events_collection()
+    ensure_rollup_indexes()
+
+    try:
+        run = rollup_service.rebuild if args.rebuild else rollup_service.run
+        while True:
+            window = run()
+            if window["end"]:
+                print(f"📊 {datetime.utcnow():%H:%M:%S} aggregated events from {window['start']:%Y-%m-%d %H:%M} "
+                      f"to {window['end']:%Y-%m-%d %H:%M:%S}")
+            if args.once: break
+            run = rollup_service.run
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\n🛑 Worker stopped.")
+
+if __name__ == "__main__":
+    main()
@@ -68,7 +68,7 @@ def seed_database():
             "firstName": r["first"],
             "lastName": r["last"],
             "role": UserProfileType.RECRUITER.value,
-            "createdAt": datetime.utcnow().isoformat()
+            "createdAt": datetime.utcnow()
         })
 
     # --- MANAGERS ---
@@ -89,7 +89,7 @@ def seed_database():
             "lastName": m["last"],
             "role": UserProfileType.MANAGER.value,
             "professionalTitle": m["title"],
-            "createdAt": datetime.utcnow().isoformat()
+            "createdAt": datetime.utcnow()
         })
 
     # --- APPLICANTS ---
@@ -115,7 +115,7 @@ def seed_database():
             "city": "San Francisco",
             "country": "USA",
             "skills": ["Python", "React", "SQL"],
-            "createdAt": datetime.utcnow().isoformat()
+            "createdAt": datetime.utcnow()
         })
 
     db.users.insert_many(users)
@@ -162,7 +162,7 @@ def seed_database():
         "posterName": "Alice Recruiter",
         "description": "Expert Python developer needed.",
         "skillsRequired": ["Python", "Django", "FastAPI"],
-        "postedAt": datetime.utcnow().strftime('%Y-%m-%d')
+        "postedAt": datetime.utcnow()
     })
 
     # Job 2: Linked to Manager Mike, Posted by Recruiter Bob
@@ -180,7 +180,7 @@ def seed_database():
         "posterName": "Bob Talent",
         "description": "React wizard needed.",
         "skillsRequired": ["React", "TypeScript", "Redux"],
-        "postedAt": datetime.utcnow().strftime('%Y-%m-%d')
+        "postedAt": datetime.utcnow()
     })
     
     db.jobs.insert_many(jobs)
@@ -216,11 +216,12 @@ def seed_database():
         "userId": applicant_ids[0],
         "jobId": jid1,
         "status": "Interviewing", # Pre-set to interviewing
-        "submittedAt": datetime.utcnow().isoformat(),
+        "submittedAt": datetime.utcnow(),
         "userName": "Charlie Dev",
         "jobTitle": "Senior Python Backend",
         "companyName": "TechCorp",
-        "notes": "Strong candidate."
+        "notes": [{"author": None, "authorId": None, "role": "Manager", "createdAt": datetime.utcnow(), "text": "Strong candidate."}],
+        "noteCount": 1
     })
     
     # Diana applies to React Job
@@ -230,7 +231,7 @@ def seed_database():
         "userId": applicant_ids[1],
         "jobId": jid2,
         "status": "Applied",
-        "submittedAt": datetime.utcnow().isoformat(),
+        "submittedAt": datetime.utcnow(),
         "userName": "Diana Junior",
         "jobTitle": "Frontend React Engineer",
         "companyName": "StartUp Inc"
@@ -255,8 +256,9 @@ def seed_database():
         "jobId": jid1,
         "candidateId": applicant_ids[0],
         "recruiterId": manager_ids[0], # Booked against Sarah
-        "startTime": start_time.isoformat(),
-        "endTime": end_time.isoformat()
+        "startTime": start_time,
+        "endTime": end_time,
+        "updatedAt": datetime.utcnow()
     })
     
     db.interviews.insert_many(interviews)
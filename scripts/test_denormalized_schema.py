@@ -192,7 +192,8 @@ def test_manager_notes_with_denormalized_query():
         note: "Excellent interview performance. Strong technical skills."
       ) {
         appId
-        notes
+        noteCount
+        notes(first: 100) { items { role createdAt text } }
         userName
         jobTitle
         candidate {
@@ -212,11 +213,12 @@ def test_manager_notes_with_denormalized_query():
     app_data = result["data"]["addManagerNoteToApplication"]
     
     # Verify notes were added
+    note_items = app_data.get("notes", {}).get("items", [])
     checks = [
         (app_data.get("userName") == "Charlie Brown", "userName matched"),
         (app_data.get("jobTitle") == "Senior Python Developer", "jobTitle matched"),
-        ("Recruiter Note" in app_data.get("notes", ""), "note has timestamp prefix"),
-        ("Excellent interview performance" in app_data.get("notes", ""), "note content saved")
+        (all(n.get("createdAt") for n in note_items), "notes have timestamps"),
+        (any("Excellent interview performance" in n.get("text", "") for n in note_items), "note content saved")
     ]
     
     all_passed = all(check[0] for check in checks)
@@ -226,8 +228,8 @@ def test_manager_notes_with_denormalized_query():
         print(f"  {status} {description}")
     
     print(f"\n  📝 Notes preview:")
-    notes = app_data.get("notes", "")
-    print(f"  {notes[:100]}..." if len(notes) > 100 else f"  {notes}")
+    for n in note_items[-3:]:
+        print(f"  [{n.get('createdAt')}] {n.get('text', '')[:100]}")
     
     if all_passed:
         print(f"\n✅ TEST 3 PASSED: Manager notes work with denormalized fields!")
@@ -29,8 +29,9 @@ def main():
                 "userId": candidate_id,
                 "jobId": job_id,
                 "status": "Applied",
-                "submittedAt": datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
-                "notes": "",
+                "submittedAt": datetime.utcnow(),
+                "notes": [],
+                "noteCount": 0,
                 "userName": f"{applicant.get('firstName')} {applicant.get('lastName')}",
                 "jobTitle": job.get('title'),
                 "companyName": job.get('company')
@@ -119,7 +119,8 @@ def test_manager_notes():
         note: "Excellent technical skills, great cultural fit. Recommend moving to final round."
       ) {
         appId
-        notes
+        noteCount
+        notes { items { role createdAt text } }
         candidate {
           firstName
           lastName
@@ -138,7 +139,10 @@ def test_manager_notes():
     data = result["data"]["addManagerNoteToApplication"]
     print(f"✅ Note added successfully!")
     print(f"   Application ID: {data['appId']}")
-    print(f"   Notes:\n{data['notes']}\n")
+    print(f"   Notes ({data['noteCount']}):")
+    for n in data["notes"]["items"]:
+        print(f"   - [{n['createdAt']}] {n['text']}")
+    print()
     return True
 
 def test_hiring_workflow():
@@ -8,19 +8,22 @@ from flask import send_from_directory
 import bcrypt
 import requests
 from flask_cors import CORS
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response, stream_with_context
 from ariadne import load_schema_from_path, make_executable_schema, graphql_sync
 from ariadne.explorer import ExplorerGraphiQL
 from dotenv import load_dotenv
 from werkzeug.exceptions import HTTPException
-from datetime import datetime
+from datetime import datetime, timezone
 from werkzeug.utils import secure_filename
+from werkzeug.http import http_date
 
 # Service imports
-from src.backend.services import resume_parser_service
+from src.backend.services import resume_parser_service, calendar_service, export_service, embedding_service
 from src.backend.services.resume_parser_service import process_uploaded_resume # Explicitly imported
 from src.backend.models.user_models import UserProfileType
+from src.backend.models.user import User
 from src.backend.errors import handle_http_exception, handle_value_error, handle_generic_exception, json_error
+from src.backend.json_stream import iter_json
 from src.backend.services.nl2gql_service import process_nl2gql_request
 
 # Repository imports
@@ -33,6 +36,18 @@ from src.backend.db import (
     ensure_application_counter, 
     ensure_interview_counter, 
     ensure_resume_counter, 
+    ensure_resume_content_index,
+    ensure_resume_parse_cache_index,
+    ensure_interview_slot_index,
+    ensure_datetime_indexes,
+    ensure_calendar_indexes,
+    ensure_reminder_indexes,
+    ensure_application_events_collection,
+    ensure_job_stats_index,
+    ensure_rollup_indexes,
+    ensure_archive_indexes,
+    ensure_skill_postings_index,
+    jobs_collection,
     next_user_id
 )
 
@@ -41,6 +56,8 @@ from src.backend.resolvers.user_resolvers import query as user_query, mutation a
 from src.backend.resolvers.job_resolvers import query as job_query, mutation as job_mutation
 from src.backend.resolvers.application_resolvers import query as app_query, mutation as app_mutation, application as application_object, job
 from src.backend.resolvers.scheduling_resolvers import query as scheduling_query, mutation as scheduling_mutation, interview as interview_object
+from src.backend.resolvers.matching_resolvers import query as matching_query
+from src.backend.resolvers.metrics_resolvers import query as metrics_query
 
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(__file__), '../.env'))
@@ -61,7 +78,7 @@ schema_path = os.path.join(os.path.dirname(__file__), "schema.graphql")
 type_defs = load_schema_from_path(schema_path)
 schema = make_executable_schema(
     type_defs,
-    [user_query, job_query, app_query, scheduling_query],
+    [user_query, job_query, app_query, scheduling_query, matching_query, metrics_query],
     [user_mutation, job_mutation, app_mutation, scheduling_mutation],
     application_object,
     job,
@@ -75,6 +92,17 @@ ensure_job_counter()
 ensure_application_counter()
 ensure_interview_counter()
 ensure_resume_counter()
+ensure_resume_content_index()
+ensure_resume_parse_cache_index()
+ensure_interview_slot_index()
+ensure_datetime_indexes()
+ensure_calendar_indexes()
+ensure_reminder_indexes()
+ensure_application_events_collection()
+ensure_job_stats_index()
+ensure_rollup_indexes()
+ensure_archive_indexes()
+ensure_skill_postings_index()
 
 # --- Error Handlers ---
 @app.errorhandler(HTTPException)
@@ -124,9 +152,80 @@ def graphql_server():
             pass
             
     success, result = graphql_sync(schema, data, context_value=context, debug=app.debug)
-    return jsonify(result), (200 if success else 400)
+    # Streamed: large list results are encoded chunk by chunk instead of as one string.
+    return Response(iter_json(result), status=(200 if success else 400), mimetype="application/json")
 
 # --- NL2GQL Endpoint ---
+# --- Calendar feed ---
+@app.route("/calendar/<int:user_id>.ics", methods=["GET"])
+def calendar_feed(user_id):
+    # Calendar apps cannot send X-User-* headers, so subscription URLs carry a signed token instead.
+    header_user = request.headers.get("X-User-ID")
+    if header_user != str(user_id) and not calendar_service.verify_feed_token(user_id, request.args.get("token")):
+        return jsonify({"error": "Access denied: invalid calendar token."}), 403
+
+    since_token = request.args.get("since")
+    since = calendar_service.from_sync_token(since_token) if since_token else None
+
+    # One indexed max lookup decides whether anything changed.
+    latest = calendar_service.last_updated(user_id)
+    etag = calendar_service.etag_for(user_id, latest, since_token)
+    headers = {
+        "ETag": etag,
+        "X-Sync-Token": calendar_service.to_sync_token(latest),
+        "Cache-Control": "private, no-cache",
+    }
+    if latest: headers["Last-Modified"] = http_date(latest.replace(tzinfo=timezone.utc))
+
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(etag.strip('"'))
+    elif request.if_modified_since and latest:
+        ims = request.if_modified_since
+        if ims.tzinfo is None: ims = ims.replace(tzinfo=timezone.utc)
+        not_modified = latest.replace(microsecond=0, tzinfo=timezone.utc) <= ims
+    else:
+        not_modified = since is not None and not calendar_service.changed_since(latest, since)
+    if not_modified: return "", 304, headers
+
+    body, _ = calendar_service.build_feed(user_id, since)
+    headers["Content-Type"] = "text/calendar; charset=utf-8"
+    return body, 200, headers
+
+# --- Streaming export ---
+@app.route("/export/applications", methods=["GET"])
+def export_applications():
+    user_role = request.headers.get("X-User-Role", "Applicant")
+    if user_role not in ["Recruiter", "Manager"]:
+        return jsonify({"error": "Access denied: Only Recruiters or Managers can export applications."}), 403
+
+    fmt = request.args.get("format", "ndjson").lower()
+    if fmt not in export_service.FORMATS:
+        raise ValueError("format must be 'ndjson' or 'csv'.")
+    q = {}
+    if request.args.get("jobId"):
+        try:
+            q["jobId"] = int(request.args["jobId"])
+        except ValueError:
+            raise ValueError("jobId must be an integer.")
+    if request.args.get("status"): q["status"] = request.args["status"]
+
+    if user_role == "Manager":
+        # Managers export applications for the jobs they manage only
+        try:
+            managed = jobs_collection().distinct("jobId", {"hiringManagerId": int(request.headers.get("X-User-ID", ""))})
+        except ValueError:
+            return jsonify({"error": "Access denied: X-User-ID is required."}), 403
+        if "jobId" in q and q["jobId"] not in managed:
+            return jsonify({"error": "Access denied: You do not manage this job."}), 403
+        q.setdefault("jobId", {"$in": managed})
+
+    filename = f"applications{'-job' + str(q['jobId']) if isinstance(q.get('jobId'), int) else ''}.{fmt}"
+    return Response(
+        stream_with_context(export_service.stream(q, fmt)),
+        mimetype=export_service.FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "Cache-Control": "no-store"},
+    )
+
 @app.route("/nl2gql", methods=["POST"])
 def nl2gql():
     data = request.get_json(silent=True) or {}
@@ -154,11 +253,12 @@ def register_user():
         "UserID": next_user_id(), "email": email.lower(), "password": bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()),
         "firstName": first_name, "lastName": last_name, "role": role, "phone_number": None, "city": None,
         "state_province": None, "country": None, "linkedin_profile": None, "portfolio_url": None,
-        "highest_qualification": None, "years_of_experience": None, "createdAt": datetime.utcnow().isoformat(),
+        "highest_qualification": None, "years_of_experience": None, "createdAt": datetime.utcnow(),
         "dob": None, "skills": [], "professionalTitle": None, "is_us_citizen": None, "highest_degree_year": None
     }
     try:
         user_repo.insert_user(new_user_doc)
+        embedding_service.index_candidate(new_user_doc["UserID"])
         return jsonify({"message": "User registered successfully!", "UserID": new_user_doc["UserID"]}), 201
     except Exception as e:
         return jsonify({"error": f"An internal error occurred: {e}"}), 500
@@ -172,7 +272,7 @@ def login_user():
     user = user_repo.find_user_by_email(email)
     if not user: return jsonify({"error": "Invalid email or password"}), 401
     if bcrypt.checkpw(password.encode('utf-8'), user.get("password")):
-        user_data = user_repo.to_user_output(user)
+        user_data = User.from_bson(user).to_dict()
         return jsonify({"message": "Login successful!", "user": user_data}), 200
     else:
         return jsonify({"error": "Invalid email or password"}), 401
@@ -191,11 +291,11 @@ def upload_resume(appId):
         user_id = application.get("userId")
         filename = f"user_{user_id}_app_{appId}_{secure_filename(file.filename)}"
         file_path = os.path.join(RESUME_FOLDER, filename)
-        file.save(file_path)
+        content_hash = resume_parser_service.save_upload(file, file_path)
         resume_url = f"/resumes/{filename}"
         application_repo.update_one_application({"appId": appId}, {"resume_url": resume_url})
         try:
-            resume_parser_service.parse_resume_and_update_user(file_path, user_id)
+            resume_parser_service.parse_resume_and_update_user(file_path, user_id, content_hash)
         except Exception as e:
             print(f"Error parsing: {e}")
         return jsonify({"message": "Resume uploaded successfully!", "resume_url": resume_url}), 200
@@ -212,14 +312,14 @@ def upload_profile_resume(user_id):
         if not user: return jsonify({"error": "User not found"}), 404
         filename = f"user_{user_id}_profile_{secure_filename(file.filename)}"
         file_path = os.path.join(RESUME_FOLDER, filename)
-        file.save(file_path)
+        content_hash = resume_parser_service.save_upload(file, file_path)
         
         url = f"/resumes/{filename}"
         
         try:
             # --- CHANGE: Use the new robust service function ---
             # This ensures experience calculation AND saving to the resumes collection
-            resume_parser_service.process_uploaded_resume(file_path, user_id, file.filename, url)
+            resume_parser_service.process_uploaded_resume(file_path, user_id, file.filename, url, content_hash)
         except Exception as e:
             print(f"Error triggering profile resume parsing: {e}")
         return jsonify({"message": "Resume uploaded and parsing initiated."}), 200
@@ -237,12 +337,12 @@ def upload_resume_to_library(user_id):
     
     filename = f"library_user_{user_id}_{secure_filename(file.filename)}"
     file_path = os.path.join(RESUME_FOLDER, filename)
-    file.save(file_path)
+    content_hash = resume_parser_service.save_upload(file, file_path)
     url = f"/resumes/{filename}"
     
     try:
         # Calls the NEW processing function
-        process_uploaded_resume(file_path, user_id, file.filename, url)
+        process_uploaded_resume(file_path, user_id, file.filename, url, content_hash)
     except Exception as e:
         print(f"Error processing library resume: {e}")
         return jsonify({"error": "Failed to process resume"}), 500
@@ -1,8 +1,10 @@
 # src/backend/db.py
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
 from dotenv import load_dotenv
 from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import CollectionInvalid
 
 load_dotenv(os.path.join(os.path.dirname(__file__), '../../config/.env'))
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
@@ -12,6 +14,20 @@ _db = _client[DB_NAME]
 def get_db():
     return _db
 
+def get_client():
+    return _client
+
+def iter_batches(cursor, batch_size: int = 1000) -> Iterator[List[dict]]:
+    """Drains a cursor batch_size documents at a time (one server round trip per batch)."""
+    cursor = cursor.batch_size(batch_size)
+    batch = []
+    for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch: yield batch
+
 # --- Collection Helpers ---
 def users_collection():
     return _db["users"]
@@ -35,6 +51,123 @@ def interviews_collection():
 def resumes_collection():
     return _db["resumes"]
 
+def ensure_resume_content_index():
+    # Not unique: the upload endpoint has always allowed re-uploading the same file.
+    resumes_collection().create_index([("userId", 1), ("contentHash", 1)])
+
+# --- NEW: Interview reminders (due-time queue, see reminder_service) ---
+def reminders_collection():
+    return _db["reminders"]
+
+# --- NEW: Application status history (time-series, see event_log_service) ---
+def application_events_collection():
+    return _db["application_events"]
+
+# --- NEW: Per-job application counters (see job_stats_service) ---
+def job_stats_collection():
+    return _db["job_stats"]
+
+def ensure_job_stats_index():
+    # One stats document per job; also the merge key of scripts/reconcile_job_stats.py.
+    job_stats_collection().create_index("jobId", unique=True)
+
+# --- NEW: Daily hiring rollups (see rollup_service) ---
+def rollups_collection():
+    return _db["rollups"]
+
+def rollup_state_collection():
+    return _db["rollup_state"]
+
+def ensure_rollup_indexes():
+    # hiringMetrics reads one dimension over a day range; runs scan events by time.
+    rollups_collection().create_index([("dim", 1), ("day", 1)])
+    application_events_collection().create_index("ts")
+
+# --- NEW: Cold storage for closed jobs and finished applications (see archive_service) ---
+def jobs_archive_collection():
+    return _db["jobs_archive"]
+
+def applications_archive_collection():
+    return _db["applications_archive"]
+
+def ensure_archive_indexes():
+    # Archival scans
+    jobs_collection().create_index([("status", 1), ("closedAt", 1)])
+    # includeArchived lookups; the unique keys also make re-archiving a document a no-op
+    jobs_archive_collection().create_index("jobId", unique=True)
+    applications_archive_collection().create_index("appId", unique=True)
+    applications_archive_collection().create_index("jobId")
+    applications_archive_collection().create_index("userId")
+
+# --- NEW: Resume Parse Cache (keyed by content hash + prompt version) ---
+def resume_parse_cache_collection():
+    return _db["resume_parse_cache"]
+
+def ensure_resume_parse_cache_index():
+    resume_parse_cache_collection().create_index(
+        [("contentHash", 1), ("promptVersion", 1)], unique=True
+    )
+
+# --- NEW: Skill Posting Lists (one doc per kind, skillId and id-range bucket) ---
+def skill_postings_collection():
+    return _db["skill_postings"]
+
+def ensure_skill_postings_index():
+    skill_postings_collection().create_index([("kind", 1), ("skillId", 1), ("bucket", 1)])
+
+# --- NEW: Interview Slot Reservations (one doc per person per booked granule) ---
+def interview_slots_collection():
+    return _db["interview_slots"]
+
+def ensure_interview_slot_index():
+    # The unique index is the booking lock: two overlapping bookings for the same person cannot both insert.
+    interview_slots_collection().create_index([("personId", 1), ("slotStart", 1)], unique=True)
+    interview_slots_collection().create_index("interviewId")
+
+# --- NEW: Datetime Range Indexes ---
+def ensure_datetime_indexes():
+    # Time fields are BSON datetimes (scripts/migrate_datetimes.py); these back the range scans and sorts.
+    interviews_collection().create_index([("hiringManagerId", 1), ("startTime", 1)])
+    interviews_collection().create_index([("recruiterId", 1), ("startTime", 1)])
+    interviews_collection().create_index([("candidateId", 1), ("startTime", 1)])
+    applications_collection().create_index([("jobId", 1), ("submittedAt", -1)])
+    jobs_collection().create_index([("postedAt", -1)])
+    users_collection().create_index([("createdAt", -1)])
+
+# --- NEW: Calendar Feed Indexes (see calendar_service) ---
+def ensure_calendar_indexes():
+    # Calendar version lookups: newest updatedAt per participant, one index per role.
+    for role in ("recruiterId", "hiringManagerId", "candidateId"):
+        interviews_collection().create_index([(role, 1), ("updatedAt", -1)])
+    interviews_collection().create_index("updatedAt")
+    # Interviews booked before updatedAt existed are stamped by scripts/backfill_interview_updated_at.py
+
+# --- NEW: Reminder Queue Indexes ---
+def ensure_reminder_indexes():
+    # Workers only ever range-scan the head of these, so a tick costs the batch size, not the queue size.
+    reminders_collection().create_index([("status", 1), ("dueAt", 1)])
+    reminders_collection().create_index([("status", 1), ("leaseUntil", 1)])
+    reminders_collection().create_index("leaseToken", sparse=True)
+    # One reminder per interview, recipient and lead time: re-enqueueing is a no-op.
+    reminders_collection().create_index([("interviewId", 1), ("recipientId", 1), ("leadMinutes", 1)], unique=True)
+
+# --- NEW: Application Events Collection ---
+def ensure_application_events_collection():
+    # Time-series collections must be created explicitly; servers/backends without
+    # support get a regular collection with the same indexes.
+    if "application_events" not in _db.list_collection_names():
+        try:
+            _db.create_collection(
+                "application_events",
+                timeseries={"timeField": "ts", "metaField": "meta", "granularity": "minutes"},
+            )
+        except CollectionInvalid:
+            pass  # Created concurrently
+        except Exception:
+            _db.create_collection("application_events")
+    application_events_collection().create_index([("meta.appId", 1), ("ts", 1)])
+    application_events_collection().create_index([("meta.jobId", 1), ("ts", 1)])
+
 # --- Counters ---
 def _ensure_counter(counter_id: str):
     counters_collection().update_one(
@@ -52,6 +185,16 @@ def _next_id(counter_id: str):
     )
     return int(result["sequence_value"])
 
+def _reserve_ids(counter_id: str, count: int):
+    """Reserves a contiguous block of ids in one round trip and returns the first one."""
+    result = counters_collection().find_one_and_update(
+        {"_id": counter_id},
+        {"$inc": {"sequence_value": int(count)}},
+        return_document=ReturnDocument.AFTER,
+        upsert=True,
+    )
+    return int(result["sequence_value"]) - int(count) + 1
+
 def ensure_user_counter():
     _ensure_counter("UserID")
 
@@ -76,6 +219,9 @@ def ensure_interview_counter():
 def next_interview_id():
     return _next_id("interviewId")
 
+def reserve_interview_ids(count: int):
+    return _reserve_ids("interviewId", count)
+
 # --- NEW: Resume Counter ---
 def ensure_resume_counter():
     _ensure_counter("resumeId")
@@ -83,46 +229,24 @@ def ensure_resume_counter():
 def next_resume_id():
     return _next_id("resumeId")
 
+def reserve_resume_ids(count: int):
+    return _reserve_ids("resumeId", count)
+
+
+# --- Datetime Fields ---
+# Stored as naive UTC datetimes; the API keeps returning the string formats these fields always had.
+POSTED_AT_FORMAT = "%Y-%m-%d"
+SUBMITTED_AT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+def parse_datetime(value) -> Optional[datetime]:
+    """datetime or ISO string (a trailing 'Z' allowed) -> naive UTC datetime. Empty values give None."""
+    if not value: return None
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+    if value.endswith('Z'): value = value[:-1]
+    return parse_datetime(datetime.fromisoformat(value))
 
-# --- Output Formatting ---
-def to_user_output(doc: dict):
-    if not doc:
-        return None
-    return {
-        "UserID": int(doc.get("UserID")) if doc.get("UserID") is not None else None,
-        "FirstName": doc.get("FirstName"),
-        "LastName": doc.get("LastName"),
-        "DateOfBirth": doc.get("DateOfBirth"),
-        "ProfessionalTitle": doc.get("ProfessionalTitle"),
-        "Summary": doc.get("Summary"),
-    }
-
-def to_job_output(doc: dict):
-    if not doc:
-        return None
-    return {
-        "jobId": int(doc.get("jobId")) if doc.get("jobId") is not None else None,
-        "title": doc.get("title"),
-        "company": doc.get("company"),
-        "location": doc.get("location"),
-        "salaryRange": doc.get("salaryRange"),
-        "skillsRequired": doc.get("skillsRequired"),
-        "description": doc.get("description"),
-        "postedAt": doc.get("postedAt"),
-    }
-
-def to_application_output(doc: dict):
-    if not doc:
-        return None
-    return {
-        "appId": int(doc.get("appId")) if doc.get("appId") is not None else None,
-        "userId": int(doc.get("userId")) if doc.get("userId") is not None else None,
-        "jobId": int(doc.get("jobId")) if doc.get("jobId") is not None else None,
-        "status": doc.get("status"),
-        "submittedAt": doc.get("submittedAt"),
-        "notes": doc.get("notes"),
-        "userName": doc.get("userName"),
-        "jobTitle": doc.get("jobTitle"),
-        "companyName": doc.get("companyName"),
-        "emailSent": doc.get("emailSent"),
-    }
\ No newline at end of file
+def to_iso_string(value, fmt: Optional[str] = None) -> Optional[str]:
+    """Formats a stored datetime for output; strings (not yet migrated) pass through unchanged."""
+    if not isinstance(value, datetime): return value
+    return value.strftime(fmt) if fmt else value.isoformat()
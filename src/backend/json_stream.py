@@ -0,0 +1,48 @@
+# src/backend/json_stream.py
+"""
+Incremental JSON encoding for large GraphQL responses.
+
+jsonify builds the whole body as one string next to the result it came
+from. iter_json yields the body in pieces instead: objects are walked key
+by key and lists are encoded JSON_CHUNK_ITEMS items per call, each item
+being released from the result once it is written. Peak memory is the
+(shrinking) result plus one chunk. orjson is used when it is installed;
+the standard library encoder is the fallback.
+"""
+import os
+import json
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
+JSON_CHUNK_ITEMS = int(os.getenv("JSON_CHUNK_ITEMS", 500))
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def iter_json(value: Any, depth: int = 3, chunk_items: int = JSON_CHUNK_ITEMS) -> Iterator[bytes]:
+    """
+    Yields `value` as UTF-8 JSON. Containers within `depth` levels of the top (the response,
+    data, root fields) are streamed and emptied as they go; anything deeper is encoded whole.
+    """
+    if depth > 0 and isinstance(value, dict):
+        yield b"{"
+        for i, key in enumerate(list(value)):
+            yield (b"," if i else b"") + dumps(str(key)) + b":"
+            yield from iter_json(value.pop(key), depth - 1, chunk_items)
+        yield b"}"
+    elif depth > 0 and isinstance(value, list):
+        yield b"["
+        for start in range(0, len(value), chunk_items):
+            end = min(start + chunk_items, len(value))
+            body = dumps(value[start:end])[1:-1]
+            value[start:end] = [None] * (end - start)  # Release what has been written
+            yield (b"," if start else b"") + body
+        yield b"]"
+    else:
+        yield dumps(value)
@@ -0,0 +1,31 @@
+# src/backend/models/application.py
+
+from typing import Optional
+
+from ..db import to_iso_string, SUBMITTED_AT_FORMAT
+from .record import Record, to_int
+
+class Application(Record):
+    """An applications (or applications_archive) document as the API returns it."""
+    __slots__ = (
+        "appId", "userId", "jobId", "status", "submittedAt", "noteCount", "archivedAt",
+        "userName", "jobTitle", "companyName", "emailSent",
+    )
+
+    @classmethod
+    def from_bson(cls, doc: dict) -> Optional["Application"]:
+        if not doc: return None
+        get = doc.get
+        self = cls.__new__(cls)
+        self.appId = to_int(get("appId"))
+        self.userId = to_int(get("userId"))
+        self.jobId = to_int(get("jobId"))
+        self.status = get("status")
+        self.submittedAt = to_iso_string(get("submittedAt"), SUBMITTED_AT_FORMAT)
+        self.noteCount = get("noteCount")
+        self.archivedAt = to_iso_string(get("archivedAt"), SUBMITTED_AT_FORMAT)
+        self.userName = get("userName")
+        self.jobTitle = get("jobTitle")
+        self.companyName = get("companyName")
+        self.emailSent = get("emailSent")
+        return self
@@ -0,0 +1,24 @@
+# src/backend/models/interview.py
+
+from typing import Optional
+
+from ..db import to_iso_string
+from .record import Record
+
+class Interview(Record):
+    """An interviews document as the API returns it; times are ISO strings."""
+    __slots__ = ("interviewId", "jobId", "candidateId", "recruiterId", "hiringManagerId", "startTime", "endTime")
+
+    @classmethod
+    def from_bson(cls, doc: dict) -> Optional["Interview"]:
+        if not doc: return None
+        get = doc.get
+        self = cls.__new__(cls)
+        self.interviewId = get("interviewId")
+        self.jobId = get("jobId")
+        self.candidateId = get("candidateId")
+        self.recruiterId = get("recruiterId")
+        self.hiringManagerId = get("hiringManagerId")
+        self.startTime = to_iso_string(get("startTime"))
+        self.endTime = to_iso_string(get("endTime"))
+        return self
@@ -0,0 +1,38 @@
+# src/backend/models/job.py
+
+from typing import Optional
+
+from ..db import to_iso_string, POSTED_AT_FORMAT, SUBMITTED_AT_FORMAT
+from .record import Record, to_int
+
+class Job(Record):
+    """A jobs (or jobs_archive) document as the API returns it."""
+    __slots__ = (
+        "jobId", "title", "company", "location", "salaryRange", "skillsRequired",
+        "description", "postedAt", "requires_us_citizenship", "minimum_degree_year",
+        "status", "posterUserId", "posterName", "hiringManagerId", "hiringManagerName",
+        "archivedAt",
+    )
+
+    @classmethod
+    def from_bson(cls, doc: dict) -> Optional["Job"]:
+        if not doc: return None
+        get = doc.get
+        self = cls.__new__(cls)
+        self.jobId = to_int(get("jobId"))
+        self.title = get("title")
+        self.company = get("company")
+        self.location = get("location")
+        self.salaryRange = get("salaryRange")
+        self.skillsRequired = get("skillsRequired")
+        self.description = get("description")
+        self.postedAt = to_iso_string(get("postedAt"), POSTED_AT_FORMAT)
+        self.requires_us_citizenship = get("requires_us_citizenship")
+        self.minimum_degree_year = get("minimum_degree_year")
+        self.status = get("status")
+        self.posterUserId = get("posterUserId")
+        self.posterName = get("posterName")
+        self.hiringManagerId = get("hiringManagerId")
+        self.hiringManagerName = get("hiringManagerName")
+        self.archivedAt = to_iso_string(get("archivedAt"), SUBMITTED_AT_FORMAT)
+        return self
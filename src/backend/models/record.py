@@ -0,0 +1,57 @@
+# src/backend/models/record.py
+
+# Base for the API record models (User, Job, Application, Interview).
+# Records are __slots__ objects: no per-instance __dict__, so a list of
+# 100k rows costs one small fixed-size object each instead of a hash table
+# each. Subclasses build themselves in from_bson with plain attribute
+# stores. GraphQL's default resolver reads the slots with getattr; get(),
+# [] and keys() are kept so resolver code written against the old output
+# dicts keeps working.
+
+from typing import Any, Dict, Iterator, Optional
+
+def to_int(value) -> Optional[int]:
+    return int(value) if value is not None else None
+
+class Record:
+    __slots__ = ()
+    _fields: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = frozenset(cls.__slots__)
+
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._fields: return default
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields: raise KeyError(key)
+        return getattr(self, key, None)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._fields: raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+
+    def keys(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name, None) for name in self.__slots__}
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self): return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        key = self.__slots__[0]
+        return f"{type(self).__name__}({key}={getattr(self, key, None)!r})"
@@ -0,0 +1,93 @@
+# src/backend/models/skill_models.py
+
+# Canonical skill catalog: canonical ID -> (display name, aliases).
+# Aliases are matched case-insensitively on word boundaries when scanning
+# free text, so avoid ambiguous forms (e.g. "go", "spring", "rest") that
+# collide with plain English.
+CANONICAL_SKILLS = {
+    # --- Languages ---
+    "python": ("Python", ["python", "python3", "python 3", "py"]),
+    "java": ("Java", ["java", "java 8", "java 11", "java 17"]),
+    "javascript": ("JavaScript", ["javascript", "java script", "js", "es6", "ecmascript"]),
+    "typescript": ("TypeScript", ["typescript", "ts"]),
+    "c": ("C", ["c language", "ansi c"]),
+    "cpp": ("C++", ["c++", "cpp"]),
+    "csharp": ("C#", ["c#", "csharp", "c sharp"]),
+    "golang": ("Go", ["golang", "go lang"]),
+    "rust": ("Rust", ["rust"]),
+    "ruby": ("Ruby", ["ruby"]),
+    "php": ("PHP", ["php"]),
+    "kotlin": ("Kotlin", ["kotlin"]),
+    "swift": ("Swift", ["swiftui", "swift programming"]),
+    "scala": ("Scala", ["scala"]),
+    "matlab": ("MATLAB", ["matlab"]),
+    "sql": ("SQL", ["sql", "t-sql", "pl/sql", "plsql"]),
+    "bash": ("Bash", ["bash", "shell scripting", "shell script"]),
+    "html": ("HTML", ["html", "html5"]),
+    "css": ("CSS", ["css", "css3", "scss", "sass"]),
+    # --- Frameworks & Libraries ---
+    "react": ("React", ["react", "react.js", "reactjs", "react js"]),
+    "angular": ("Angular", ["angular", "angularjs", "angular.js"]),
+    "vue": ("Vue.js", ["vue", "vue.js", "vuejs"]),
+    "nodejs": ("Node.js", ["node.js", "nodejs", "node js"]),
+    "express": ("Express", ["express.js", "expressjs"]),
+    "django": ("Django", ["django"]),
+    "flask": ("Flask", ["flask"]),
+    "fastapi": ("FastAPI", ["fastapi", "fast api"]),
+    "spring": ("Spring", ["spring boot", "springboot", "spring framework", "spring mvc"]),
+    "dotnet": (".NET", [".net", "dotnet", "asp.net", ".net core"]),
+    "graphql": ("GraphQL", ["graphql"]),
+    "rest": ("REST APIs", ["rest api", "rest apis", "restful", "restful api"]),
+    "pandas": ("Pandas", ["pandas"]),
+    "numpy": ("NumPy", ["numpy"]),
+    "tensorflow": ("TensorFlow", ["tensorflow", "tensor flow"]),
+    "pytorch": ("PyTorch", ["pytorch", "torch"]),
+    "scikit-learn": ("scikit-learn", ["scikit-learn", "scikit learn", "sklearn"]),
+    # --- Data & Storage ---
+    "mongodb": ("MongoDB", ["mongodb", "mongo", "mongo db"]),
+    "postgresql": ("PostgreSQL", ["postgresql", "postgres", "psql"]),
+    "mysql": ("MySQL", ["mysql"]),
+    "oracle-db": ("Oracle Database", ["oracle", "oracle db", "oracle database"]),
+    "sql-server": ("SQL Server", ["sql server", "mssql", "ms sql"]),
+    "redis": ("Redis", ["redis"]),
+    "elasticsearch": ("Elasticsearch", ["elasticsearch", "elastic search"]),
+    "kafka": ("Kafka", ["kafka", "apache kafka"]),
+    "spark": ("Spark", ["spark", "apache spark", "pyspark"]),
+    "hadoop": ("Hadoop", ["hadoop"]),
+    "tableau": ("Tableau", ["tableau"]),
+    "power-bi": ("Power BI", ["power bi", "powerbi"]),
+    "excel": ("Excel", ["excel", "ms excel", "microsoft excel"]),
+    # --- Cloud & DevOps ---
+    "aws": ("AWS", ["aws", "amazon web services"]),
+    "azure": ("Azure", ["azure", "microsoft azure"]),
+    "gcp": ("GCP", ["gcp", "google cloud", "google cloud platform"]),
+    "docker": ("Docker", ["docker"]),
+    "kubernetes": ("Kubernetes", ["kubernetes", "k8s"]),
+    "terraform": ("Terraform", ["terraform"]),
+    "ansible": ("Ansible", ["ansible"]),
+    "jenkins": ("Jenkins", ["jenkins"]),
+    "ci-cd": ("CI/CD", ["ci/cd", "ci cd", "continuous integration", "continuous delivery"]),
+    "git": ("Git", ["git", "github", "gitlab"]),
+    "linux": ("Linux", ["linux", "unix"]),
+    # --- Practices & Domains ---
+    "machine-learning": ("Machine Learning", ["machine learning", "ml"]),
+    "deep-learning": ("Deep Learning", ["deep learning"]),
+    "nlp": ("NLP", ["nlp", "natural language processing"]),
+    "data-analysis": ("Data Analysis", ["data analysis", "data analytics"]),
+    "microservices": ("Microservices", ["microservices", "micro services", "microservice"]),
+    "agile": ("Agile", ["agile", "scrum", "kanban"]),
+    "project-management": ("Project Management", ["project management", "pmp"]),
+    "plc": ("PLC Programming", ["plc", "plc programming", "programmable logic controller"]),
+    "scada": ("SCADA", ["scada"]),
+    "autocad": ("AutoCAD", ["autocad", "auto cad"]),
+    "solidworks": ("SolidWorks", ["solidworks", "solid works"]),
+    "figma": ("Figma", ["figma"]),
+    "selenium": ("Selenium", ["selenium"]),
+    "jira": ("Jira", ["jira"]),
+}
+
+def iter_skill_aliases():
+    """Yields (alias, canonical_id) pairs safe for scanning free text."""
+    for skill_id, (_, aliases) in CANONICAL_SKILLS.items():
+        for alias in aliases:
+            yield alias.lower(), skill_id
@@ -0,0 +1,46 @@
+# src/backend/models/user.py
+
+from typing import Optional
+
+from ..db import to_iso_string
+from .record import Record
+
+class User(Record):
+    """A users document as the API returns it (never carries the password hash)."""
+    __slots__ = (
+        "UserID", "email", "firstName", "lastName", "role", "phone_number",
+        "city", "state_province", "country", "linkedin_profile", "portfolio_url",
+        "highest_qualification", "years_of_experience", "createdAt", "dob", "skills",
+        "professionalTitle", "is_us_citizen", "highest_degree_year",
+        # Filled in per job by Job.applicants
+        "applicationStatus", "resume_url", "interviewTime",
+    )
+
+    @classmethod
+    def from_bson(cls, doc: dict) -> Optional["User"]:
+        if not doc: return None
+        get = doc.get
+        self = cls.__new__(cls)
+        self.UserID = get("UserID")
+        self.email = get("email")
+        self.firstName = get("firstName")
+        self.lastName = get("lastName")
+        self.role = get("role")
+        self.phone_number = get("phone_number")
+        self.city = get("city")
+        self.state_province = get("state_province")
+        self.country = get("country")
+        self.linkedin_profile = get("linkedin_profile")
+        self.portfolio_url = get("portfolio_url")
+        self.highest_qualification = get("highest_qualification")
+        self.years_of_experience = get("years_of_experience")
+        self.createdAt = to_iso_string(get("createdAt"))
+        self.dob = get("dob")
+        self.skills = get("skills")
+        self.professionalTitle = get("professionalTitle")
+        self.is_us_citizen = get("is_us_citizen")
+        self.highest_degree_year = get("highest_degree_year")
+        self.applicationStatus = None
+        self.resume_url = None
+        self.interviewTime = None
+        return self
@@ -1,28 +1,139 @@
-from typing import Optional, Dict, Any, List
+import re
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from pymongo import ReturnDocument
-from ..db import applications_collection
+from ..db import applications_collection, applications_archive_collection, parse_datetime, iter_batches
+from ..services import job_stats_service
 
-def find_applications(q: Dict[str, Any]) -> List[dict]:
-    """Finds multiple applications in the database."""
-    return list(applications_collection().find(q, {"_id": 0}))
+# Note histories can be long; they are only read through find_note_page.
+_DEFAULT_PROJECTION = {"_id": 0, "notes": 0}
 
-def find_application_by_id(app_id: int) -> Optional[dict]:
+def _applications_cursor(q: Dict[str, Any], include_archived: bool = False, projection: Optional[Dict[str, Any]] = None):
+    projection = projection or _DEFAULT_PROJECTION
+    if include_archived:
+        return applications_collection().aggregate([
+            {"$match": q}, {"$project": projection},
+            {"$unionWith": {"coll": applications_archive_collection().name,
+                            "pipeline": [{"$match": q}, {"$project": projection}]}},
+        ])
+    return applications_collection().find(q, projection)
+
+def find_applications(q: Dict[str, Any], include_archived: bool = False) -> List[dict]:
+    """Finds multiple applications in the database (and in the archive when asked)."""
+    return list(_applications_cursor(q, include_archived))
+
+def iter_applications(q: Dict[str, Any], batch_size: int = 1000, projection: Optional[Dict[str, Any]] = None, include_archived: bool = False) -> Iterator[List[dict]]:
+    """
+    Yields matching applications batch_size at a time, without holding the result set. No sort:
+    a sort the filter's index cannot serve would make the server buffer every match first.
+    """
+    return iter_batches(_applications_cursor(q, include_archived, projection), batch_size)
+
+def find_application_by_id(app_id: int, include_archived: bool = False) -> Optional[dict]:
     """Finds a single application by its unique appId."""
-    return applications_collection().find_one({"appId": int(app_id)}, {"_id": 0})
+    doc = applications_collection().find_one({"appId": int(app_id)}, _DEFAULT_PROJECTION)
+    if doc is None and include_archived:
+        doc = applications_archive_collection().find_one({"appId": int(app_id)}, _DEFAULT_PROJECTION)
+    return doc
 
 def insert_application(doc: dict) -> None:
-    """Inserts a new application document into the database."""
+    """Inserts a new application document into the database and counts it for its job."""
     applications_collection().insert_one(doc)
+    job_stats_service.record_application(doc.get("jobId"), doc.get("status") or "Applied", doc.get("submittedAt"))
 
 def update_one_application(q: Dict[str, Any], set_fields: Dict[str, Any]) -> Optional[dict]:
     """Finds one application and updates it."""
     return applications_collection().find_one_and_update(
         q,
         {"$set": set_fields},
-        projection={"_id": 0},
+        projection=_DEFAULT_PROJECTION,
         return_document=ReturnDocument.AFTER,
     )
 
+def transition_application_status(q: Dict[str, Any], new_status: str, set_fields: Optional[Dict[str, Any]] = None) -> Tuple[Optional[dict], Optional[dict]]:
+    """
+    Sets the status of one application atomically and returns (before, after), so the
+    caller can log the transition without a separate read. The job's counters move with it.
+    """
+    # statusUpdatedAt records when the status last changed (exports, job stats activity).
+    set_fields = {**(set_fields or {}), "status": new_status, "statusUpdatedAt": datetime.utcnow()}
+    before = applications_collection().find_one_and_update(
+        q,
+        {"$set": set_fields},
+        projection=_DEFAULT_PROJECTION,
+        return_document=ReturnDocument.BEFORE,
+    )
+    if not before: return None, None
+    job_stats_service.record_transition(before.get("jobId"), before.get("status"), new_status, set_fields["statusUpdatedAt"])
+    return before, {**before, **set_fields}
+
+def update_many_applications(q: Dict[str, Any], set_fields: Dict[str, Any]) -> int:
+    """Updates every matching application. Returns the modified count."""
+    return applications_collection().update_many(q, {"$set": set_fields}).modified_count
+
 def count_applications(query: Dict[str, Any]) -> int:
     """Counts the number of documents in the applications collection matching a query."""
-    return applications_collection().count_documents(query)
\ No newline at end of file
+    return applications_collection().count_documents(query)
+# --- Notes (append-only array of {author, authorId, role, createdAt, text}) ---
+_RECRUITER_NOTE_RE = re.compile(r"\n?--- Recruiter Note \((\d{4}-\d{2}-\d{2})\): ")
+
+def build_note(text: str, author: Optional[str] = None, author_id: Optional[int] = None, role: Optional[str] = None) -> dict:
+    return {"author": author or None, "authorId": author_id, "role": role, "createdAt": datetime.utcnow(), "text": text}
+
+def parse_legacy_notes(notes: Optional[str], default_time: Optional[datetime] = None) -> List[dict]:
+    """
+    Splits a legacy notes string into note entries. Manager notes were appended with a dated
+    '--- Recruiter Note (YYYY-MM-DD): ' marker; other text has no boundaries and stays one entry.
+    """
+    if not isinstance(notes, str) or not notes.strip(): return []
+    parts = _RECRUITER_NOTE_RE.split(notes)
+    entries = []
+    if parts[0].strip():
+        entries.append({"author": None, "authorId": None, "role": None, "createdAt": default_time, "text": parts[0].strip()})
+    for date_str, text in zip(parts[1::2], parts[2::2]):
+        entries.append({"author": None, "authorId": None, "role": "Manager", "createdAt": parse_datetime(date_str), "text": text.strip()})
+    return entries
+
+LEGACY_NOTES_FILTER = {"$or": [{"notes": {"$type": "string"}}, {"notes": None}, {"noteCount": {"$exists": False}}]}
+
+def _convert_legacy_notes(q: Dict[str, Any], collection=None) -> bool:
+    """
+    Turns a string/null notes field into an array and sets noteCount. Conditional on the
+    old value, so racing writers are safe.
+    """
+    collection = collection if collection is not None else applications_collection()
+    doc = collection.find_one({"$and": [q, LEGACY_NOTES_FILTER]}, {"_id": 1, "notes": 1, "submittedAt": 1})
+    if not doc: return False
+    notes = doc.get("notes")
+    entries = notes if isinstance(notes, list) else parse_legacy_notes(notes, parse_datetime(doc.get("submittedAt")))
+    collection.update_one(
+        {"_id": doc["_id"], "notes": doc.get("notes")}, {"$set": {"notes": entries, "noteCount": len(entries)}}
+    )
+    return True
+
+def append_note(q: Dict[str, Any], note: dict) -> Optional[dict]:
+    """
+    Atomically appends one note ($push) without reading the history. Returns the updated
+    application (without notes), or None when nothing matches.
+    """
+    update = {"$push": {"notes": note}, "$inc": {"noteCount": 1}}
+    array_q = {"$and": [q, {"noteCount": {"$exists": True}}, {"notes": {"$ne": None}}, {"notes": {"$not": {"$type": "string"}}}]}
+    for _ in range(2):
+        doc = applications_collection().find_one_and_update(
+            array_q, update, projection=_DEFAULT_PROJECTION, return_document=ReturnDocument.AFTER
+        )
+        # Legacy documents (not yet migrated) are converted once, then appended to.
+        if doc or not _convert_legacy_notes(q): return doc
+    return None
+
+def find_note_page(app_id: int, skip: int, limit: int, archived: bool = False) -> Tuple[List[dict], int]:
+    """Returns (notes[skip:skip+limit], total) with a $slice projection, so only the page is transferred."""
+    projection = {"_id": 0, "notes": {"$slice": [int(skip), max(1, int(limit))]}, "noteCount": 1}
+    q = {"appId": int(app_id), "noteCount": {"$exists": True}, "notes": {"$not": {"$type": "string"}}}
+    collection = applications_archive_collection() if archived else applications_collection()
+    doc = collection.find_one(q, projection)
+    # Legacy documents (hot or archived) are converted on first read, then sliced like any other.
+    if not doc and _convert_legacy_notes({"appId": int(app_id)}, collection):
+        doc = collection.find_one(q, projection)
+    if not doc: return [], 0
+    return doc.get("notes") or [], doc["noteCount"]
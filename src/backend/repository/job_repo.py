@@ -1,24 +1,9 @@
 # src/backend/repository/job_repo.py
 import re
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, List
 from pymongo import ReturnDocument
-from ..db import jobs_collection
-
-def to_job_output(doc: dict) -> dict:
-    if not doc: return None
-    return {
-        "jobId": int(doc.get("jobId")) if doc.get("jobId") is not None else None,
-        "title": doc.get("title"), "company": doc.get("company"), "location": doc.get("location"),
-        "salaryRange": doc.get("salaryRange"), "skillsRequired": doc.get("skillsRequired"),
-        "description": doc.get("description"), "postedAt": doc.get("postedAt"),
-        "requires_us_citizenship": doc.get("requires_us_citizenship"),
-        "minimum_degree_year": doc.get("minimum_degree_year"),
-        "status": doc.get("status"),
-        "posterUserId": doc.get("posterUserId"),
-        "posterName": doc.get("posterName"),
-        "hiringManagerId": doc.get("hiringManagerId"),
-        "hiringManagerName": doc.get("hiringManagerName"),
-    }
+from ..db import jobs_collection, jobs_archive_collection, iter_batches
 
 def build_job_filter(company: Optional[str], location: Optional[str], title: Optional[str], poster_user_id: Optional[int] = None) -> Dict[str, Any]:
     q: Dict[str, Any] = {}
@@ -28,19 +13,41 @@ def build_job_filter(company: Optional[str], location: Optional[str], title: Opt
     if poster_user_id is not None: q["posterUserId"] = int(poster_user_id)
     return q
 
-def find_jobs(q: Dict[str, Any], skip: Optional[int], limit: Optional[int]) -> List[dict]:
+def _jobs_cursor(q: Dict[str, Any], skip: Optional[int], limit: Optional[int], include_archived: bool = False):
+    if include_archived:
+        # Hot jobs first, then archived ones, paged across both
+        pipeline = [
+            {"$match": q}, {"$project": {"_id": 0}},
+            {"$unionWith": {"coll": jobs_archive_collection().name, "pipeline": [{"$match": q}, {"$project": {"_id": 0}}]}},
+        ]
+        if skip: pipeline.append({"$skip": int(skip)})
+        if limit: pipeline.append({"$limit": int(limit)})
+        return jobs_collection().aggregate(pipeline)
     cursor = jobs_collection().find(q, {"_id": 0})
     if skip is not None: cursor = cursor.skip(int(skip))
     if limit is not None: cursor = cursor.limit(int(limit))
-    return list(cursor)
+    return cursor
 
-def find_job_by_id(job_id: int) -> Optional[dict]:
-    return jobs_collection().find_one({"jobId": int(job_id)}, {"_id": 0})
+def find_jobs(q: Dict[str, Any], skip: Optional[int], limit: Optional[int], include_archived: bool = False) -> List[dict]:
+    return list(_jobs_cursor(q, skip, limit, include_archived))
+
+def iter_jobs(q: Dict[str, Any], skip: Optional[int], limit: Optional[int], include_archived: bool = False, batch_size: int = 1000) -> Iterator[List[dict]]:
+    """find_jobs, yielded batch_size documents at a time."""
+    return iter_batches(_jobs_cursor(q, skip, limit, include_archived), batch_size)
+
+def find_job_by_id(job_id: int, include_archived: bool = False) -> Optional[dict]:
+    doc = jobs_collection().find_one({"jobId": int(job_id)}, {"_id": 0})
+    if doc is None and include_archived:
+        doc = jobs_archive_collection().find_one({"jobId": int(job_id)}, {"_id": 0})
+    return doc
 
 def insert_job(doc: dict) -> None:
     jobs_collection().insert_one(doc)
 
 def update_one_job(q: Dict[str, Any], set_fields: Dict[str, Any]) -> Optional[dict]:
+    if "status" in set_fields:
+        # closedAt drives archival (archive_service); reopening a job clears it.
+        set_fields = {**set_fields, "closedAt": datetime.utcnow() if set_fields["status"] == "Closed" else None}
     return jobs_collection().find_one_and_update(
         q, {"$set": set_fields}, projection={"_id": 0}, return_document=ReturnDocument.AFTER
     )
@@ -0,0 +1,49 @@
+# src/backend/repository/resume_cache_repo.py
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+from pymongo.errors import DuplicateKeyError
+from ..db import resume_parse_cache_collection
+
+def find_cached_parse(content_hash: str, prompt_version: str) -> Optional[dict]:
+    """
+    Returns the cached extraction + LLM result for an identical file parsed with the same prompt version.
+    """
+    return resume_parse_cache_collection().find_one(
+        {"contentHash": content_hash, "promptVersion": prompt_version}, {"_id": 0}
+    )
+
+def find_cached_parses(content_hashes: Iterable[str], prompt_version: str) -> Dict[str, dict]:
+    """
+    Batched lookup for bulk ingestion: returns {contentHash: cache_doc} for every hash already parsed.
+    """
+    cursor = resume_parse_cache_collection().find(
+        {"contentHash": {"$in": list(content_hashes)}, "promptVersion": prompt_version}, {"_id": 0}
+    )
+    return {doc["contentHash"]: doc for doc in cursor if doc.get("parsedData")}
+
+def find_cached_text(content_hash: str) -> Optional[str]:
+    """
+    Returns previously extracted text for this file under any prompt version.
+    Text extraction does not depend on the prompt, so a prompt bump only costs a new LLM call.
+    """
+    doc = resume_parse_cache_collection().find_one(
+        {"contentHash": content_hash, "rawText": {"$ne": None}}, {"_id": 0, "rawText": 1}
+    )
+    return doc.get("rawText") if doc else None
+
+def save_cached_parse(content_hash: str, prompt_version: str, raw_text: str, parsed_data: dict) -> None:
+    """
+    Stores the extraction + LLM result. Concurrent uploads of the same file race benignly on the unique index.
+    """
+    try:
+        resume_parse_cache_collection().update_one(
+            {"contentHash": content_hash, "promptVersion": prompt_version},
+            {"$setOnInsert": {
+                "rawText": raw_text,
+                "parsedData": parsed_data,
+                "createdAt": datetime.utcnow(),
+            }},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        pass
@@ -1,6 +1,7 @@
 # src/backend/repository/resume_repo.py
-from typing import List, Optional
-from ..db import resumes_collection, next_resume_id, ensure_resume_counter
+from typing import Iterator, List, Optional
+from pymongo import UpdateOne
+from ..db import resumes_collection, next_resume_id, reserve_resume_ids, ensure_resume_counter, iter_batches
 
 def insert_resume(doc: dict):
     """
@@ -8,12 +9,28 @@ def insert_resume(doc: dict):
     """
     resumes_collection().insert_one(doc)
 
+def upsert_resumes(docs: List[dict]) -> int:
+    """
+    Inserts many resume documents with a single unordered bulk_write, keyed on (userId, contentHash):
+    a document whose file is already stored for that user is left untouched, so re-running a partly
+    written batch never duplicates resumes. Returns the inserted count.
+    """
+    if not docs: return 0
+    ops = [UpdateOne({"userId": d["userId"], "contentHash": d["contentHash"]}, {"$setOnInsert": d}, upsert=True) for d in docs]
+    return resumes_collection().bulk_write(ops, ordered=False).upserted_count
+
 def find_resumes_by_user(user_id: int) -> List[dict]:
     """
     Retrieves all resumes associated with a specific UserID.
     """
     return list(resumes_collection().find({"userId": int(user_id)}, {"_id": 0}))
 
+def iter_resumes_by_user(user_id: int, batch_size: int = 100) -> Iterator[List[dict]]:
+    """
+    find_resumes_by_user, yielded batch_size documents at a time (resumes carry their extracted text).
+    """
+    return iter_batches(resumes_collection().find({"userId": int(user_id)}, {"_id": 0}), batch_size)
+
 def find_resume_by_id(resume_id: int) -> Optional[dict]:
     """
     Retrieves a single resume by its unique resumeId.
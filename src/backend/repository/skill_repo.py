@@ -0,0 +1,78 @@
+# src/backend/repository/skill_repo.py
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+from pymongo import UpdateOne, ReplaceOne
+from pymongo.errors import BulkWriteError
+from ..db import skill_postings_collection
+
+# Posting docs: {"_id": "<kind>:<skillId>:<bucket>", "kind", "skillId", "bucket", "ids": [ints]}
+# Each (kind, skill) list is split by id range: bucket = id // SKILL_POSTING_BUCKET_SPAN. Every
+# document then holds at most SKILL_POSTING_BUCKET_SPAN ids, so a write to a popular skill costs
+# one bounded array update and no list can reach the 16 MB document limit.
+# A marker doc {"_id": "built:<kind>", "kind": "meta", "layout": ...} records that a full rebuild
+# has run with the current layout.
+SKILL_POSTING_BUCKET_SPAN = int(os.getenv("SKILL_POSTING_BUCKET_SPAN", 10000))
+POSTING_LAYOUT = "bucketed"
+
+def _bucket(item_id: int) -> int:
+    return int(item_id) // SKILL_POSTING_BUCKET_SPAN
+
+def _posting_id(kind: str, skill_id: str, bucket: int) -> str:
+    return f"{kind}:{skill_id}:{bucket}"
+
+def _group(pairs: Iterable[Tuple[int, str]]) -> Dict[Tuple[str, int], List[int]]:
+    grouped = defaultdict(list)
+    for item_id, skill_id in pairs:
+        grouped[(skill_id, _bucket(item_id))].append(int(item_id))
+    return grouped
+
+def add_postings(kind: str, pairs: Iterable[Tuple[int, str]]) -> None:
+    """Adds (item_id, skill_id) pairs with one duplicate-free upsert per (skill, bucket)."""
+    ops = [
+        UpdateOne(
+            {"_id": _posting_id(kind, skill_id, bucket)},
+            {"$addToSet": {"ids": {"$each": ids}}, "$setOnInsert": {"kind": kind, "skillId": skill_id, "bucket": bucket}},
+            upsert=True,
+        )
+        for (skill_id, bucket), ids in _group(pairs).items()
+    ]
+    if not ops: return
+    try:
+        skill_postings_collection().bulk_write(ops, ordered=False)
+    except BulkWriteError:
+        # Lost an upsert race on a brand-new bucket; the doc exists now, and $addToSet makes a replay safe.
+        skill_postings_collection().bulk_write(ops, ordered=False)
+
+def remove_postings(kind: str, pairs: Iterable[Tuple[int, str]]) -> None:
+    ops = [
+        UpdateOne({"_id": _posting_id(kind, skill_id, bucket)}, {"$pull": {"ids": {"$in": ids}}})
+        for (skill_id, bucket), ids in _group(pairs).items()
+    ]
+    if ops: skill_postings_collection().bulk_write(ops, ordered=False)
+
+def find_postings(kind: str, skill_ids: Iterable[str]) -> Dict[str, List[int]]:
+    """Returns {skill_id: sorted ids} for the requested skills that have a posting list."""
+    postings = defaultdict(list)
+    for doc in skill_postings_collection().find({"kind": kind, "skillId": {"$in": list(skill_ids)}}, {"_id": 0, "skillId": 1, "ids": 1}):
+        postings[doc["skillId"]].extend(doc.get("ids") or [])
+    return {skill_id: sorted(ids) for skill_id, ids in postings.items() if ids}
+
+def postings_built(kind: str) -> bool:
+    return skill_postings_collection().find_one({"_id": f"built:{kind}", "layout": POSTING_LAYOUT}, {"_id": 1}) is not None
+
+def replace_all_postings(kind: str, postings: Dict[str, List[int]], batch_size: int = 500) -> None:
+    """
+    Replaces every posting bucket of a kind in place (readers keep seeing the old buckets until each is swapped),
+    drops buckets that no longer occur (and lists in an older layout) and marks the kind as built.
+    """
+    coll = skill_postings_collection()
+    docs = [
+        {"_id": _posting_id(kind, skill_id, bucket), "kind": kind, "skillId": skill_id, "bucket": bucket, "ids": sorted(ids)}
+        for skill_id, item_ids in postings.items()
+        for (_, bucket), ids in _group((i, skill_id) for i in item_ids).items()
+    ]
+    for i in range(0, len(docs), batch_size):
+        coll.bulk_write([ReplaceOne({"_id": d["_id"]}, d, upsert=True) for d in docs[i:i + batch_size]], ordered=False)
+    coll.delete_many({"kind": kind, "_id": {"$nin": [d["_id"] for d in docs]}})
+    coll.update_one({"_id": f"built:{kind}"}, {"$set": {"kind": "meta", "layout": POSTING_LAYOUT}}, upsert=True)
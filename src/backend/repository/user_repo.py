@@ -1,25 +1,12 @@
 # src/backend/repository/user_repo.py
 import re
-from typing import Optional, Dict, Any, List
-from pymongo import ReturnDocument
-from ..db import users_collection
+from typing import Optional, Dict, Any, Iterator, List
+from pymongo import ReturnDocument, UpdateOne
+from ..db import users_collection, iter_batches
 
 def find_user_by_email(email: str) -> Optional[dict]:
     return users_collection().find_one({"email": {"$regex": f"^{email}$", "$options": "i"}})
 
-def to_user_output(doc: dict) -> Optional[dict]:
-    if not doc: return None
-    return {
-        "UserID": doc.get("UserID"), "email": doc.get("email"), "firstName": doc.get("firstName"),
-        "lastName": doc.get("lastName"), "role": doc.get("role"), "phone_number": doc.get("phone_number"),
-        "city": doc.get("city"), "state_province": doc.get("state_province"), "country": doc.get("country"),
-        "linkedin_profile": doc.get("linkedin_profile"), "portfolio_url": doc.get("portfolio_url"),
-        "highest_qualification": doc.get("highest_qualification"), "years_of_experience": doc.get("years_of_experience"),
-        "createdAt": doc.get("createdAt"), "dob": doc.get("dob"), "skills": doc.get("skills"),
-        "professionalTitle": doc.get("professionalTitle"), "is_us_citizen": doc.get("is_us_citizen"),
-        "highest_degree_year": doc.get("highest_degree_year")
-    }
-
 def build_filter(first_name: Optional[str], last_name: Optional[str], dob: Optional[str], skills: Optional[List[str]] = None, is_us_citizen: Optional[bool] = None, years_of_experience_gte: Optional[int] = None) -> Dict[str, Any]:
     q = {}
     if first_name: q["firstName"] = {"$regex": f"^{re.escape(first_name)}$", "$options": "i"}
@@ -30,11 +17,29 @@ def build_filter(first_name: Optional[str], last_name: Optional[str], dob: Optio
     if years_of_experience_gte is not None: q["years_of_experience"] = {"$gte": years_of_experience_gte}
     return q
 
-def find_users(q: Dict[str, Any], skip: Optional[int], limit: Optional[int]) -> List[dict]:
+def _users_cursor(q: Dict[str, Any], skip: Optional[int], limit: Optional[int]):
     cursor = users_collection().find(q, {"_id": 0, "password": 0})
     if skip is not None: cursor = cursor.skip(int(skip))
     if limit is not None: cursor = cursor.limit(int(limit))
-    return list(cursor)
+    return cursor
+
+def find_users(q: Dict[str, Any], skip: Optional[int], limit: Optional[int]) -> List[dict]:
+    return list(_users_cursor(q, skip, limit))
+
+def iter_users(q: Dict[str, Any], skip: Optional[int], limit: Optional[int], batch_size: int = 1000) -> Iterator[List[dict]]:
+    """find_users, yielded batch_size documents at a time."""
+    return iter_batches(_users_cursor(q, skip, limit), batch_size)
+
+def find_users_by_ids(user_ids: List[int], projection: Optional[Dict[str, Any]] = None, batch_size: int = 5000) -> List[dict]:
+    """
+    Fetches many users by UserID, issuing one $in query per batch so huge id lists stay well under the BSON limit.
+    """
+    projection = projection or {"_id": 0, "password": 0}
+    ids = list(user_ids)
+    docs = []
+    for i in range(0, len(ids), batch_size):
+        docs.extend(users_collection().find({"UserID": {"$in": ids[i:i + batch_size]}}, projection))
+    return docs
 
 def find_one_by_id(user_id: int) -> Optional[dict]:
     return users_collection().find_one({"UserID": int(user_id)}, {"_id": 0, "password": 0})
@@ -49,4 +54,17 @@ def delete_one(q: Dict[str, Any]) -> int:
     return users_collection().delete_one(q).deleted_count
 
 def add_skills_to_user(user_id: int, skills: List[str]) -> Optional[dict]:
-    return users_collection().find_one_and_update({"UserID": int(user_id)}, {"$addToSet": {"skills": {"$each": skills}}}, projection={"_id": 0, "password": 0}, return_document=ReturnDocument.AFTER)
\ No newline at end of file
+    return users_collection().find_one_and_update({"UserID": int(user_id)}, {"$addToSet": {"skills": {"$each": skills}}}, projection={"_id": 0, "password": 0}, return_document=ReturnDocument.AFTER)
+
+def bulk_update_users(updates: List[tuple]) -> int:
+    """
+    Applies (UserID, set_fields, skills_to_add) tuples with one unordered bulk_write. Returns the matched count.
+    """
+    ops = []
+    for user_id, set_fields, skills in updates:
+        update = {}
+        if set_fields: update["$set"] = set_fields
+        if skills: update["$addToSet"] = {"skills": {"$each": skills}}
+        if update: ops.append(UpdateOne({"UserID": int(user_id)}, update))
+    if not ops: return 0
+    return users_collection().bulk_write(ops, ordered=False).matched_count
\ No newline at end of file
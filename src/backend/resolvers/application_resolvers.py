@@ -1,10 +1,13 @@
 # src/backend/resolvers/application_resolvers.py
 from datetime import datetime
 from ariadne import QueryType, MutationType, ObjectType
-from ..db import next_application_id, to_application_output, interviews_collection
+from ..db import next_application_id, interviews_collection, to_iso_string, SUBMITTED_AT_FORMAT
+from ..models.application import Application
+from ..models.job import Job
+from ..models.user import User
 from ..validators.common_validators import clean_update_input
 from ..repository import user_repo, job_repo, application_repo, resume_repo
-from ..services import email_service
+from ..services import email_service, event_log_service, job_stats_service, embedding_service
 import threading
 import logging # <-- NEW IMPORT
 
@@ -25,6 +28,7 @@ def _handle_hired_status_side_effects(job_id, hired_user_id):
     """
     print(f"Triggering side-effects for hired status on job {job_id}...")
     job_repo.update_one_job({"jobId": job_id}, {"status": "Closed"})
+    embedding_service.remove_job(job_id)
     
     # Find all other applications for this job (excluding the hired user)
     other_apps = application_repo.find_applications({"jobId": job_id, "userId": {"$ne": hired_user_id}})
@@ -41,7 +45,8 @@ def _handle_hired_status_side_effects(job_id, hired_user_id):
                     job_title=job["title"], company=job["company"],
                     app_id=app["appId"]
                 )
-                application_repo.update_one_application({"appId": app["appId"]}, {"status": "Rejected"})
+                before, _ = application_repo.transition_application_status({"appId": app["appId"]}, "Rejected")
+                event_log_service.record_transition(before, "Rejected")
                 
     print("Hired status side-effects complete.")
 
@@ -59,8 +64,11 @@ def resolve_job_applicants(job_obj, info):
     job_id = job_obj.get("jobId")
     if not job_id: return []
     
-    # 1. Find all applications for the job
-    applications = application_repo.find_applications({"jobId": job_id})
+    # 1. Find all applications for the job (an archived job's are archived with it)
+    if job_obj.get("archivedAt"):
+        applications = application_repo.find_applications({"jobId": job_id}, include_archived=True)
+    else:
+        applications = application_repo.find_applications({"jobId": job_id})
     if not applications: return []
     
     # 2. Get all unique UserIDs
@@ -73,7 +81,7 @@ def resolve_job_applicants(job_obj, info):
         "jobId": job_id,
         "candidateId": {"$in": user_ids}
     }))
-    user_id_to_time = {i.get("candidateId"): i.get("startTime") for i in interviews}
+    user_id_to_time = {i.get("candidateId"): to_iso_string(i.get("startTime")) for i in interviews}
     # ----------------------------------
 
     if not user_ids: return []
@@ -84,7 +92,7 @@ def resolve_job_applicants(job_obj, info):
     # 4. Attach status and format output
     output_users = []
     for doc in applicant_docs:
-        user_output = user_repo.to_user_output(doc)
+        user_output = User.from_bson(doc)
         # --- NEW: Inject application status into the User object for display ---
         user_output['applicationStatus'] = user_id_to_status.get(doc.get("UserID"), 'Applied') 
         user_output['resume_url'] = user_id_to_resume.get(doc.get("UserID"))
@@ -99,10 +107,23 @@ def resolve_job_applicants(job_obj, info):
 def resolve_job_application_count(job_obj, info):
     job_id = job_obj.get("jobId")
     if not job_id: return 0
-    return application_repo.count_applications({"jobId": job_id})
+    return job_stats_service.get_stats(info.context, job_id)["total"]
+
+@job.field("stats")
+def resolve_job_stats(job_obj, info):
+    job_id = job_obj.get("jobId")
+    stats = job_stats_service.get_stats(info.context, job_id) if job_id else job_stats_service.empty_stats(0)
+    return {
+        "total": stats.get("total", 0),
+        "byStatus": [
+            {"status": status, "count": count}
+            for status, count in sorted((stats.get("byStatus") or {}).items()) if count
+        ],
+        "lastActivityAt": to_iso_string(stats.get("lastActivityAt"), SUBMITTED_AT_FORMAT),
+    }
 
 @query.field("applications")
-def resolve_applications(obj, info, userId=None, jobId=None, status=None):
+def resolve_applications(obj, info, userId=None, jobId=None, status=None, includeArchived=False):
     q = {}
     # Security: If Applicant is requesting, restrict to their ID unless an ID is explicitly passed
     if info.context.get("user_role") == "Applicant" and not userId:
@@ -112,27 +133,60 @@ def resolve_applications(obj, info, userId=None, jobId=None, status=None):
     if jobId: q["jobId"] = int(jobId)
     if status: q["status"] = status
     
-    docs = application_repo.find_applications(q)
-    return [to_application_output(d) for d in docs]
+    batches = application_repo.iter_applications(q, include_archived=includeArchived)
+    return (Application.from_bson(d) for batch in batches for d in batch)
 
 @query.field("applicationById")
-def resolve_application_by_id(*_, appId):
-    doc = application_repo.find_application_by_id(int(appId))
+def resolve_application_by_id(*_, appId, includeArchived=False):
+    doc = application_repo.find_application_by_id(int(appId), include_archived=includeArchived)
     if not doc: raise ValueError(f"Application with ID {appId} not found.")
-    return to_application_output(doc)
+    return Application.from_bson(doc)
+
+DEFAULT_NOTES_PAGE = 20
+MAX_NOTES_PAGE = 100
+
+def _note_from_context(info, text: str) -> dict:
+    ctx = info.context
+    author = f"{ctx.get('firstName', '')} {ctx.get('lastName', '')}".strip()
+    return application_repo.build_note(text, author, ctx.get("UserID"), ctx.get("user_role"))
+
+@application.field("notes")
+def resolve_application_notes(app_obj, _, first=None, after=None):
+    """Oldest first. The cursor is the note's position, which never changes in an append-only list."""
+    limit = max(1, min(int(first or DEFAULT_NOTES_PAGE), MAX_NOTES_PAGE))
+    try:
+        position = int(after) if after is not None else -1
+    except ValueError:
+        raise ValueError("Invalid 'after' cursor.")
+    # A negative $slice would count from the end of the list.
+    if after is not None and position < 0: raise ValueError("Invalid 'after' cursor.")
+    skip = position + 1
+    notes, total = application_repo.find_note_page(app_obj.get("appId"), skip, limit, archived=bool(app_obj.get("archivedAt")))
+    items = [{**n, "cursor": str(skip + i), "createdAt": to_iso_string(n.get("createdAt"))} for i, n in enumerate(notes)]
+    return {
+        "items": items,
+        "totalCount": total,
+        "endCursor": items[-1]["cursor"] if items else after,
+        "hasNextPage": skip + len(items) < total,
+    }
+
+@application.field("noteCount")
+def resolve_application_note_count(app_obj, _):
+    if app_obj.get("noteCount") is not None: return app_obj["noteCount"]
+    return application_repo.find_note_page(app_obj.get("appId"), 0, 1, archived=bool(app_obj.get("archivedAt")))[1]  # Not yet migrated
 
 @application.field("candidate")
 def resolve_application_candidate(app_obj, _):
-    return user_repo.to_user_output(user_repo.find_one_by_id(app_obj.get("userId")))
+    return User.from_bson(user_repo.find_one_by_id(app_obj.get("userId")))
 
 @application.field("job")
 def resolve_application_job(app_obj, _):
-    return job_repo.to_job_output(job_repo.find_job_by_id(app_obj.get("jobId")))
+    return Job.from_bson(job_repo.find_job_by_id(app_obj.get("jobId"), include_archived=bool(app_obj.get("archivedAt"))))
 
 # --- MUTATIONS ---
 
 @mutation.field("createApplication")
-def resolve_create_application(*_, input):
+def resolve_create_application(obj, info, input):
     user_id, job_id = input.get("userId"), input.get("jobId")
     
     # 1. Fetch User and Job
@@ -152,21 +206,24 @@ def resolve_create_application(*_, input):
             )
     # ------------------------------
 
-    existing_app = application_repo.find_applications({"userId": user_id, "jobId": job_id})
+    # Archived applications count too: a candidate's history on a job is never a fresh start.
+    existing_app = application_repo.find_applications({"userId": user_id, "jobId": job_id}, include_archived=True)
     if existing_app:
          raise ValueError(f"Duplicate application: You have already applied (AppID: {existing_app[0]['appId']}).")
 
+    notes = [application_repo.build_note(input["notes"], input.get("userName"), user_id)] if input.get("notes") else []
     doc = {
         "appId": next_application_id(), "userId": user_id, "jobId": job_id,
-        "status": "Applied", "submittedAt": datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
-        "notes": input.get("notes"),
+        "status": "Applied", "submittedAt": datetime.utcnow(),
+        "notes": notes, "noteCount": len(notes),
         # Denormalized fields are passed from resolve_apply and correctly inserted
         "userName": input.get("userName"),
         "jobTitle": input.get("jobTitle"),
         "companyName": input.get("companyName"),
     }
     application_repo.insert_application(doc)
-    return to_application_output(doc)
+    event_log_service.record_transition({"appId": doc["appId"], "jobId": job_id, "status": None}, "Applied", event_log_service.actor_from_context(info))
+    return Application.from_bson(doc)
 
 @mutation.field("apply")
 def resolve_apply(obj, info, userName, jobTitle, companyName=None):
@@ -201,10 +258,22 @@ def resolve_apply(obj, info, userName, jobTitle, companyName=None):
 @mutation.field("updateApplication")
 def resolve_update_application(obj, info, appId, input):
     set_fields = clean_update_input(input)
-    if not set_fields: raise ValueError("No fields provided to update.")
-    updated = application_repo.update_one_application({"appId": int(appId)}, set_fields)
-    if not updated: raise ValueError(f"Application with ID {appId} not found for update.")
-    return to_application_output(updated)
+    note = set_fields.pop("notes", None)
+    if not set_fields and not note: raise ValueError("No fields provided to update.")
+    updated = None
+    if "status" in set_fields:
+        status = set_fields.pop("status")
+        before, updated = application_repo.transition_application_status({"appId": int(appId)}, status, set_fields)
+        if not updated: raise ValueError(f"Application with ID {appId} not found for update.")
+        event_log_service.record_transition(before, status, event_log_service.actor_from_context(info))
+    elif set_fields:
+        updated = application_repo.update_one_application({"appId": int(appId)}, set_fields)
+        if not updated: raise ValueError(f"Application with ID {appId} not found for update.")
+    if note:
+        # Notes are appended, never overwritten
+        updated = application_repo.append_note({"appId": int(appId)}, _note_from_context(info, note))
+        if not updated: raise ValueError(f"Application with ID {appId} not found for update.")
+    return Application.from_bson(updated)
 
 @mutation.field("updateApplicationStatusByNames")
 def resolve_update_application_status_by_names(obj, info, userName, jobTitle, newStatus, companyName=None):
@@ -230,10 +299,11 @@ def resolve_update_application_status_by_names(obj, info, userName, jobTitle, ne
     logger.debug(f"DEBUG_A: Found application {target_app_id}. Status being set to '{newStatus}'")
 
     # --- UPDATE STATUS ---
-    updated_app = application_repo.update_one_application({"appId": target_app_id}, {"status": newStatus})
+    before, updated_app = application_repo.transition_application_status({"appId": target_app_id}, newStatus)
     if not updated_app: 
         logger.error(f"Failed to update application {target_app_id} status to {newStatus}.")
         raise ValueError("Failed to update application status.")
+    event_log_service.record_transition(before, newStatus, event_log_service.actor_from_context(info))
 
     logger.debug("DEBUG_B: Status successfully updated in DB.")
 
@@ -241,7 +311,7 @@ def resolve_update_application_status_by_names(obj, info, userName, jobTitle, ne
     candidate = user_repo.find_one_by_id(updated_app["userId"])
     job = job_repo.find_job_by_id(updated_app["jobId"])
 
-    if not candidate or not job: return to_application_output(updated_app)
+    if not candidate or not job: return Application.from_bson(updated_app)
 
     # --- STATUS HANDLING LOGIC ---
 
@@ -288,7 +358,7 @@ def resolve_update_application_status_by_names(obj, info, userName, jobTitle, ne
             app_id=updated_app["appId"] 
         )
 
-    return to_application_output(updated_app)
+    return Application.from_bson(updated_app)
 
 # --- NEW MUTATION: REJECT OFFER (FS.5) ---
 @mutation.field("acceptOffer")
@@ -313,7 +383,8 @@ def resolve_accept_offer(obj, info, jobTitle, companyName=None):
         raise ValueError(f"Cannot accept offer: Current status is '{app['status']}', not 'Offered'.")
         
     # 4. Update to Hired
-    updated_app = application_repo.update_one_application({"appId": app["appId"]}, {"status": "Hired"})
+    before, updated_app = application_repo.transition_application_status({"appId": app["appId"]}, "Hired")
+    event_log_service.record_transition(before, "Hired", event_log_service.actor_from_context(info))
     
     # 5. Notify Manager
     manager_id = job.get("hiringManagerId") or job.get("posterUserId")
@@ -335,7 +406,7 @@ def resolve_accept_offer(obj, info, jobTitle, companyName=None):
     thread = threading.Thread(target=_handle_hired_status_side_effects, args=(job["jobId"], user_id))
     thread.start()
     
-    return to_application_output(updated_app)
+    return Application.from_bson(updated_app)
 
 @mutation.field("rejectOffer")
 def resolve_reject_offer(obj, info, jobTitle, companyName=None):
@@ -360,7 +431,8 @@ def resolve_reject_offer(obj, info, jobTitle, companyName=None):
         raise ValueError(f"Cannot reject offer: Current status is '{app['status']}', not 'Offered' or 'Hired'.")
         
     # 4. Update Status
-    updated_app = application_repo.update_one_application({"appId": app["appId"]}, {"status": "Offer Rejected"})
+    before, updated_app = application_repo.transition_application_status({"appId": app["appId"]}, "Offer Rejected")
+    event_log_service.record_transition(before, "Offer Rejected", event_log_service.actor_from_context(info))
     
     # 5. Notify Manager
     # Use Hiring Manager if assigned, otherwise Poster (Recruiter)
@@ -379,7 +451,7 @@ def resolve_reject_offer(obj, info, jobTitle, companyName=None):
                 app_id=app["appId"]
             )
             
-    return to_application_output(updated_app)
+    return Application.from_bson(updated_app)
 
 @mutation.field("addNoteToApplicationByJob")
 def resolve_add_note_to_application_by_job(obj, info, jobTitle, note, companyName=None):
@@ -393,21 +465,11 @@ def resolve_add_note_to_application_by_job(obj, info, jobTitle, note, companyNam
     if not jobs: raise ValueError(f"Could not find job with title '{jobTitle}'.")
     if len(jobs) > 1: raise ValueError(f"Found multiple jobs with title '{jobTitle}'. Please specify a company.")
 
-    # 2. FIND APPLICANT'S APPLICATION
+    # 2. APPEND NOTE to the applicant's application (a single atomic $push)
     application_filter = {"userId": user_id, "jobId": jobs[0]["jobId"]}
-    apps = application_repo.find_applications(application_filter)
-    if not apps: raise ValueError(f"You have not applied for the '{jobTitle}' job.")
-    
-    target_app_id = apps[0]["appId"]
-    
-    # 3. APPEND NOTE
-    existing_notes = apps[0].get("notes", "") or ""
-    # Applicant notes are simply appended, without a timestamp prefix
-    updated_notes = f"{existing_notes}\n{note}".strip() 
-
-    updated_app = application_repo.update_one_application({"appId": target_app_id}, {"notes": updated_notes})
-    if not updated_app: raise ValueError("Failed to add note.")
-    return to_application_output(updated_app)
+    updated_app = application_repo.append_note(application_filter, _note_from_context(info, note))
+    if not updated_app: raise ValueError(f"You have not applied for the '{jobTitle}' job.")
+    return Application.from_bson(updated_app)
 
 @mutation.field("addManagerNoteToApplication")
 def resolve_add_manager_note_to_application(obj, info, userName, jobTitle, note, companyName=None):
@@ -427,14 +489,9 @@ def resolve_add_manager_note_to_application(obj, info, userName, jobTitle, note,
     # --- END FIND LOGIC ---
     
     # --- APPEND NOTE ---
-    existing_notes = apps[0].get("notes", "") or ""
-    timestamp = datetime.utcnow().strftime('%Y-%m-%d')
-    new_note = f"\n--- Recruiter Note ({timestamp}): {note}"
-    updated_notes = existing_notes.strip() + new_note
-
-    updated_app = application_repo.update_one_application({"appId": target_app_id}, {"notes": updated_notes})
+    updated_app = application_repo.append_note({"appId": target_app_id}, _note_from_context(info, note))
     if not updated_app: raise ValueError("Failed to add note.")
-    return to_application_output(updated_app)
+    return Application.from_bson(updated_app)
 
 @mutation.field("applyWithResume")
 def resolve_apply_with_resume(obj, info, userName, jobTitle, resumeId, companyName=None):
@@ -467,20 +524,38 @@ def resolve_apply_with_resume(obj, info, userName, jobTitle, resumeId, companyNa
     
     new_app = resolve_create_application(None, info, input=app_input)
     
-    application_repo.update_one_application(
+    application_repo.update_one_application({"appId": new_app["appId"]}, {"resume_url": resume["url"]})
+    updated_app = application_repo.append_note(
         {"appId": new_app["appId"]},
-        {
-            "resume_url": resume["url"],
-            "notes": f"Applied using specific resume: {resume.get('filename')}"
-        }
+        _note_from_context(info, f"Applied using specific resume: {resume.get('filename')}")
     )
-    
-    updated_app = application_repo.find_application_by_id(new_app["appId"])
-    return to_application_output(updated_app)
+    return Application.from_bson(updated_app)
 
 # --- Ensure correct Query object is exposed for ariadne schema build ---
 @query.field("applicationById")
-def resolve_application_by_id(*_, appId):
-    doc = application_repo.find_application_by_id(int(appId))
+def resolve_application_by_id(*_, appId, includeArchived=False):
+    doc = application_repo.find_application_by_id(int(appId), include_archived=includeArchived)
     if not doc: raise ValueError(f"Application with ID {appId} not found.")
-    return to_application_output(doc)
\ No newline at end of file
+    return Application.from_bson(doc)
+# --- NEW QUERY (Status History) ---
+@query.field("applicationTimeline")
+def resolve_application_timeline(_, info, appId):
+    user_id = info.context.get("UserID")
+    user_role = info.context.get("user_role")
+    app = application_repo.find_application_by_id(int(appId), include_archived=True)  # History outlives archival
+    if not app: raise ValueError(f"Application with ID {appId} not found.")
+    if user_role not in ["Recruiter", "Manager"] and app.get("userId") != user_id:
+        raise PermissionError("Access denied: You can only view the history of your own applications.")
+
+    return [
+        {
+            "appId": e["meta"].get("appId"),
+            "jobId": e["meta"].get("jobId"),
+            "fromStatus": e.get("from"),
+            "toStatus": e.get("to"),
+            "actorId": (e.get("actor") or {}).get("userId"),
+            "actorRole": (e.get("actor") or {}).get("role"),
+            "at": to_iso_string(e.get("ts")),
+        }
+        for e in event_log_service.get_timeline(int(appId))
+    ]
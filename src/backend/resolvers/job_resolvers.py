@@ -5,15 +5,17 @@ from ..validators.common_validators import require_non_empty_str, clean_update_i
 from ..repository.job_repo import (
     build_job_filter,
     find_jobs,
+    iter_jobs,
     find_job_by_id,
     insert_job,
     update_one_job,
     delete_one_job,
-    to_job_output,
     add_skills_to_job,
 )
 from ..repository import user_repo # <--- Need this to validate Manager ID
 from ..db import next_job_id
+from ..models.job import Job
+from ..services import embedding_service, skill_service, job_stats_service
 
 query = QueryType()
 mutation = MutationType()
@@ -54,7 +56,7 @@ def _resolve_manager_info(manager_id=None, manager_name=None):
 
 # --- READ Operations ---
 @query.field("jobs")
-def resolve_jobs(obj, info, limit=None, skip=None, company=None, location=None, title=None, posterUserId=None):
+def resolve_jobs(obj, info, limit=None, skip=None, company=None, location=None, title=None, posterUserId=None, includeArchived=False):
     # 1. Build the basic search filter
     q = build_job_filter(company, location, title, posterUserId)
     
@@ -71,16 +73,22 @@ def resolve_jobs(obj, info, limit=None, skip=None, company=None, location=None,
         q["status"] = {"$ne": "Closed"}
 
     # 3. Execute Query
-    docs = find_jobs(q, skip, limit)
-    return [to_job_output(d) for d in docs]
+    # Archived jobs are all Closed, so this only widens results for Recruiters and Managers
+    return _job_outputs(info, iter_jobs(q, skip, limit, include_archived=includeArchived))
+
+def _job_outputs(info, batches):
+    for batch in batches:
+        # Job.stats / applicationCount for each batch then come from one lookup
+        job_stats_service.prime(info.context, (d.get("jobId") for d in batch))
+        for d in batch: yield Job.from_bson(d)
 
 @query.field("jobById")
-def resolve_job_by_id(obj, info, jobId):
+def resolve_job_by_id(obj, info, jobId, includeArchived=False):
     # No authorization check needed here. Anyone can view a specific job.
-    doc = find_job_by_id(int(jobId))
+    doc = find_job_by_id(int(jobId), include_archived=includeArchived)
     if not doc:
         raise ValueError(f"Job with ID {jobId} not found.")
-    return to_job_output(doc)
+    return Job.from_bson(doc)
 
 # --- MUTATION Operations (Protected for Recruiters) ---
 
@@ -116,9 +124,9 @@ def resolve_create_job(obj, info, input):
         "company": input.get("company"),
         "location": input.get("location"),
         "salaryRange": input.get("salaryRange"),
-        "skillsRequired": input.get("skillsRequired", []),
+        "skillsRequired": skill_service.canonicalize_skills(input.get("skillsRequired")),
         "description": input.get("description"),
-        "postedAt": datetime.utcnow().strftime('%Y-%m-%d'),
+        "postedAt": datetime.utcnow(),
         "status": "Open",
         "posterUserId": user_id,
         "posterName": poster_name if poster_name else None,
@@ -128,7 +136,10 @@ def resolve_create_job(obj, info, input):
         "hiringManagerName": hm_name
     }
     insert_job(doc)
-    return to_job_output(doc)
+    job_stats_service.create_for_job(doc["jobId"])
+    skill_service.record_skills(skill_service.JOB, doc["jobId"], doc["skillsRequired"])
+    embedding_service.index_job(doc)
+    return Job.from_bson(doc)
 
 @mutation.field("updateJob")
 def resolve_update_job(obj, info, jobId, input):
@@ -154,10 +165,18 @@ def resolve_update_job(obj, info, jobId, input):
     if not set_fields:
         raise ValueError("No fields provided to update.")
 
+    previous = None
+    if "skillsRequired" in set_fields:
+        set_fields["skillsRequired"] = skill_service.canonicalize_skills(set_fields["skillsRequired"])
+        previous = find_job_by_id(int(jobId))
+
     updated = update_one_job({"jobId": int(jobId)}, set_fields)
     if not updated:
         raise ValueError(f"Job with ID {jobId} not found for update.")
-    return to_job_output(updated)
+    if previous is not None:
+        skill_service.replace_skills(skill_service.JOB, updated["jobId"], previous.get("skillsRequired"), updated.get("skillsRequired"))
+    embedding_service.index_job(updated)
+    return Job.from_bson(updated)
 
 @mutation.field("deleteJob")
 def resolve_delete_job(obj, info, jobId):
@@ -166,9 +185,13 @@ def resolve_delete_job(obj, info, jobId):
     if user_role != "Recruiter":
         raise ValueError("Permission denied: You must be a Recruiter to delete a job.")
 
+    existing = find_job_by_id(int(jobId))
     count = delete_one_job({"jobId": int(jobId)})
     if count == 0:
         raise ValueError(f"Job with ID {jobId} not found for deletion.")
+    skill_service.forget_item(skill_service.JOB, int(jobId), existing.get("skillsRequired"))
+    embedding_service.remove_job(int(jobId))
+    job_stats_service.delete_for_job(int(jobId))
     return True
 
 @mutation.field("addSkillsToJob")
@@ -182,12 +205,15 @@ def resolve_add_skills_to_job(obj, info, jobId, skills):
         raise ValueError("The 'skills' list cannot be empty.")
 
     # Call our new repository function
+    skills = skill_service.canonicalize_skills(skills)
     updated_job = add_skills_to_job(jobId, skills)
     
     if not updated_job:
         raise ValueError(f"Job with ID {jobId} not found.")
-        
-    return to_job_output(updated_job)
+    skill_service.record_skills(skill_service.JOB, updated_job["jobId"], skills)
+
+    embedding_service.index_job(updated_job)
+    return Job.from_bson(updated_job)
 
 @mutation.field("updateJobByFields")
 def resolve_update_job_by_fields(obj, info, title, input, company=None):
@@ -227,10 +253,15 @@ def resolve_update_job_by_fields(obj, info, title, input, company=None):
         raise ValueError("Multiple jobs matched this criteria. Please be more specific or use a Job ID.")
         
     # If exactly one job matches, proceed with update
+    if "skillsRequired" in set_fields:
+        set_fields["skillsRequired"] = skill_service.canonicalize_skills(set_fields["skillsRequired"])
     updated = update_one_job(q, set_fields)
     if not updated:
         raise ValueError(f"Failed to update job with title '{title}'.")
-    return to_job_output(updated)
+    if "skillsRequired" in set_fields:
+        skill_service.replace_skills(skill_service.JOB, updated["jobId"], matching_jobs[0].get("skillsRequired"), updated.get("skillsRequired"))
+    embedding_service.index_job(updated)
+    return Job.from_bson(updated)
 
 @mutation.field("deleteJobByFields")
 def resolve_delete_job_by_fields(obj, info, title, company=None):
@@ -253,4 +284,8 @@ def resolve_delete_job_by_fields(obj, info, title, company=None):
         
     # If exactly one job matches, proceed with deletion
     count = delete_one_job(q)
+    if count == 1:
+        skill_service.forget_item(skill_service.JOB, matching_jobs[0]["jobId"], matching_jobs[0].get("skillsRequired"))
+        embedding_service.remove_job(matching_jobs[0]["jobId"])
+        job_stats_service.delete_for_job(matching_jobs[0]["jobId"])
     return count == 1
\ No newline at end of file
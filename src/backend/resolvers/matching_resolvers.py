@@ -0,0 +1,90 @@
+# src/backend/resolvers/matching_resolvers.py
+from ariadne import QueryType
+from ..services import embedding_service, ranking_service, job_stats_service
+from ..repository.job_repo import find_jobs, find_job_by_id
+from ..repository.user_repo import find_users, find_users_by_ids
+from ..models.application import Application
+from ..models.job import Job
+from ..models.user import User
+
+query = QueryType()
+
+DEFAULT_K = 10
+MAX_K = 100
+MAX_RANKED = 500
+
+def _clamp_k(k) -> int:
+    return max(1, min(int(k or DEFAULT_K), MAX_K))
+
+@query.field("recommendedJobs")
+def resolve_recommended_jobs(_, info, userId, k=None):
+    user_id = info.context.get("UserID")
+    user_role = info.context.get("user_role")
+    if not user_id:
+        raise PermissionError("Access denied: You must be logged in to view recommendations.")
+    if user_role not in ["Recruiter", "Manager"] and int(userId) != user_id:
+        raise PermissionError("Access denied: Applicants can only view their own recommendations.")
+
+    k = _clamp_k(k)
+    # Over-fetch a little: jobs closed since the last index save are dropped below.
+    hits = embedding_service.recommend_jobs(int(userId), k * 2)
+    jobs = {j["jobId"]: j for j in find_jobs({"jobId": {"$in": [job_id for job_id, _ in hits]}}, None, None)}
+    job_stats_service.prime(info.context, jobs)
+
+    results = []
+    for job_id, score in hits:
+        doc = jobs.get(job_id)
+        if not doc or doc.get("status") == "Closed": continue
+        results.append({"score": round(score, 4), "job": Job.from_bson(doc)})
+        if len(results) == k: break
+    return results
+
+@query.field("recommendedCandidates")
+def resolve_recommended_candidates(_, info, jobId, k=None):
+    user_id = info.context.get("UserID")
+    user_role = info.context.get("user_role")
+    if user_role not in ["Recruiter", "Manager"]:
+        raise PermissionError("Access denied: Only Recruiters or Managers can view candidate recommendations.")
+
+    job = find_job_by_id(int(jobId))
+    if not job: raise ValueError(f"Job {jobId} not found.")
+    # Managers only see jobs delegated to them (FS.X.2)
+    if user_role == "Manager" and job.get("hiringManagerId") != user_id:
+        raise PermissionError("Access denied: You are not the Hiring Manager for this job.")
+
+    k = _clamp_k(k)
+    hits = embedding_service.recommend_candidates(int(jobId), k)
+    users = {u["UserID"]: u for u in find_users({"UserID": {"$in": [uid for uid, _ in hits]}}, None, None)}
+    return [
+        {"score": round(score, 4), "candidate": User.from_bson(users[uid])}
+        for uid, score in hits if uid in users
+    ]
+
+@query.field("rankApplicants")
+def resolve_rank_applicants(_, info, jobId, first=None, weights=None):
+    user_id = info.context.get("UserID")
+    user_role = info.context.get("user_role")
+    if user_role not in ["Recruiter", "Manager"]:
+        raise PermissionError("Access denied: Only Recruiters or Managers can rank applicants.")
+
+    job = find_job_by_id(int(jobId))
+    if not job: raise ValueError(f"Job {jobId} not found.")
+    # Managers only see jobs delegated to them (FS.X.2)
+    if user_role == "Manager" and job.get("hiringManagerId") != user_id:
+        raise PermissionError("Access denied: You are not the Hiring Manager for this job.")
+
+    first = max(1, min(int(first or DEFAULT_K), MAX_RANKED))
+    ranked = ranking_service.rank_applicants(job, first, weights)
+
+    # Full profiles only for the winners
+    users = {u["UserID"]: u for u in find_users_by_ids([r["userId"] for r in ranked])}
+    return [
+        {
+            "score": r["score"],
+            "breakdown": r["breakdown"],
+            "matchedSkills": r["matchedSkills"],
+            "application": Application.from_bson(r["application"]),
+            "candidate": User.from_bson(users[r["userId"]]),
+        }
+        for r in ranked if r["userId"] in users
+    ]
@@ -0,0 +1,64 @@
+# src/backend/resolvers/metrics_resolvers.py
+import statistics
+from datetime import datetime, timedelta
+from ariadne import QueryType
+from ..db import jobs_collection, parse_datetime, to_iso_string, POSTED_AT_FORMAT, SUBMITTED_AT_FORMAT
+from ..services import rollup_service
+
+query = QueryType()
+
+DEFAULT_METRICS_DAYS = 30
+MAX_METRICS_DAYS = 366
+
+GROUP_BY_DIMENSION = {"JOB": "job", "COMPANY": "company", "MANAGER": "manager"}
+
+def _rate(numerator: int, denominator: int):
+    return round(numerator / denominator, 4) if denominator else None
+
+def _parse_range(range_input):
+    if not range_input:
+        end = datetime.utcnow()
+        return end - timedelta(days=DEFAULT_METRICS_DAYS - 1), end
+    try:
+        start, end = parse_datetime(range_input.get("start")), parse_datetime(range_input.get("end"))
+    except ValueError:
+        raise ValueError("range.start and range.end must be ISO 8601 dates.")
+    if not start or not end or end < start:
+        raise ValueError("range.end must not be before range.start.")
+    if (end - start).days >= MAX_METRICS_DAYS:
+        raise ValueError(f"range cannot span more than {MAX_METRICS_DAYS} days.")
+    return start, end
+
+@query.field("hiringMetrics")
+def resolve_hiring_metrics(_, info, range=None, groupBy="COMPANY"):
+    user_role = info.context.get("user_role")
+    user_id = info.context.get("UserID")
+    if user_role not in ["Recruiter", "Manager"]:
+        raise PermissionError("Access denied: Only Recruiters or Managers can view hiring metrics.")
+
+    dim = GROUP_BY_DIMENSION[groupBy]
+    keys = None
+    if user_role == "Manager":
+        # Managers see their own jobs only
+        if dim == "company":
+            raise PermissionError("Access denied: Managers can group hiring metrics by JOB or MANAGER only.")
+        keys = [user_id] if dim == "manager" else jobs_collection().distinct("jobId", {"hiringManagerId": user_id})
+
+    start, end = _parse_range(range)
+    groups = []
+    for g in rollup_service.load_metrics(dim, start, end, keys):
+        samples = g.pop("timeToHireDays")
+        groups.append({
+            **g,
+            "key": str(g["key"]),
+            "inviteToOfferRate": _rate(g["offers"], g["invites"]),
+            "offerToHireRate": _rate(g["hires"], g["offers"]),
+            "medianTimeToHireDays": round(statistics.median(samples), 2) if samples else None,
+            "daily": [{**d, "day": to_iso_string(d["day"], POSTED_AT_FORMAT)} for d in g["daily"]],
+        })
+    return {
+        "start": to_iso_string(rollup_service.day_start(start), POSTED_AT_FORMAT),
+        "end": to_iso_string(rollup_service.day_start(end), POSTED_AT_FORMAT),
+        "asOf": to_iso_string(rollup_service.watermark(), SUBMITTED_AT_FORMAT),
+        "groups": groups,
+    }
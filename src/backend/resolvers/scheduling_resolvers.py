@@ -1,8 +1,10 @@
 from ariadne import QueryType, MutationType, ObjectType
 from datetime import datetime, timedelta
-from ..services import scheduling_service
+from ..services import scheduling_service, calendar_service, event_log_service
 from ..repository import job_repo, user_repo, application_repo
-from ..db import to_user_output
+from ..models.interview import Interview
+from ..models.job import Job
+from ..models.user import User
 
 query = QueryType()
 mutation = MutationType()
@@ -40,6 +42,58 @@ def resolve_find_available_slots(_, info, jobId, candidateId, durationMinutes=30
     )
     return slots
 
+@query.field("findSlotsForJob")
+def resolve_find_slots_for_job(_, info, jobId, durationMinutes=30, numDays=14):
+    user_id = info.context.get("UserID")
+    user_role = info.context.get("user_role")
+    if user_role not in ["Recruiter", "Manager"]:
+        raise PermissionError("Access denied: Only Recruiters or Managers can search slots for a job.")
+
+    job = job_repo.find_job_by_id(jobId)
+    if not job: raise ValueError(f"Job {jobId} not found.")
+    if user_role == "Manager" and job.get("hiringManagerId") != user_id:
+        raise PermissionError("Access denied: You are not the Hiring Manager for this job.")
+
+    interviewer_id = job.get("hiringManagerId") or job.get("posterUserId")
+    if not interviewer_id: raise ValueError("This job has no assigned Hiring Manager or Poster to schedule with.")
+
+    invited = application_repo.find_applications({"jobId": int(jobId), "status": "InterviewInviteSent"})
+    candidate_ids = [a["userId"] for a in invited]
+    if not candidate_ids: return []
+
+    start_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = start_date + timedelta(days=numDays or 14)
+
+    slots = scheduling_service.find_slots_for_candidates(
+        interviewer_id=interviewer_id,
+        candidate_ids=candidate_ids,
+        start_date=start_date,
+        end_date=end_date,
+        duration_minutes=durationMinutes or 30
+    )
+    return [{"candidateId": c, "slots": s} for c, s in slots.items()]
+
+MAX_PANEL_SIZE = 20
+
+@query.field("findPanelSlots")
+def resolve_find_panel_slots(_, info, userIds, candidateId, durationMinutes=30, numDays=14):
+    user_role = info.context.get("user_role")
+    if user_role not in ["Recruiter", "Manager"]:
+        raise PermissionError("Access denied: Only Recruiters or Managers can search panel availability.")
+    if not userIds: raise ValueError("The 'userIds' list cannot be empty.")
+    if len(set(userIds)) > MAX_PANEL_SIZE: raise ValueError(f"A panel can have at most {MAX_PANEL_SIZE} interviewers.")
+
+    start_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = start_date + timedelta(days=numDays or 14)
+
+    return scheduling_service.find_panel_slots(
+        panel_ids=userIds,
+        candidate_id=candidateId,
+        start_date=start_date,
+        end_date=end_date,
+        duration_minutes=durationMinutes or 30
+    )
+
 # --- NEW QUERY (FS.4) ---
 @query.field("myBookedInterviews")
 def resolve_my_booked_interviews(_, info):
@@ -51,14 +105,22 @@ def resolve_my_booked_interviews(_, info):
     
     from ..db import interviews_collection
     # Find interviews where this user is either the Recruiter (Coordinator) or Hiring Manager
-    interviews = list(interviews_collection().find({
+    interviews = interviews_collection().find({
         "$or": [
             {"recruiterId": user_id},
             {"hiringManagerId": user_id}
         ]
-    }))
+    })
     
-    return interviews
+    return [Interview.from_bson(doc) for doc in interviews]
+
+@query.field("myCalendarFeedUrl")
+def resolve_my_calendar_feed_url(_, info):
+    user_id = info.context.get("UserID")
+    if not user_id: raise PermissionError("You must be logged in.")
+    token = calendar_service.feed_token(user_id)
+    if not token: raise ValueError("Calendar subscriptions are not enabled on this server.")
+    return f"/calendar/{user_id}.ics?token={token}"
 
 @mutation.field("setMyAvailability")
 def resolve_set_my_availability(_, info, availability):
@@ -89,14 +151,15 @@ def resolve_book_interview(_, info, jobId, candidateId, startTime, endTime):
     except ValueError:
         raise ValueError("Invalid time format. Use ISO 8601 format.")
     
-    return scheduling_service.book_interview(
+    return Interview.from_bson(scheduling_service.book_interview(
         job_id=jobId,
         candidate_id=candidateId,
         recruiter_id=recruiter_id,
         hiring_manager_id=hiring_manager_id,
         start_time=start_time_dt,
-        end_time=end_time_dt
-    )
+        end_time=end_time_dt,
+        actor=event_log_service.actor_from_context(info)
+    ))
 
 @mutation.field("bookInterviewByNaturalLanguage")
 def resolve_book_interview_nl(_, info, candidateName, jobTitle, startTimeISO, companyName=None):
@@ -128,14 +191,52 @@ def resolve_book_interview_nl(_, info, candidateName, jobTitle, startTimeISO, co
     except ValueError:
         raise ValueError(f"Invalid date format.")
 
-    return scheduling_service.book_interview(
+    return Interview.from_bson(scheduling_service.book_interview(
         job_id=job['jobId'],
         candidate_id=candidate_id,
         recruiter_id=recruiter_id,
         hiring_manager_id=hiring_manager_id,
         start_time=start_dt,
-        end_time=end_dt
+        end_time=end_dt,
+        actor=event_log_service.actor_from_context(info)
+    ))
+
+MAX_AUTO_SCHEDULE = 500
+
+@mutation.field("autoScheduleInterviews")
+def resolve_auto_schedule_interviews(_, info, jobId, candidateIds, durationMinutes=30, window=None):
+    user_id = info.context.get("UserID")
+    user_role = info.context.get("user_role")
+    if not user_id or user_role != "Manager":
+        raise PermissionError("Access denied: Only Managers can book interviews. (FS.X.3)")
+    if not candidateIds: raise ValueError("The 'candidateIds' list cannot be empty.")
+    if len(set(candidateIds)) > MAX_AUTO_SCHEDULE:
+        raise ValueError(f"At most {MAX_AUTO_SCHEDULE} candidates can be scheduled at once.")
+
+    job = job_repo.find_job_by_id(jobId)
+    if not job: raise ValueError(f"Job {jobId} not found.")
+    if job.get("hiringManagerId") not in (None, user_id):
+        raise PermissionError("Access denied: You are not the Hiring Manager for this job.")
+
+    if window:
+        try:
+            start_date = scheduling_service.parse_iso(window["start"])
+            end_date = scheduling_service.parse_iso(window["end"])
+        except ValueError:
+            raise ValueError("Invalid window. Use ISO 8601 format.")
+        if end_date < start_date: raise ValueError("The window must end after it starts.")
+    else:
+        start_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = start_date + timedelta(days=14)
+
+    duration = durationMinutes or 30
+    if duration <= 0: raise ValueError("durationMinutes must be positive.")
+
+    result = scheduling_service.auto_schedule_interviews(
+        job, candidateIds, start_date, end_date, duration, actor=event_log_service.actor_from_context(info)
     )
+    result["assignments"] = [Interview.from_bson(doc) for doc in result["assignments"]]
+    return result
 
 # --- NEW MUTATION (FS.2) - Applicant-driven booking (not restricted by FS.X) ---
 @mutation.field("selectInterviewSlot")
@@ -185,15 +286,16 @@ def resolve_select_interview_slot(_, info, appId, startTime):
         recruiter_id=recruiter_id,
         hiring_manager_id=hiring_manager_id,
         start_time=start_time_dt,
-        end_time=end_time_dt
+        end_time=end_time_dt,
+        actor=event_log_service.actor_from_context(info)
     )
     
-    return booking
+    return Interview.from_bson(booking)
 
 @interview.field("job")
 def resolve_interview_job(interview_obj, _):
-    return job_repo.to_job_output(job_repo.find_job_by_id(interview_obj.get("jobId")))
+    return Job.from_bson(job_repo.find_job_by_id(interview_obj.get("jobId")))
 
 @interview.field("candidate")
 def resolve_interview_candidate(interview_obj, _):
-    return user_repo.to_user_output(user_repo.find_one_by_id(interview_obj.get("candidateId")))
+    return User.from_bson(user_repo.find_one_by_id(interview_obj.get("candidateId")))
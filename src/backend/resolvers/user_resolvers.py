@@ -3,40 +3,64 @@ from ariadne import QueryType, MutationType, ObjectType
 from datetime import datetime
 from ..validators.common_validators import require_non_empty_str, validate_date_str, clean_update_input
 from ..repository import user_repo, resume_repo
+from ..services import skill_service, embedding_service
 from ..db import next_user_id
+from ..models.user import User
 
 query = QueryType()
 mutation = MutationType()
 user_object = ObjectType("User")
 
 @query.field("users")
-def resolve_users(*_, limit=None, skip=None, firstName=None, lastName=None, dob=None, skills=None, isUSCitizen=None, yearsOfExperience_gte=None):
+def resolve_users(*_, limit=None, skip=None, firstName=None, lastName=None, dob=None, skills=None, skillsAny=None, isUSCitizen=None, yearsOfExperience_gte=None):
     if dob: dob = validate_date_str(dob)
-    q = user_repo.build_filter(firstName, lastName, dob, skills, is_us_citizen=isUSCitizen, years_of_experience_gte=yearsOfExperience_gte)
-    docs = user_repo.find_users(q, skip, limit)
-    return [user_repo.to_user_output(d) for d in docs]
+    q = user_repo.build_filter(firstName, lastName, dob, None, is_us_citizen=isUSCitizen, years_of_experience_gte=yearsOfExperience_gte)
+    if skills or skillsAny:
+        # AND/OR skill filters are answered from the posting lists; fall back to a multikey query until they are built.
+        ids = skill_service.find_ids(skill_service.USER, all_of=skills, any_of=skillsAny)
+        if ids is None:
+            if skills: q["skills"] = {"$all": skill_service.canonicalize_skills(skills)}
+            if skillsAny: q.setdefault("$and", []).append({"skills": {"$in": skill_service.canonicalize_skills(skillsAny)}})
+        elif not q:
+            # Skill-only query: page over the sorted id list instead of shipping it all in $in.
+            start = int(skip or 0)
+            ids = ids[start:start + int(limit)] if limit is not None else ids[start:]
+            q, skip, limit = {"UserID": {"$in": ids}}, None, None
+        else:
+            q["UserID"] = {"$in": ids}
+    # A generator: graphql-core consumes it batch by batch, so raw documents never pile up.
+    return (User.from_bson(d) for batch in user_repo.iter_users(q, skip, limit) for d in batch)
 
 @query.field("userById")
 def resolve_user_by_id(*_, UserID):
     doc = user_repo.find_one_by_id(int(UserID))
-    return user_repo.to_user_output(doc)
+    return User.from_bson(doc)
 
 @mutation.field("createUser")
 def resolve_create_user(*_, input):
     email = require_non_empty_str(input.get("email"), "email")
     if user_repo.find_user_by_email(email): raise ValueError(f"A user with the email '{email}' already exists.")
-    doc = {"UserID": next_user_id(), "email": email.lower(), "password": None, "firstName": require_non_empty_str(input.get("firstName"), "firstName"), "lastName": require_non_empty_str(input.get("lastName"), "lastName"), "role": require_non_empty_str(input.get("role"), "role"), "createdAt": datetime.utcnow().isoformat(), "phone_number": input.get("phone_number"), "city": input.get("city"), "state_province": input.get("state_province"), "country": input.get("country"), "linkedin_profile": input.get("linkedin_profile"), "portfolio_url": input.get("portfolio_url"), "highest_qualification": input.get("highest_qualification"), "years_of_experience": input.get("years_of_experience"), "dob": validate_date_str(input.get("dob")), "skills": input.get("skills", []), "professionalTitle": input.get("professionalTitle"), "is_us_citizen": input.get("is_us_citizen"), "highest_degree_year": input.get("highest_degree_year")}
+    doc = {"UserID": next_user_id(), "email": email.lower(), "password": None, "firstName": require_non_empty_str(input.get("firstName"), "firstName"), "lastName": require_non_empty_str(input.get("lastName"), "lastName"), "role": require_non_empty_str(input.get("role"), "role"), "createdAt": datetime.utcnow(), "phone_number": input.get("phone_number"), "city": input.get("city"), "state_province": input.get("state_province"), "country": input.get("country"), "linkedin_profile": input.get("linkedin_profile"), "portfolio_url": input.get("portfolio_url"), "highest_qualification": input.get("highest_qualification"), "years_of_experience": input.get("years_of_experience"), "dob": validate_date_str(input.get("dob")), "skills": skill_service.canonicalize_skills(input.get("skills")), "professionalTitle": input.get("professionalTitle"), "is_us_citizen": input.get("is_us_citizen"), "highest_degree_year": input.get("highest_degree_year")}
     user_repo.insert_user(doc)
-    return user_repo.to_user_output(doc)
+    skill_service.record_skills(skill_service.USER, doc["UserID"], doc["skills"])
+    embedding_service.index_candidate(doc["UserID"])
+    return User.from_bson(doc)
 
 @mutation.field("updateUser")
 def resolve_update_user(*_, UserID, input):
     if "dob" in input and input.get("dob") is not None: input["dob"] = validate_date_str(input["dob"])
     set_fields = clean_update_input(input)
     if not set_fields: raise ValueError("No fields provided to update")
+    previous = None
+    if "skills" in set_fields:
+        set_fields["skills"] = skill_service.canonicalize_skills(set_fields["skills"])
+        previous = user_repo.find_one_by_id(int(UserID))
     updated = user_repo.update_one({"UserID": int(UserID)}, set_fields)
     if not updated: raise ValueError(f"User with ID {UserID} not found for update.")
-    return user_repo.to_user_output(updated)
+    if previous is not None:
+        skill_service.replace_skills(skill_service.USER, updated["UserID"], previous.get("skills"), updated.get("skills"))
+    embedding_service.index_candidate(updated["UserID"])
+    return User.from_bson(updated)
 
 @mutation.field("updateUserByName")
 def resolve_update_user_by_name(*_, firstName=None, lastName=None, input=None):
@@ -47,12 +71,21 @@ def resolve_update_user_by_name(*_, firstName=None, lastName=None, input=None):
     if len(matches) > 1: raise ValueError("Multiple users matched; please be more specific to target a single user")
     set_fields = clean_update_input(input or {})
     if not set_fields: raise ValueError("No fields provided to update")
+    if "skills" in set_fields: set_fields["skills"] = skill_service.canonicalize_skills(set_fields["skills"])
     updated = user_repo.update_one({"UserID": matches[0]["UserID"]}, set_fields)
-    return user_repo.to_user_output(updated)
+    if "skills" in set_fields:
+        skill_service.replace_skills(skill_service.USER, updated["UserID"], matches[0].get("skills"), updated.get("skills"))
+    embedding_service.index_candidate(updated["UserID"])
+    return User.from_bson(updated)
 
 @mutation.field("deleteUser")
 def resolve_delete_user(*_, UserID):
-    return user_repo.delete_one({"UserID": int(UserID)}) == 1
+    existing = user_repo.find_one_by_id(int(UserID))
+    deleted = user_repo.delete_one({"UserID": int(UserID)}) == 1
+    if deleted:
+        skill_service.forget_item(skill_service.USER, int(UserID), existing.get("skills"))
+        embedding_service.remove_candidate(int(UserID))
+    return deleted
 
 @mutation.field("deleteUserByFields")
 def resolve_delete_user_by_fields(*_, firstName=None, lastName=None, dob=None):
@@ -61,7 +94,11 @@ def resolve_delete_user_by_fields(*_, firstName=None, lastName=None, dob=None):
     matches = user_repo.find_users(q, None, None)
     if len(matches) == 0: return False
     if len(matches) > 1: raise ValueError("Multiple users matched; add more filters to target a single user")
-    return user_repo.delete_one(q) == 1
+    deleted = user_repo.delete_one(q) == 1
+    if deleted:
+        skill_service.forget_item(skill_service.USER, matches[0]["UserID"], matches[0].get("skills"))
+        embedding_service.remove_candidate(matches[0]["UserID"])
+    return deleted
 
 @mutation.field("addSkillsToUser")
 def resolve_add_skills_to_user(obj, info, UserID, skills):
@@ -70,12 +107,15 @@ def resolve_add_skills_to_user(obj, info, UserID, skills):
     if not (logged_in_user and logged_in_user.get("UserID") == UserID) and user_role != "Recruiter":
         raise ValueError("Permission denied: You can only add skills to your own profile.")
     if not skills: raise ValueError("The 'skills' list cannot be empty.")
+    skills = skill_service.canonicalize_skills(skills)
     updated_user = user_repo.add_skills_to_user(UserID, skills)
     if not updated_user: raise ValueError(f"User with ID {UserID} not found.")
-    return user_repo.to_user_output(updated_user)
+    skill_service.record_skills(skill_service.USER, updated_user["UserID"], skills)
+    embedding_service.index_candidate(updated_user["UserID"])
+    return User.from_bson(updated_user)
 
 @user_object.field("resumes")
 def resolve_user_resumes(user_obj, info):
     user_id = user_obj.get("UserID")
     if not user_id: return []
-    return resume_repo.find_resumes_by_user(user_id)
\ No newline at end of file
+    return (r for batch in resume_repo.iter_resumes_by_user(user_id) for r in batch)
\ No newline at end of file
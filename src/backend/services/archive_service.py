@@ -0,0 +1,90 @@
+# src/backend/services/archive_service.py
+"""
+Moves closed jobs and their finished applications into cold collections.
+
+    jobs         -> jobs_archive           status Closed, closedAt older than the
+                                           retention, no application still in progress
+    applications -> applications_archive   every application of such a job
+
+Applications only ever move together with their job. An open job keeps
+all its applications hot, so the duplicate-application check and
+Job.applicants always see a candidate's history, and hot applications
+never point at an archived job. Every batch is one transaction (read,
+copy with archivedAt, delete), so a document is never in both places or
+in neither; write conflicts with live updates are retried by
+with_transaction. Jobs that predate closedAt age by postedAt instead.
+
+Queries reach archived documents only with includeArchived.
+"""
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from pymongo import ReplaceOne
+
+from ..db import (
+    get_client, jobs_collection, applications_collection,
+    jobs_archive_collection, applications_archive_collection,
+)
+
+ARCHIVE_RETENTION_DAYS = int(os.getenv("ARCHIVE_RETENTION_DAYS", 180))
+# Jobs move with all their applications, so transactions are kept small.
+ARCHIVE_JOB_BATCH_SIZE = int(os.getenv("ARCHIVE_JOB_BATCH_SIZE", 25))
+
+TERMINAL_STATUSES = ["Rejected", "Hired", "Offer Rejected"]
+
+def _older_than(field: str, fallback: str, cutoff: datetime) -> dict:
+    return {"$or": [{field: {"$lt": cutoff}}, {field: {"$exists": False}, fallback: {"$lt": cutoff}}]}
+
+def jobs_filter(cutoff: datetime) -> dict:
+    return {"status": "Closed", **_older_than("closedAt", "postedAt", cutoff)}
+
+def _move(session, source, target, docs: list, key: str, archived_at: datetime) -> int:
+    if not docs: return 0
+    # Replace-upsert on the business key: a batch retried after a partial failure is harmless.
+    target.bulk_write(
+        [ReplaceOne({key: d[key]}, {**d, "archivedAt": archived_at}, upsert=True) for d in docs],
+        ordered=False, session=session,
+    )
+    source.delete_many({"_id": {"$in": [d["_id"] for d in docs]}}, session=session)
+    return len(docs)
+
+def _archive_job_batch(session, cutoff: datetime, batch_size: int, blocked: set) -> Dict[str, int]:
+    q = jobs_filter(cutoff)
+    if blocked: q["jobId"] = {"$nin": list(blocked)}
+    jobs = list(jobs_collection().find(q, session=session).limit(batch_size))
+    if not jobs: return {"jobs": 0, "applications": 0, "blocked": 0, "seen": 0}
+
+    job_ids = [j["jobId"] for j in jobs]
+    busy = set(applications_collection().distinct(
+        "jobId", {"jobId": {"$in": job_ids}, "status": {"$nin": TERMINAL_STATUSES}}, session=session
+    ))
+    movable = [j for j in jobs if j["jobId"] not in busy]
+    apps = list(applications_collection().find({"jobId": {"$in": [j["jobId"] for j in movable]}}, session=session))
+
+    archived_at = datetime.utcnow()
+    moved_apps = _move(session, applications_collection(), applications_archive_collection(), apps, "appId", archived_at)
+    moved_jobs = _move(session, jobs_collection(), jobs_archive_collection(), movable, "jobId", archived_at)
+    blocked.update(busy)
+    return {"jobs": moved_jobs, "applications": moved_apps, "blocked": len(busy), "seen": len(jobs)}
+
+def run(retention_days: int = ARCHIVE_RETENTION_DAYS, job_batch_size: int = ARCHIVE_JOB_BATCH_SIZE,
+        now: Optional[datetime] = None) -> Dict[str, int]:
+    """Archives closed jobs past the retention age with their applications, one transaction per batch. Returns counts."""
+    cutoff = (now or datetime.utcnow()) - timedelta(days=retention_days)
+    stats = {"jobs": 0, "jobApplications": 0, "blockedJobs": 0}
+
+    with get_client().start_session() as session:
+        blocked: set = set()  # Closed jobs that still have applications in progress
+        while True:
+            batch = session.with_transaction(lambda s: _archive_job_batch(s, cutoff, job_batch_size, blocked))
+            stats["jobs"] += batch["jobs"]
+            stats["jobApplications"] += batch["applications"]
+            stats["blockedJobs"] += batch["blocked"]
+            if batch["seen"] < job_batch_size: break
+    return stats
+
+def pending(retention_days: int = ARCHIVE_RETENTION_DAYS, now: Optional[datetime] = None) -> Dict[str, int]:
+    """What run() would pick up, without moving anything."""
+    cutoff = (now or datetime.utcnow()) - timedelta(days=retention_days)
+    return {"jobs": jobs_collection().count_documents(jobs_filter(cutoff))}
@@ -0,0 +1,167 @@
+# src/backend/services/availability_service.py
+"""
+Weekly availability and busy time as bitmaps.
+
+A week is 7 x 96 bits (one bit per 15 minutes, Monday 00:00 = bit 0),
+held in a Python int. Availability is compiled once when it is saved and
+stored on the schedule document. Busy bitmaps are built from bookings per
+(person, week), cached in-process and validated against the schedule's
+_id and bookingsVersion, which book_interview increments.
+
+The bitmap path is only taken when it provably gives the same slots as
+the interval path: granule-aligned rule times and duration, and rules per
+day that are sorted, non-overlapping and non-touching (so each run of set
+bits is exactly one rule). Everything else falls back to intervals.
+"""
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+GRANULE_MINUTES = 15
+BITS_PER_DAY = 24 * 60 // GRANULE_MINUTES
+BITS_PER_WEEK = 7 * BITS_PER_DAY
+DAY_MASK = (1 << BITS_PER_DAY) - 1
+DAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+BUSY_CACHE_MAX_ENTRIES = 10000
+
+# --- Availability ---
+def _granule(time_str: str) -> Optional[int]:
+    """'HH:MM' -> granule index within the day, or None when not on a granule boundary."""
+    t = datetime.strptime(time_str, "%H:%M")
+    minutes = t.hour * 60 + t.minute
+    return minutes // GRANULE_MINUTES if minutes % GRANULE_MINUTES == 0 else None
+
+def compile_availability(availability: list) -> Tuple[int, bool]:
+    """
+    Returns (week_bitmap, exact). exact is False when the bitmap cannot reproduce the
+    interval path slot-for-slot (unaligned times, malformed/overlapping/touching rules).
+    """
+    bitmap, exact = 0, True
+    per_day: Dict[int, List[Tuple[int, int]]] = {}
+    for rule in availability or []:
+        try:
+            day = DAY_NAMES.index(rule.get("dayOfWeek", "").lower())
+            start, end = _granule(rule["startTime"]), _granule(rule["endTime"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            exact = False
+            continue
+        if start is None or end is None:
+            exact = False
+            continue
+        if end <= start: continue  # Produces no slots on either path
+        per_day.setdefault(day, []).append((start, end))
+        bitmap |= ((1 << (end - start)) - 1) << (day * BITS_PER_DAY + start)
+
+    for windows in per_day.values():
+        for (_, prev_end), (next_start, _) in zip(windows, windows[1:]):
+            if next_start <= prev_end: exact = False  # Unsorted, overlapping or touching
+    return bitmap, exact
+
+def to_hex(bitmap: int) -> str:
+    return format(bitmap, "x")
+
+def from_hex(value: Optional[str]) -> int:
+    return int(value, 16) if value else 0
+
+@lru_cache(maxsize=1024)
+def slot_start_masks(availability_hex: str, slot_granules: int) -> Tuple[int, ...]:
+    """
+    Per weekday, the bits where a slot of `slot_granules` may start: every run of
+    available bits is stepped from its first bit in slot-sized strides, like the rules are.
+    """
+    week = from_hex(availability_hex)
+    masks = []
+    for day in range(7):
+        bits = (week >> (day * BITS_PER_DAY)) & DAY_MASK
+        mask, i = 0, 0
+        while i < BITS_PER_DAY:
+            if not (bits >> i) & 1:
+                i += 1
+                continue
+            run_end = i
+            while run_end < BITS_PER_DAY and (bits >> run_end) & 1: run_end += 1
+            pos = i
+            while pos + slot_granules <= run_end:
+                mask |= 1 << pos
+                pos += slot_granules
+            i = run_end
+        masks.append(mask)
+    return tuple(masks)
+
+def blocked_starts(busy: int, slot_granules: int) -> int:
+    """Bits i where a slot starting at i would touch a busy bit in [i, i + slot_granules)."""
+    blocked, width = busy, 1
+    # Shift-or doubling: after each step `blocked` covers `width` granules to the right.
+    while width < slot_granules:
+        shift = min(width, slot_granules - width)
+        blocked |= blocked >> shift
+        width += shift
+    return blocked
+
+# --- Busy bitmaps ---
+def week_start(d: datetime) -> datetime:
+    day = d.replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday())
+
+def build_week_bitmaps(intervals: Iterable[Tuple[datetime, datetime]], weeks: Iterable[datetime]) -> Dict[datetime, int]:
+    """Marks every granule each (start, end) interval overlaps, bucketed by the requested week starts."""
+    granule = timedelta(minutes=GRANULE_MINUTES)
+    bitmaps = {w: 0 for w in weeks}
+    for start, end in intervals:
+        if end <= start: continue
+        w = week_start(start)
+        first = int((start - w) // granule)
+        last = int(-((w - end) // granule))  # ceil
+        for bit in range(first, last):
+            week = w + timedelta(days=7 * (bit // BITS_PER_WEEK))
+            if week in bitmaps:
+                bitmaps[week] |= 1 << (bit % BITS_PER_WEEK)
+    return bitmaps
+
+_busy_cache: Dict[Tuple[int, datetime], Tuple[Any, int]] = {}
+_busy_lock = threading.Lock()
+
+def get_cached_busy(person_id: int, week: datetime, version) -> Optional[int]:
+    with _busy_lock:
+        entry = _busy_cache.get((person_id, week))
+    return entry[1] if entry and entry[0] == version else None
+
+def put_cached_busy(person_id: int, week: datetime, version, bitmap: int):
+    with _busy_lock:
+        if len(_busy_cache) >= BUSY_CACHE_MAX_ENTRIES: _busy_cache.clear()
+        _busy_cache[(person_id, week)] = (version, bitmap)
+
+def invalidate_busy(person_ids: Iterable[int]):
+    """Local fast path; other processes notice via the bookingsVersion bump."""
+    ids = set(person_ids)
+    with _busy_lock:
+        for key in [k for k in _busy_cache if k[0] in ids]:
+            del _busy_cache[key]
+
+# --- Slot search ---
+def day_bits(week_bitmaps: Dict[datetime, int], day: datetime) -> int:
+    return (week_bitmaps.get(week_start(day), 0) >> (day.weekday() * BITS_PER_DAY)) & DAY_MASK
+
+def open_slots(availability_hex: str, busy_weeks: Dict[datetime, int], start_date: datetime, end_date: datetime,
+               duration_minutes: int, now: datetime) -> List[str]:
+    """Bitmap slot search; day iteration and the 'slot_start > now' rule mirror the interval path."""
+    slot_granules = duration_minutes // GRANULE_MINUTES
+    masks = slot_start_masks(availability_hex, slot_granules)
+    granule = timedelta(minutes=GRANULE_MINUTES)
+    result = []
+    current = start_date
+    while current <= end_date:
+        day = current.replace(hour=0, minute=0, second=0, microsecond=0)
+        candidates = masks[day.weekday()] & ~blocked_starts(day_bits(busy_weeks, day), slot_granules)
+        if candidates and day <= now:
+            past = int((now - day) // granule) + 1  # First bit whose start is strictly after now
+            candidates &= ~((1 << past) - 1) if past < BITS_PER_DAY else 0
+        while candidates:
+            low = candidates & -candidates
+            bit = low.bit_length() - 1
+            result.append((day + bit * granule).isoformat())
+            candidates ^= low
+        current += timedelta(days=1)
+    return result
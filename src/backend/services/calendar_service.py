@@ -0,0 +1,139 @@
+# src/backend/services/calendar_service.py
+"""
+iCalendar (RFC 5545) feed of a person's interviews.
+
+Interviews carry an updatedAt timestamp. The newest updatedAt among a
+person's interviews is the calendar's version: it drives the ETag,
+Last-Modified and the incremental `since` sync token. Because that is a
+single indexed lookup, an unchanged calendar costs one query and no feed
+rendering.
+"""
+import os
+import hmac
+import hashlib
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from ..db import interviews_collection, jobs_collection, users_collection
+
+CALENDAR_FEED_SECRET = os.getenv("CALENDAR_FEED_SECRET")
+CALENDAR_PRODID = "-//JAP//Interview Calendar//EN"
+CALENDAR_DOMAIN = os.getenv("CALENDAR_UID_DOMAIN", "jap.local")
+
+_EPOCH = datetime(1970, 1, 1)
+
+# --- Access tokens (calendar clients cannot send X-User-* headers) ---
+def feed_token(user_id: int) -> Optional[str]:
+    """Per-user token for subscription URLs; None when CALENDAR_FEED_SECRET is not configured."""
+    if not CALENDAR_FEED_SECRET: return None
+    return hmac.new(CALENDAR_FEED_SECRET.encode(), str(int(user_id)).encode(), hashlib.sha256).hexdigest()[:32]
+
+def verify_feed_token(user_id: int, token: Optional[str]) -> bool:
+    expected = feed_token(user_id)
+    return bool(expected and token) and hmac.compare_digest(expected, token)
+
+# --- Versioning ---
+def _participant_filter(user_id: int) -> dict:
+    return {"$or": [{"recruiterId": user_id}, {"hiringManagerId": user_id}, {"candidateId": user_id}]}
+
+def last_updated(user_id: int) -> Optional[datetime]:
+    """Newest updatedAt among the person's interviews (index-backed sort + limit 1), or None."""
+    latest = list(interviews_collection().find(
+        _participant_filter(user_id), {"_id": 0, "updatedAt": 1}
+    ).sort("updatedAt", -1).limit(1))
+    return latest[0].get("updatedAt") if latest else None
+
+def to_sync_token(moment: Optional[datetime]) -> str:
+    """Opaque sync token: milliseconds since the epoch (BSON datetime precision)."""
+    return str(int((moment - _EPOCH).total_seconds() * 1000)) if moment else "0"
+
+def from_sync_token(token: str) -> datetime:
+    try:
+        millis = int(token)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid 'since' sync token.")
+    if millis < 0: raise ValueError("Invalid 'since' sync token.")
+    try:
+        return datetime.utcfromtimestamp(millis / 1000)
+    except (OverflowError, OSError, ValueError):
+        # Past datetime.max or the platform's time_t range
+        raise ValueError("Invalid 'since' sync token.")
+
+def changed_since(moment: Optional[datetime], since: datetime) -> bool:
+    return moment is not None and int(to_sync_token(moment)) > int(to_sync_token(since))
+
+def etag_for(user_id: int, moment: Optional[datetime], since: Optional[str] = None) -> str:
+    # Incremental responses differ by token, so the token is part of the entity tag.
+    return f'"{int(user_id)}-{to_sync_token(moment)}{"-" + since if since else ""}"'
+
+# --- Rendering ---
+def _escape(text) -> str:
+    return (str(text or "").replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n"))
+
+def _fold(line: str) -> List[str]:
+    """Splits a content line into 75-octet pieces; continuation lines start with a space."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75: return [line]
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80: end -= 1  # Never split a UTF-8 sequence
+        parts.append(("" if not parts else " ") + encoded[start:end].decode("utf-8"))
+        start, limit = end, 74
+    return parts
+
+def _utc(moment: datetime) -> str:
+    return moment.strftime("%Y%m%dT%H%M%SZ")
+
+def render_calendar(interviews: List[dict], jobs: dict, users: dict, name: str) -> str:
+    lines = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{CALENDAR_PRODID}", "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH", f"X-WR-CALNAME:{_escape(name)}",
+    ]
+    for i in interviews:
+        job = jobs.get(i.get("jobId")) or {}
+        cand = users.get(i.get("candidateId")) or {}
+        candidate_name = " ".join(p for p in (cand.get("firstName"), cand.get("lastName")) if p) or f"Candidate {i.get('candidateId')}"
+        summary = f"Interview: {candidate_name} - {job.get('title') or 'Job ' + str(i.get('jobId'))}"
+        if job.get("company"): summary += f" ({job['company']})"
+        description = f"Interview #{i['interviewId']} for job #{i.get('jobId')}."
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:interview-{i['interviewId']}@{CALENDAR_DOMAIN}",
+            f"DTSTAMP:{_utc(i.get('updatedAt') or i['startTime'])}",
+            f"LAST-MODIFIED:{_utc(i.get('updatedAt') or i['startTime'])}",
+            f"DTSTART:{_utc(i['startTime'])}",
+            f"DTEND:{_utc(i['endTime'])}",
+            f"SUMMARY:{_escape(summary)}",
+            f"DESCRIPTION:{_escape(description)}",
+            "STATUS:CONFIRMED",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(folded for line in lines for folded in _fold(line)) + "\r\n"
+
+def build_feed(user_id: int, since: Optional[datetime] = None) -> Tuple[str, int]:
+    """
+    Renders the person's interviews (only those updated after `since` when given).
+    Returns (ics_text, event_count). Jobs and candidates are fetched with one $in each.
+    """
+    from ..services.scheduling_service import parse_iso
+
+    q = _participant_filter(user_id)
+    # Tokens have millisecond resolution: "after since" means from the next millisecond on.
+    if since is not None: q = {"$and": [q, {"updatedAt": {"$gte": since + timedelta(milliseconds=1)}}]}
+    interviews = []
+    for doc in interviews_collection().find(q, {"_id": 0}).sort("startTime", 1):
+        # Rows not yet migrated by scripts/migrate_datetimes.py
+        doc["startTime"], doc["endTime"] = parse_iso(doc.get("startTime")), parse_iso(doc.get("endTime"))
+        if doc["startTime"] and doc["endTime"]: interviews.append(doc)
+
+    job_ids = list({i.get("jobId") for i in interviews})
+    user_ids = list({i.get("candidateId") for i in interviews} | {int(user_id)})
+    jobs = {j["jobId"]: j for j in jobs_collection().find({"jobId": {"$in": job_ids}}, {"_id": 0, "jobId": 1, "title": 1, "company": 1})}
+    users = {u["UserID"]: u for u in users_collection().find({"UserID": {"$in": user_ids}}, {"_id": 0, "UserID": 1, "firstName": 1, "lastName": 1})}
+
+    owner = users.get(int(user_id)) or {}
+    name = "Interviews" + (f" - {owner['firstName']}" if owner.get("firstName") else "")
+    return render_calendar(interviews, jobs, users, name), len(interviews)
@@ -187,4 +187,18 @@ def send_offer_acceptance_notification(to_email: str, manager_name: str, candida
     <p>Best regards,<br/>JobChat.AI Automated System</p>
     """
     if _send_email(to_email, subject, html_body):
-        _audit_email_success(app_id, "OfferAccepted")
\ No newline at end of file
+        _audit_email_success(app_id, "OfferAccepted")
+# --- NEW FUNCTION (Interview Reminders) ---
+def send_interview_reminder(to_email: str, recipient_name: str, job_title: str, company: str, start_time: str, other_party: str) -> bool:
+    """
+    Reminds a participant of an upcoming interview. Returns whether it was sent, so the
+    reminder worker can retry; delivery is tracked on the reminder, not the application.
+    """
+    subject = f"Reminder: Interview for {job_title} at {start_time} UTC"
+    html_body = f"""
+    <p>Hi {recipient_name},</p>
+    <p>This is a reminder of your upcoming interview for the <strong>{job_title}</strong> position at <strong>{company}</strong>.</p>
+    <p><strong>When:</strong> {start_time} UTC<br/><strong>With:</strong> {other_party}</p>
+    <p>Best regards,<br/>JobChat.AI Automated System</p>
+    """
+    return _send_email(to_email, subject, html_body)
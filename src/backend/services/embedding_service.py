@@ -0,0 +1,352 @@
+# src/backend/services/embedding_service.py
+"""
+CPU-only candidate <-> job matching.
+
+Jobs and candidates are encoded with a hashed TF-IDF encoder into fixed-size,
+L2-normalised float32 vectors. Each side lives in an in-memory NumPy matrix
+(persisted to EMBEDDING_INDEX_DIR), so matching one query against every job
+is a single matrix-vector product followed by an argpartition.
+"""
+import os
+import re
+import math
+import zlib
+import logging
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", 512))
+EMBEDDING_INDEX_DIR = os.getenv("EMBEDDING_INDEX_DIR", os.path.join(os.path.dirname(__file__), '..', 'embeddings'))
+EMBEDDING_SAVE_DELAY = float(os.getenv("EMBEDDING_SAVE_DELAY", 5))
+REBUILD_BATCH_SIZE = 1000
+
+# Field weights: skills dominate, then titles, then free text.
+SKILL_WEIGHT, TITLE_WEIGHT, TEXT_WEIGHT = 3.0, 2.0, 1.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+_STOPWORDS = frozenset("a an and are as at be by for from has have in is it of on or our the to we with you your will this that".split())
+
+# --- Encoder ---
+@lru_cache(maxsize=200000)
+def _bucket(feature: str) -> Tuple[int, float]:
+    """Stable feature hashing (Python's hash() is salted per process); the sign bit halves collision bias."""
+    h = zlib.crc32(feature.encode("utf-8"))
+    return h % EMBEDDING_DIM, (1.0 if (h >> 31) & 1 else -1.0)
+
+def _text_features(text: Optional[str], weight: float, counts: Counter):
+    if not text: return
+    tokens = [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+    for t in tokens: counts[t] += weight
+    for a, b in zip(tokens, tokens[1:]): counts[f"{a} {b}"] += weight
+
+def _skill_features(skills: Optional[Iterable[str]], counts: Counter):
+    for skill in skills or []:
+        if not isinstance(skill, str) or not skill.strip(): continue
+        counts[f"skill:{skill.strip().lower()}"] += SKILL_WEIGHT
+        _text_features(skill, SKILL_WEIGHT / 2, counts)
+
+def job_features(job: dict) -> Counter:
+    counts: Counter = Counter()
+    _text_features(job.get("title"), TITLE_WEIGHT, counts)
+    _skill_features(job.get("skillsRequired"), counts)
+    _text_features(job.get("description"), TEXT_WEIGHT, counts)
+    return counts
+
+def _seniority(years) -> Optional[str]:
+    """Maps years of experience onto the words job titles use, so experience lands in the shared vocabulary."""
+    if not isinstance(years, (int, float)): return None
+    if years < 2: return "junior entry level"
+    if years < 5: return "mid level"
+    if years < 10: return "senior"
+    return "senior lead principal"
+
+def candidate_features(user: dict, resumes: Optional[List[dict]] = None) -> Counter:
+    counts: Counter = Counter()
+    _text_features(user.get("professionalTitle"), TITLE_WEIGHT, counts)
+    _text_features(_seniority(user.get("years_of_experience")), TEXT_WEIGHT, counts)
+    _skill_features(user.get("skills"), counts)
+    _text_features(user.get("highest_qualification"), TEXT_WEIGHT, counts)
+    for resume in resumes or []:
+        _skill_features(resume.get("skills"), counts)
+        _text_features(resume.get("parsedTextSnippet"), TEXT_WEIGHT, counts)
+    return counts
+
+def encode(feature_counts: List[Counter], idf: Optional[np.ndarray] = None) -> np.ndarray:
+    """Encodes a batch of feature counters into an (n, EMBEDDING_DIM) float32 matrix of unit vectors."""
+    rows, cols, vals = [], [], []
+    for row, counts in enumerate(feature_counts):
+        for feature, tf in counts.items():
+            col, sign = _bucket(feature)
+            rows.append(row)
+            cols.append(col)
+            vals.append(sign * (1.0 + math.log(tf)) if tf >= 1 else sign * tf)
+    matrix = np.zeros((len(feature_counts), EMBEDDING_DIM), dtype=np.float32)
+    if rows:
+        np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), np.asarray(vals, dtype=np.float32))
+    if idf is not None:
+        matrix *= idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+def compute_idf(matrix: np.ndarray) -> np.ndarray:
+    """Bucket-level smoothed IDF, frozen into the index at rebuild time."""
+    df = np.count_nonzero(matrix, axis=0).astype(np.float32)
+    n = float(matrix.shape[0])
+    return (np.log((1.0 + n) / (1.0 + df)) + 1.0).astype(np.float32)
+
+# --- Index ---
+class VectorIndex:
+    """Growable float32 matrix of unit vectors keyed by integer ids, with batched top-k cosine search."""
+
+    def __init__(self, name: str, dim: int = EMBEDDING_DIM):
+        self.name = name
+        self.dim = dim
+        self.idf = np.ones(dim, dtype=np.float32)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        self._size = 0
+        self._pos = {}
+        self._lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def path(self) -> str:
+        return os.path.join(EMBEDDING_INDEX_DIR, f"{self.name}.npz")
+
+    def replace_all(self, ids: np.ndarray, matrix: np.ndarray, idf: np.ndarray):
+        with self._lock:
+            self._ids = np.asarray(ids, dtype=np.int64).copy()
+            self._matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+            self._size = len(self._ids)
+            self._pos = {int(i): p for p, i in enumerate(self._ids)}
+            self.idf = np.asarray(idf, dtype=np.float32)
+
+    def _grow(self):
+        capacity = max(16, len(self._ids) * 2)
+        ids = np.empty(capacity, dtype=np.int64)
+        ids[:self._size] = self._ids[:self._size]
+        matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        self._ids, self._matrix = ids, matrix
+
+    def upsert(self, item_id: int, vector: np.ndarray):
+        with self._lock:
+            pos = self._pos.get(int(item_id))
+            if pos is None:
+                if self._size == len(self._ids): self._grow()
+                pos = self._size
+                self._size += 1
+                self._ids[pos] = int(item_id)
+                self._pos[int(item_id)] = pos
+            self._matrix[pos] = vector
+
+    def remove(self, item_id: int):
+        """Swap-with-last removal keeps the live rows contiguous."""
+        with self._lock:
+            pos = self._pos.pop(int(item_id), None)
+            if pos is None: return
+            last = self._size - 1
+            if pos != last:
+                self._ids[pos] = self._ids[last]
+                self._matrix[pos] = self._matrix[last]
+                self._pos[int(self._ids[pos])] = pos
+            self._size = last
+
+    def vector_for(self, item_id: int) -> Optional[np.ndarray]:
+        with self._lock:
+            pos = self._pos.get(int(item_id))
+            return None if pos is None else self._matrix[pos].copy()
+
+    def search(self, queries: np.ndarray, k: int) -> List[List[Tuple[int, float]]]:
+        """
+        Batched top-k cosine search: one (m x d) @ (d x n) product for all queries,
+        then argpartition per row so the sort is only over k candidates.
+        """
+        queries = np.atleast_2d(queries).astype(np.float32, copy=False)
+        with self._lock:
+            n = self._size
+            if n == 0 or k <= 0: return [[] for _ in range(len(queries))]
+            scores = queries @ self._matrix[:n].T
+            ids = self._ids[:n].copy()
+        k = min(k, n)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for row, cand in zip(scores, top):
+            order = cand[np.argsort(-row[cand])]
+            results.append([(int(ids[i]), float(row[i])) for i in order])
+        return results
+
+    def save(self):
+        with self._lock:
+            ids = self._ids[:self._size].copy()
+            matrix = self._matrix[:self._size].copy()
+            idf = self.idf.copy()
+            self._save_timer = None
+        os.makedirs(EMBEDDING_INDEX_DIR, exist_ok=True)
+        tmp_path = self.path + ".tmp.npz"
+        np.savez(tmp_path, ids=ids, matrix=matrix, idf=idf)
+        os.replace(tmp_path, self.path)
+
+    def schedule_save(self):
+        """Debounces persistence so a burst of upserts costs one write."""
+        with self._lock:
+            if self._save_timer is not None: return
+            self._save_timer = threading.Timer(EMBEDDING_SAVE_DELAY, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path): return False
+        with np.load(self.path) as data:
+            if data["matrix"].shape[1] != self.dim:
+                logger.warning(f"Ignoring {self.path}: dimension {data['matrix'].shape[1]} != {self.dim}. Rebuild the index.")
+                return False
+            self.replace_all(data["ids"], data["matrix"], data["idf"])
+        return True
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def _get_index(name: str) -> VectorIndex:
+    with _indexes_lock:
+        index = _indexes.get(name)
+        if index is None:
+            index = VectorIndex(name)
+            index.load()
+            _indexes[name] = index
+        return index
+
+def get_job_index() -> VectorIndex:
+    return _get_index("jobs")
+
+def get_candidate_index() -> VectorIndex:
+    return _get_index("candidates")
+
+# --- Rebuild ---
+def _rebuild(index: VectorIndex, batches) -> int:
+    all_ids, all_counts = [], []
+    for batch in batches:
+        for item_id, counts in batch:
+            all_ids.append(item_id)
+            all_counts.append(counts)
+    raw = encode(all_counts)
+    idf = compute_idf(raw) if len(all_ids) else np.ones(EMBEDDING_DIM, dtype=np.float32)
+    matrix = encode(all_counts, idf)
+    index.replace_all(np.asarray(all_ids, dtype=np.int64), matrix, idf)
+    index.save()
+    return len(all_ids)
+
+def _job_batches():
+    from ..db import jobs_collection
+    cursor = jobs_collection().find(
+        {"status": {"$ne": "Closed"}},
+        {"_id": 0, "jobId": 1, "title": 1, "description": 1, "skillsRequired": 1},
+    ).batch_size(REBUILD_BATCH_SIZE)
+    batch = []
+    for job in cursor:
+        batch.append((int(job["jobId"]), job_features(job)))
+        if len(batch) >= REBUILD_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch: yield batch
+
+def _candidate_batches():
+    from ..db import users_collection, resumes_collection
+    cursor = users_collection().find(
+        {"role": "Applicant"},
+        {"_id": 0, "UserID": 1, "skills": 1, "professionalTitle": 1, "highest_qualification": 1, "years_of_experience": 1},
+    ).batch_size(REBUILD_BATCH_SIZE)
+    users = []
+
+    def _flush(users):
+        ids = [u["UserID"] for u in users]
+        by_user = {}
+        for r in resumes_collection().find({"userId": {"$in": ids}}, {"_id": 0, "userId": 1, "skills": 1, "parsedTextSnippet": 1}):
+            by_user.setdefault(r["userId"], []).append(r)
+        return [(int(u["UserID"]), candidate_features(u, by_user.get(u["UserID"]))) for u in users]
+
+    for user in cursor:
+        users.append(user)
+        if len(users) >= REBUILD_BATCH_SIZE:
+            yield _flush(users)
+            users = []
+    if users: yield _flush(users)
+
+def rebuild_job_index() -> int:
+    """Re-encodes every open job, recomputes IDF and persists the index. Returns the row count."""
+    return _rebuild(get_job_index(), _job_batches())
+
+def rebuild_candidate_index() -> int:
+    """Re-encodes every applicant (profile + resume library), recomputes IDF and persists the index."""
+    return _rebuild(get_candidate_index(), _candidate_batches())
+
+# --- Incremental maintenance (called from write paths; never raises) ---
+def index_job(job: Optional[dict]):
+    try:
+        if not job or job.get("jobId") is None: return
+        index = get_job_index()
+        if job.get("status") == "Closed":
+            index.remove(job["jobId"])
+        else:
+            index.upsert(job["jobId"], encode([job_features(job)], index.idf)[0])
+        index.schedule_save()
+    except Exception as e:
+        logger.error(f"Failed to index job {job.get('jobId') if job else None}: {e}")
+
+def remove_job(job_id: int):
+    try:
+        index = get_job_index()
+        index.remove(job_id)
+        index.schedule_save()
+    except Exception as e:
+        logger.error(f"Failed to remove job {job_id} from index: {e}")
+
+def index_candidate(user_id: int):
+    """Re-encodes one user after a profile, skill or resume write; users that are gone or not Applicants are dropped."""
+    try:
+        from ..repository import user_repo, resume_repo
+        user = user_repo.find_one_by_id(user_id)
+        index = get_candidate_index()
+        if not user or user.get("role") != "Applicant":
+            index.remove(user_id)
+        else:
+            index.upsert(user_id, encode([candidate_features(user, resume_repo.find_resumes_by_user(user_id))], index.idf)[0])
+        index.schedule_save()
+    except Exception as e:
+        logger.error(f"Failed to index candidate {user_id}: {e}")
+
+def remove_candidate(user_id: int):
+    try:
+        index = get_candidate_index()
+        index.remove(user_id)
+        index.schedule_save()
+    except Exception as e:
+        logger.error(f"Failed to remove candidate {user_id} from index: {e}")
+
+# --- Queries ---
+def recommend_jobs(user_id: int, k: int = 10) -> List[Tuple[int, float]]:
+    """Top-k open jobs for a candidate as (jobId, score), best first. Zero-similarity hits are dropped."""
+    from ..repository import user_repo, resume_repo
+    user = user_repo.find_one_by_id(user_id)
+    if not user: raise ValueError(f"User {user_id} not found.")
+    index = get_job_index()
+    query = encode([candidate_features(user, resume_repo.find_resumes_by_user(user_id))], index.idf)
+    return [hit for hit in index.search(query, k)[0] if hit[1] > 0]
+
+def recommend_candidates(job_id: int, k: int = 10) -> List[Tuple[int, float]]:
+    """Top-k candidates for a job as (UserID, score), best first."""
+    from ..repository import job_repo
+    job = job_repo.find_job_by_id(job_id)
+    if not job: raise ValueError(f"Job {job_id} not found.")
+    index = get_candidate_index()
+    return [hit for hit in index.search(encode([job_features(job)], index.idf), k)[0] if hit[1] > 0]
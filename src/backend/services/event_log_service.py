@@ -0,0 +1,74 @@
+# src/backend/services/event_log_service.py
+"""
+Application status history in the `application_events` time-series collection.
+
+Events are written synchronously, right after the status update they
+describe: one insert per transition, one unordered insert_many for batch
+transitions (EVENT_BATCH_SIZE events per call). A status change therefore
+costs one extra round trip, and a crashed or killed process can no longer
+leave gaps in applicationTimeline. Derived work (job counters, rollups)
+is done separately and does not delay the event write. If the insert itself
+fails, the status change stands and the failure is logged with the
+number of events lost.
+
+Event shape: {ts, meta: {appId, jobId}, from, to, actor: {userId, role}[, appliedAt]}
+"""
+import os
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..db import application_events_collection
+
+logger = logging.getLogger(__name__)
+
+EVENT_BATCH_SIZE = int(os.getenv("EVENT_BATCH_SIZE", 500))
+
+SYSTEM_ACTOR = {"userId": None, "role": "System"}
+
+def actor_from_context(info) -> Dict:
+    ctx = info.context
+    return {"userId": ctx.get("UserID"), "role": ctx.get("user_role")}
+
+def build_event(app: dict, to_status: str, actor: Optional[Dict] = None, ts: Optional[datetime] = None) -> dict:
+    event = {
+        "ts": ts or datetime.utcnow(),
+        "meta": {"appId": app.get("appId"), "jobId": app.get("jobId")},
+        "from": app.get("status"),
+        "to": to_status,
+        "actor": actor or SYSTEM_ACTOR,
+    }
+    # Hires carry the application time so rollups get time-to-hire without a join.
+    if to_status == "Hired" and isinstance(app.get("submittedAt"), datetime):
+        event["appliedAt"] = app["submittedAt"]
+    return event
+
+def record_transition(before: Optional[dict], to_status: str, actor: Optional[Dict] = None):
+    """Writes one event for an application that was in `before` state. No-ops are not recorded."""
+    if not before or before.get("status") == to_status: return
+    _write([build_event(before, to_status, actor)])
+
+def record_transitions(befores: List[dict], to_status: str, actor: Optional[Dict] = None):
+    ts = datetime.utcnow()
+    _write([build_event(b, to_status, actor, ts) for b in befores if b and b.get("status") != to_status])
+
+def _write(events: List[dict]) -> int:
+    """Inserts events in EVENT_BATCH_SIZE chunks. Returns how many were written."""
+    written = 0
+    for start in range(0, len(events), EVENT_BATCH_SIZE):
+        chunk = events[start:start + EVENT_BATCH_SIZE]
+        try:
+            if len(chunk) == 1: application_events_collection().insert_one(chunk[0])
+            else: application_events_collection().insert_many(chunk, ordered=False)
+            written += len(chunk)
+        except Exception as e:
+            # The status change itself already happened; don't fail the request over its history.
+            logger.error(f"Dropped {len(chunk)} application events (appIds {[c['meta']['appId'] for c in chunk[:10]]}): {e}")
+    return written
+
+# --- Reads ---
+def get_timeline(app_id: int) -> List[dict]:
+    """Every transition of one application, oldest first (meta.appId + ts index)."""
+    return list(application_events_collection().find(
+        {"meta.appId": int(app_id)}, {"_id": 0}
+    ).sort("ts", 1))
@@ -0,0 +1,78 @@
+# src/backend/services/export_service.py
+"""
+Streaming export of applications joined with applicant and job fields.
+
+Rows are produced per cursor batch: each batch of applications is
+enriched with one $in lookup on users and one on jobs, encoded, and handed
+to the response before the next batch is read. Memory therefore depends
+on EXPORT_BATCH_SIZE, not on how many rows the export has.
+"""
+import io
+import os
+import csv
+import json
+from typing import Dict, Iterable, Iterator, List
+
+from ..db import users_collection, jobs_collection, to_iso_string, SUBMITTED_AT_FORMAT
+from ..repository import application_repo
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+APPLICATION_FIELDS = ["appId", "jobId", "userId", "status", "submittedAt", "statusUpdatedAt", "resume_url"]
+USER_FIELDS = ["firstName", "lastName", "email", "phone_number", "city", "country",
+               "professionalTitle", "years_of_experience", "highest_qualification", "is_us_citizen"]
+JOB_FIELDS = ["title", "company"]
+COLUMNS = APPLICATION_FIELDS + USER_FIELDS + ["jobTitle", "company"]
+
+def _enrich(batch: List[dict]) -> List[Dict]:
+    user_ids = list({a.get("userId") for a in batch})
+    job_ids = list({a.get("jobId") for a in batch})
+    users = {u["UserID"]: u for u in users_collection().find(
+        {"UserID": {"$in": user_ids}}, {"_id": 0, "UserID": 1, **{f: 1 for f in USER_FIELDS}})}
+    jobs = {j["jobId"]: j for j in jobs_collection().find(
+        {"jobId": {"$in": job_ids}}, {"_id": 0, "jobId": 1, **{f: 1 for f in JOB_FIELDS}})}
+
+    rows = []
+    for a in batch:
+        user = users.get(a.get("userId")) or {}
+        job = jobs.get(a.get("jobId")) or {}
+        row = {f: a.get(f) for f in APPLICATION_FIELDS}
+        row["submittedAt"] = to_iso_string(row["submittedAt"], SUBMITTED_AT_FORMAT)
+        row["statusUpdatedAt"] = to_iso_string(row["statusUpdatedAt"], SUBMITTED_AT_FORMAT)
+        row.update({f: user.get(f) for f in USER_FIELDS})
+        row["jobTitle"] = job.get("title") or a.get("jobTitle")
+        row["company"] = job.get("company") or a.get("companyName")
+        rows.append(row)
+    return rows
+
+def iter_row_batches(q: dict, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict]]:
+    projection = {"_id": 0, **{f: 1 for f in APPLICATION_FIELDS}, "jobTitle": 1, "companyName": 1}
+    for batch in application_repo.iter_applications(q, batch_size, projection):
+        yield _enrich(batch)
+
+def _csv_safe(value):
+    # Applicant-entered text must not run as a spreadsheet formula.
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@", "\t", "\r"):
+        return "'" + value
+    return value
+
+# --- Encoders (one chunk per batch) ---
+def iter_ndjson(batches: Iterable[List[Dict]]) -> Iterator[str]:
+    for rows in batches:
+        yield "".join(json.dumps(row, default=str, ensure_ascii=False) + "\n" for row in rows)
+
+def iter_csv(batches: Iterable[List[Dict]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    for rows in batches:
+        writer.writerows({k: _csv_safe(v) for k, v in row.items()} for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell(): yield buffer.getvalue()  # Header only: nothing matched
+
+def stream(q: dict, fmt: str) -> Iterator[str]:
+    encode = iter_csv if fmt == "csv" else iter_ndjson
+    return encode(iter_row_batches(q))
@@ -0,0 +1,137 @@
+# src/backend/services/job_stats_service.py
+"""
+Per-job application counters in the `job_stats` collection.
+
+    {jobId, total, byStatus: {<status>: n}, lastActivityAt}
+
+A job gets its stats document when it is created. From then on every
+application insert and status transition applies one atomic upserting $inc
+on the request path (application_repo), right after the application write;
+batch transitions use one unordered bulk_write. A document created by that
+upsert (a job from before job_stats existed, or whose creation failed)
+holds only the deltas since, so it is flagged `partial` and such jobs are
+counted from `applications` on read until scripts/reconcile_job_stats.py
+seeds them. The same script repairs any drift.
+
+Reads go through a per-request cache in the GraphQL context: the `jobs`
+query primes it with every returned jobId, so a dashboard of hundreds of
+jobs costs one $in lookup instead of one count per job.
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from ..db import job_stats_collection, applications_collection, applications_archive_collection
+
+logger = logging.getLogger(__name__)
+
+_CACHE_KEY = "_job_stats"
+_PENDING_KEY = "_job_stats_pending"
+
+def status_key(status) -> str:
+    # Statuses become field names under byStatus, which may not contain '.' or start with '$'.
+    return str(status).replace(".", "_").lstrip("$") or "Unknown"
+
+def empty_stats(job_id: int) -> dict:
+    return {"jobId": int(job_id), "total": 0, "byStatus": {}, "lastActivityAt": None}
+
+# --- Writes ---
+def create_for_job(job_id: int):
+    """Starts a new job at zero so its counters are maintained from the first application on."""
+    try:
+        job_stats_collection().insert_one({"jobId": int(job_id), "total": 0, "byStatus": {}})
+    except Exception as e:
+        logger.error(f"Failed to create stats for job {job_id}: {e}")
+
+def delete_for_job(job_id: int):
+    job_stats_collection().delete_one({"jobId": int(job_id)})
+
+def build_updates(changes: Iterable[Tuple[int, Optional[str], str]], at: datetime) -> List[UpdateOne]:
+    """
+    Folds (jobId, fromStatus, toStatus) changes into one upserting $inc/$max update per job.
+    fromStatus None is a new application.
+    """
+    per_job: Dict[int, dict] = {}
+    for job_id, from_status, to_status in changes:
+        if job_id is None or from_status == to_status: continue
+        inc = per_job.setdefault(int(job_id), {})
+        if from_status is None:
+            inc["total"] = inc.get("total", 0) + 1
+        else:
+            key = f"byStatus.{status_key(from_status)}"
+            inc[key] = inc.get(key, 0) - 1
+        key = f"byStatus.{status_key(to_status)}"
+        inc[key] = inc.get(key, 0) + 1
+
+    ops = []
+    for job_id, inc in per_job.items():
+        update = {"$max": {"lastActivityAt": at}, "$setOnInsert": {"partial": True}}
+        inc = {k: v for k, v in inc.items() if v}
+        if inc: update["$inc"] = inc
+        ops.append(UpdateOne({"jobId": job_id}, update, upsert=True))
+    return ops
+
+def apply_changes(changes: Iterable[Tuple[int, Optional[str], str]], at: Optional[datetime] = None) -> int:
+    """Applies status changes to the counters atomically. Returns the number of jobs touched."""
+    ops = build_updates(changes, at or datetime.utcnow())
+    if not ops: return 0
+    try:
+        job_stats_collection().bulk_write(ops, ordered=False)
+    except Exception as e:
+        # The application write already happened; scripts/reconcile_job_stats.py repairs the counters.
+        logger.error(f"Failed to update job stats for {len(ops)} jobs: {e}")
+        return 0
+    return len(ops)
+
+def record_application(job_id: int, status: str = "Applied", at: Optional[datetime] = None) -> int:
+    return apply_changes([(job_id, None, status)], at)
+
+def record_transition(job_id: int, from_status: Optional[str], to_status: str, at: Optional[datetime] = None) -> int:
+    return apply_changes([(job_id, from_status or "Applied", to_status)], at)
+
+# --- Reads ---
+def _count_from_applications(job_ids: List[int]) -> Dict[int, dict]:
+    """Stats for untracked jobs, computed with one aggregation over applications and one over the archive."""
+    stats = {}
+    pipeline = [
+        {"$match": {"jobId": {"$in": job_ids}}},
+        {"$group": {"_id": {"jobId": "$jobId", "status": "$status"}, "count": {"$sum": 1}, "last": {"$max": "$submittedAt"}}},
+    ]
+    rows = [row for coll in (applications_collection(), applications_archive_collection()) for row in coll.aggregate(pipeline)]
+    for row in rows:
+        job_id = row["_id"]["jobId"]
+        s = stats.setdefault(job_id, empty_stats(job_id))
+        key = status_key(row["_id"].get("status") or "Applied")
+        s["byStatus"][key] = s["byStatus"].get(key, 0) + row["count"]
+        s["total"] += row["count"]
+        if isinstance(row.get("last"), datetime) and (s["lastActivityAt"] is None or row["last"] > s["lastActivityAt"]):
+            s["lastActivityAt"] = row["last"]
+    return stats
+
+def load_stats(job_ids: Iterable[int]) -> Dict[int, dict]:
+    """Stats for many jobs: one $in on job_stats, plus one aggregation for untracked or partial jobs."""
+    job_ids = list({int(j) for j in job_ids if j is not None})
+    if not job_ids: return {}
+    found = {d["jobId"]: d for d in job_stats_collection().find({"jobId": {"$in": job_ids}, "partial": {"$ne": True}}, {"_id": 0})}
+    missing = [j for j in job_ids if j not in found]
+    if missing:
+        counted = _count_from_applications(missing)
+        for j in missing: found[j] = counted.get(j) or empty_stats(j)
+    return found
+
+def prime(context: dict, job_ids: Iterable[int]):
+    """Registers jobs that are about to be resolved so their stats are fetched together."""
+    context.setdefault(_PENDING_KEY, set()).update(int(j) for j in job_ids if j is not None)
+
+def get_stats(context: dict, job_id: int) -> dict:
+    """Stats for one job, batch-loading every primed job on the first miss of the request."""
+    job_id = int(job_id)
+    cache = context.setdefault(_CACHE_KEY, {})
+    if job_id not in cache:
+        pending = context.setdefault(_PENDING_KEY, set())
+        pending.add(job_id)
+        cache.update(load_stats(j for j in pending if j not in cache))
+        pending.clear()
+    return cache[job_id]
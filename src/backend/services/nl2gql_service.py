@@ -125,11 +125,14 @@ def build_nl2gql_prompt(user_text: str, schema_sdl: str, user_context: Optional[
         # -----------------------------------------
         "- To filter users by experience, use the `yearsOfExperience_gte: Int` argument.\n"
         "- To filter users by citizenship, use the `isUSCitizen: Boolean` argument.\n"
+        "- To filter users who have **all** of several skills, use `skills: [String!]`; for users with **any** of them, use `skillsAny: [String!]`.\n"
         "- When a user wants to **ADD** skills to **their own profile**, you **MUST** use the `addSkillsToUser` mutation. For all other user profile updates, use `updateUser`.\n"
         "- When a user asks about **'my applications'**, you **MUST** use the `applications` query and filter it using the `userId` from the context.\n"
-        "  **You MUST select and return these fields for each application:** `{ appId status userId jobId job { jobId title company } notes }`.\n"
+        "  **You MUST select and return these fields for each application:** `{ appId status userId jobId job { jobId title company } noteCount notes { items { author role createdAt text } } }`.\n"
         "- When a user wants to **'add a note'** to their application (Applicant only), use the `addNoteToApplicationByJob` mutation.\n"
         "- When a user asks **'how many applications'** or for a **'count of applicants'**, you **MUST** query the relevant job and include the `applicationCount` field.\n"
+        "- For a **breakdown by status** (e.g. 'how many are interviewing'), include `stats { total byStatus { status count } lastActivityAt }` on the job.\n"
+        "- For **trends** (applications per day, conversion, time-to-hire) use `hiringMetrics(range: {start, end}, groupBy: JOB|COMPANY|MANAGER) { asOf groups { key label applications invites offers hires inviteToOfferRate medianTimeToHireDays daily { day applications hires } } }`.\n"
         
         "- When a user wants to see **applicants**, **candidates**, or people who **applied** for a job, you **MUST** query the `jobs` field. **You MUST select `jobId`, `title`, and `company` for the Job itself.** Then request the nested `applicants` field. **For every applicant, you MUST select:** `firstName`, `lastName`, `professionalTitle`, `skills`, `city`, `country`, `applicationStatus`, `resume_url`, `interviewTime`, and `UserID`.\n"
         
@@ -0,0 +1,115 @@
+# src/backend/services/ranking_service.py
+"""
+Scores every applicant of a job in one vectorised NumPy pass.
+
+Each feature is scaled to [0, 1]; the final score is the weighted sum with
+weights normalised to 1, so scores are comparable across jobs.
+"""
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..repository import application_repo, user_repo
+from .skill_service import skill_id
+
+RANK_EXPERIENCE_CAP = float(os.getenv("RANK_EXPERIENCE_CAP", 10))
+
+FEATURES = ("skills", "experience", "citizenship", "degree")
+DEFAULT_WEIGHTS = {"skills": 0.5, "experience": 0.25, "citizenship": 0.15, "degree": 0.1}
+
+_RANK_PROJECTION = {"_id": 0, "UserID": 1, "skills": 1, "years_of_experience": 1, "is_us_citizen": 1, "highest_degree_year": 1}
+
+def resolve_weights(weights: Optional[Dict[str, float]]) -> np.ndarray:
+    """Merges caller overrides onto the defaults and normalises them to sum to 1."""
+    merged = dict(DEFAULT_WEIGHTS)
+    for name, value in (weights or {}).items():
+        if value is None: continue
+        if name not in merged: raise ValueError(f"Unknown ranking weight '{name}'.")
+        if value < 0: raise ValueError(f"Ranking weight '{name}' must be non-negative.")
+        merged[name] = float(value)
+    vector = np.array([merged[name] for name in FEATURES], dtype=np.float64)
+    total = vector.sum()
+    if total <= 0: raise ValueError("At least one ranking weight must be positive.")
+    return vector / total
+
+def _load_applicants(job_id: int) -> List[dict]:
+    apps = application_repo.find_applications({"jobId": int(job_id)})
+    user_ids = list({a["userId"] for a in apps if a.get("userId") is not None})
+    users = {u["UserID"]: u for u in user_repo.find_users_by_ids(user_ids, _RANK_PROJECTION)}
+    rows = []
+    for a in apps:
+        user = users.get(a.get("userId"))
+        if user: rows.append({"app": a, "user": user})
+    return rows
+
+def _feature_matrix(job: dict, users: List[dict]) -> np.ndarray:
+    """Returns an (n, len(FEATURES)) float matrix of per-feature scores in [0, 1]."""
+    n = len(users)
+    required = {}
+    for s in job.get("skillsRequired") or []:
+        key = skill_id(s)
+        if key and key not in required: required[key] = len(required)
+
+    # Skill overlap: flatten every (applicant, required-skill) hit into pair codes,
+    # de-duplicate them and count per applicant with one bincount.
+    if required:
+        owners, codes = [], []
+        for row, user in enumerate(users):
+            for s in user.get("skills") or []:
+                code = required.get(skill_id(s))
+                if code is not None:
+                    owners.append(row)
+                    codes.append(code)
+        pairs = np.unique(np.asarray(owners, dtype=np.int64) * len(required) + np.asarray(codes, dtype=np.int64))
+        skills = np.bincount(pairs // len(required), minlength=n) / len(required)
+    else:
+        skills = np.ones(n)
+
+    years = np.array([u.get("years_of_experience") or 0 for u in users], dtype=np.float64)
+    experience = np.clip(years, 0, RANK_EXPERIENCE_CAP) / RANK_EXPERIENCE_CAP
+
+    if job.get("requires_us_citizenship"):
+        citizenship = np.array([u.get("is_us_citizen") is True for u in users], dtype=np.float64)
+    else:
+        citizenship = np.ones(n)
+
+    minimum_year = job.get("minimum_degree_year")
+    if minimum_year:
+        degree_years = np.array([u.get("highest_degree_year") or 0 for u in users], dtype=np.int64)
+        degree = (degree_years >= int(minimum_year)).astype(np.float64)
+    else:
+        degree = np.ones(n)
+
+    return np.column_stack([skills, experience, citizenship, degree])
+
+def rank_applicants(job: dict, first: int = 10, weights: Optional[Dict[str, float]] = None) -> List[dict]:
+    """
+    Returns the top `first` applicants as dicts with score, breakdown (weighted
+    contribution per feature, summing to score), matchedSkills, application and userId.
+    """
+    w = resolve_weights(weights)
+    rows = _load_applicants(job["jobId"])
+    if not rows: return []
+
+    features = _feature_matrix(job, [r["user"] for r in rows])
+    contributions = features * w
+    scores = contributions.sum(axis=1)
+
+    k = min(max(int(first), 1), len(rows))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.lexsort((top, -scores[top]))]  # Score desc, then application order for stable ties
+
+    required = {skill_id(s): s for s in job.get("skillsRequired") or [] if skill_id(s)}
+    results = []
+    for i in top:
+        user = rows[i]["user"]
+        have = {skill_id(s) for s in user.get("skills") or []}
+        results.append({
+            "score": round(float(scores[i]), 4),
+            "breakdown": {name: round(float(contributions[i, j]), 4) for j, name in enumerate(FEATURES)},
+            "matchedSkills": [display for key, display in required.items() if key in have],
+            "application": rows[i]["app"],
+            "userId": user["UserID"],
+        })
+    return results
@@ -0,0 +1,195 @@
+# src/backend/services/reminder_service.py
+"""
+Interview reminders as a due-time queue.
+
+Booking an interview enqueues one `reminders` document per participant and
+lead time, keyed by dueAt. Workers claim the earliest due reminders in
+batches under a lease token: ids are read from the (status, dueAt) index,
+flipped to 'leased' with one conditional update_many, and only documents
+carrying this worker's token are processed. A worker that dies leaves its
+lease to expire, after which the reminders are claimable again. Work per
+tick is bounded by the batch size however many future interviews exist.
+
+Statuses: pending -> leased -> sent | failed | skipped
+"""
+import os
+import uuid
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from pymongo.errors import BulkWriteError
+
+from ..db import reminders_collection, interviews_collection, jobs_collection, users_collection, to_iso_string
+
+logger = logging.getLogger(__name__)
+
+# Minutes before the interview, e.g. "1440,60" = a day before and an hour before.
+REMINDER_LEAD_MINUTES = [int(m) for m in os.getenv("INTERVIEW_REMINDER_LEAD_MINUTES", "1440,60").split(",") if m.strip()]
+REMINDER_LEASE_SECONDS = int(os.getenv("REMINDER_LEASE_SECONDS", 300))
+REMINDER_MAX_ATTEMPTS = int(os.getenv("REMINDER_MAX_ATTEMPTS", 5))
+REMINDER_RETRY_SECONDS = int(os.getenv("REMINDER_RETRY_SECONDS", 120))
+
+PENDING, LEASED, SENT, FAILED, SKIPPED = "pending", "leased", "sent", "failed", "skipped"
+
+# --- Enqueue ---
+def build_reminders(interview: dict, now: Optional[datetime] = None) -> List[dict]:
+    """Reminder documents for the candidate and the interviewer of one interview."""
+    from .scheduling_service import parse_iso
+
+    now = now or datetime.utcnow()
+    start = parse_iso(interview.get("startTime"))
+    if not start or start <= now: return []
+    interviewer_id = interview.get("hiringManagerId") or interview.get("recruiterId")
+    recipients = [r for r in dict.fromkeys((interview.get("candidateId"), interviewer_id)) if r is not None]
+
+    docs = []
+    for lead in REMINDER_LEAD_MINUTES:
+        due = start - timedelta(minutes=lead)
+        # A lead time that has already passed is skipped unless it is the last one before the start.
+        if due <= now and lead != min(REMINDER_LEAD_MINUTES): continue
+        for recipient_id in recipients:
+            docs.append({
+                "interviewId": interview["interviewId"],
+                "recipientId": recipient_id,
+                "leadMinutes": lead,
+                "dueAt": max(due, now),
+                "status": PENDING,
+                "attempts": 0,
+                "createdAt": now,
+            })
+    return docs
+
+def schedule_interview_reminders(interviews: Iterable[dict]) -> int:
+    """Enqueues reminders for newly booked interviews. Idempotent; never raises into the booking path."""
+    docs = [r for i in interviews for r in build_reminders(i)]
+    if not docs: return 0
+    try:
+        return len(reminders_collection().insert_many(docs, ordered=False).inserted_ids)
+    except BulkWriteError as e:
+        # Duplicates are reminders that already exist (re-enqueue); anything else is logged.
+        others = [err for err in e.details.get("writeErrors", []) if err.get("code") != 11000]
+        if others: logger.error(f"Failed to enqueue {len(others)} interview reminders: {others[0].get('errmsg')}")
+        return e.details.get("nInserted", 0)
+    except Exception as e:
+        logger.error(f"Failed to enqueue interview reminders: {e}")
+        return 0
+
+# --- Claiming ---
+def claim_due(batch_size: int = 100, lease_seconds: int = REMINDER_LEASE_SECONDS, now: Optional[datetime] = None) -> tuple:
+    """
+    Leases up to batch_size due reminders (pending, or leased with an expired lease).
+    Returns (lease_token, reminders). Competing workers may read the same ids; the
+    conditional update_many lets each reminder go to exactly one token. Every claim
+    counts as an attempt, so an expired lease that already used the last attempt
+    (its worker died mid-send) is marked failed instead of being re-claimed.
+    """
+    now = now or datetime.utcnow()
+    token = uuid.uuid4().hex
+    expired = {"status": LEASED, "leaseUntil": {"$lte": now}}
+    reminders_collection().update_many(
+        {**expired, "attempts": {"$gte": REMINDER_MAX_ATTEMPTS}},
+        {"$set": {"status": FAILED, "finishedAt": now, "lastError": "Lease expired on the last attempt."},
+         "$unset": {"leaseToken": "", "leaseUntil": ""}}
+    )
+    retryable = {**expired, "attempts": {"$lt": REMINDER_MAX_ATTEMPTS}}
+    ids = [d["_id"] for d in reminders_collection().find(
+        {"status": PENDING, "dueAt": {"$lte": now}}, {"_id": 1}
+    ).sort("dueAt", 1).limit(batch_size)]
+    if len(ids) < batch_size:
+        ids += [d["_id"] for d in reminders_collection().find(
+            retryable, {"_id": 1}
+        ).sort("leaseUntil", 1).limit(batch_size - len(ids))]
+    if not ids: return token, []
+
+    reminders_collection().update_many(
+        {"_id": {"$in": ids}, "$or": [
+            {"status": PENDING, "dueAt": {"$lte": now}},
+            retryable,
+        ]},
+        {"$set": {"status": LEASED, "leaseToken": token, "leaseUntil": now + timedelta(seconds=lease_seconds)},
+         "$inc": {"attempts": 1}}
+    )
+    return token, list(reminders_collection().find({"leaseToken": token, "status": LEASED}))
+
+def complete(token: str, reminder_ids: List, status: str = SENT, error: Optional[str] = None):
+    """Finishes leased reminders; a reminder whose lease was lost to another worker is left alone."""
+    if not reminder_ids: return
+    fields = {"status": status, "finishedAt": datetime.utcnow()}
+    if error: fields["lastError"] = error
+    reminders_collection().update_many(
+        {"_id": {"$in": reminder_ids}, "leaseToken": token},
+        {"$set": fields, "$unset": {"leaseToken": "", "leaseUntil": ""}}
+    )
+
+def retry_later(token: str, reminder: dict, error: str, now: Optional[datetime] = None):
+    """Back to pending with linear backoff, or failed once the attempts are used up."""
+    if reminder.get("attempts", 0) >= REMINDER_MAX_ATTEMPTS:
+        complete(token, [reminder["_id"]], FAILED, error)
+        return
+    now = now or datetime.utcnow()
+    reminders_collection().update_one(
+        {"_id": reminder["_id"], "leaseToken": token},
+        {"$set": {"status": PENDING, "lastError": error,
+                  "dueAt": now + timedelta(seconds=REMINDER_RETRY_SECONDS * reminder.get("attempts", 1))},
+         "$unset": {"leaseToken": "", "leaseUntil": ""}}
+    )
+
+# --- Delivery ---
+def _display_name(user: Optional[dict]) -> str:
+    if not user: return "the hiring team"
+    return " ".join(p for p in (user.get("firstName"), user.get("lastName")) if p) or user.get("email", "")
+
+def process_due(batch_size: int = 100, now: Optional[datetime] = None) -> Dict[str, int]:
+    """One worker tick: claim a batch, load what it needs with one $in per collection, send, settle."""
+    from . import email_service
+    from .scheduling_service import parse_iso
+
+    now = now or datetime.utcnow()
+    token, batch = claim_due(batch_size, now=now)
+    stats = {"claimed": len(batch), "sent": 0, "skipped": 0, "retried": 0, "failed": 0}
+    if not batch: return stats
+
+    interviews = {i["interviewId"]: i for i in interviews_collection().find(
+        {"interviewId": {"$in": list({r["interviewId"] for r in batch})}}, {"_id": 0})}
+    jobs = {j["jobId"]: j for j in jobs_collection().find(
+        {"jobId": {"$in": list({i.get("jobId") for i in interviews.values()})}}, {"_id": 0, "jobId": 1, "title": 1, "company": 1})}
+    people = set()
+    for i in interviews.values():
+        people.update(p for p in (i.get("candidateId"), i.get("hiringManagerId"), i.get("recruiterId")) if p is not None)
+    users = {u["UserID"]: u for u in users_collection().find(
+        {"UserID": {"$in": list(people)}}, {"_id": 0, "UserID": 1, "email": 1, "firstName": 1, "lastName": 1})}
+
+    sent, skipped = [], []
+    for r in batch:
+        interview = interviews.get(r["interviewId"])
+        recipient = users.get(r["recipientId"])
+        start = parse_iso(interview.get("startTime")) if interview else None
+        if not interview or not recipient or not recipient.get("email") or not start or start <= now:
+            skipped.append(r["_id"])  # Interview gone or already started, or nobody to tell
+            continue
+
+        job = jobs.get(interview.get("jobId")) or {}
+        if r["recipientId"] == interview.get("candidateId"):
+            other = _display_name(users.get(interview.get("hiringManagerId") or interview.get("recruiterId")))
+        else:
+            other = _display_name(users.get(interview.get("candidateId")))
+        try:
+            ok = email_service.send_interview_reminder(
+                recipient["email"], recipient.get("firstName") or "there", job.get("title", "the"),
+                job.get("company", "our company"), to_iso_string(start), other
+            )
+        except Exception as e:
+            ok, error = False, f"{type(e).__name__}: {e}"
+        else:
+            error = None if ok else "Email delivery failed."
+        if ok:
+            sent.append(r["_id"])
+        else:
+            retry_later(token, r, error, now)
+            stats["retried" if r.get("attempts", 0) < REMINDER_MAX_ATTEMPTS else "failed"] += 1
+
+    complete(token, sent, SENT)
+    complete(token, skipped, SKIPPED)
+    stats["sent"], stats["skipped"] = len(sent), len(skipped)
+    return stats
@@ -0,0 +1,113 @@
+# src/backend/services/resume_compaction_service.py
+"""
+Shrinks extracted resume text before it is embedded in the LLM prompt.
+
+Whitespace is normalised, boilerplate and running headers/footers (lines
+repeated at the edge of every page) are dropped, and only the sections the
+parser needs are kept, in priority order, under a token budget.
+"""
+import os
+import re
+from collections import Counter
+from typing import List, Optional, Set, Tuple
+
+from .resume_extractor_service import split_sections, heading_name
+
+RESUME_PROMPT_TOKEN_BUDGET = int(os.getenv("RESUME_PROMPT_TOKEN_BUDGET", 1500))
+CHARS_PER_TOKEN = 4  # Rough average for English text; avoids a tokenizer dependency.
+HEADER_MAX_LINES = 8
+PAGE_EDGE_LINES = 2  # Lines at the top and bottom of each page that may be a running header/footer
+
+# Sections kept for the LLM, highest priority first. Everything else is dropped.
+SECTION_PRIORITY = ["header", "experience", "skills", "education", "summary", "certifications"]
+
+_BOILERPLATE_RE = re.compile(
+    r"^(?:page\s*\d+(?:\s*(?:of|/)\s*\d+)?|\d+\s*/\s*\d+|curriculum vitae|resume|r[ée]sum[ée]|cv|"
+    r"references? (?:are )?available (?:up)?on request|confidential)$",
+    re.IGNORECASE,
+)
+_INVISIBLE_RE = re.compile(r"[\u200b\u200c\u200d\ufeff]")
+_SPACES_RE = re.compile(r"[ \t\u00a0\f\v]+")
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def _running_lines(pages: List[List[str]]) -> Set[str]:
+    """Lines found among the first or last PAGE_EDGE_LINES lines of every page (needs at least two pages)."""
+    if len(pages) < 2: return set()
+    counts = Counter()
+    for page in pages:
+        lines = [line for line in page if line]
+        counts.update(set(lines[:PAGE_EDGE_LINES] + lines[-PAGE_EDGE_LINES:]))
+    return {line for line, n in counts.items() if n >= len(pages) and len(line) > 3}
+
+def normalize_text(text: str) -> str:
+    """
+    Collapses whitespace and removes boilerplate and running headers/footers. A running line is kept
+    once, and never dropped inside the experience section, where a repeated job title is real content.
+    Pages are separated by form feeds (text_extraction_service.PAGE_BREAK); text without them is one page.
+    """
+    text = _INVISIBLE_RE.sub("", text.replace("\r\n", "\n").replace("\r", "\n"))
+    pages = [[_SPACES_RE.sub(" ", line).strip() for line in page.split("\n")] for page in text.split("\f")]
+    pages = [page for page in pages if any(page)]
+
+    running, seen = _running_lines(pages), set()
+    kept, section = [], "header"
+    for line in (line for page in pages for line in page):
+        section = heading_name(line) or section
+        if line in running and section != "experience":
+            if line in seen: continue
+            seen.add(line)
+        if line and _BOILERPLATE_RE.match(line): continue
+        if not line and (not kept or not kept[-1]): continue
+        kept.append(line)
+    return "\n".join(kept).strip()
+
+def _truncate_lines(text: str, max_chars: int) -> str:
+    """Truncates at a line boundary so the LLM never sees half a date range."""
+    if len(text) <= max_chars: return text
+    cut = text.rfind("\n", 0, max_chars)
+    return text[:cut if cut > 0 else max_chars].rstrip()
+
+def compact_resume_text(text: str, token_budget: Optional[int] = None) -> Tuple[str, dict]:
+    """
+    Returns (compacted_text, stats) where stats records the original and compacted token estimates.
+    Sections are budgeted by priority but emitted in document order.
+    """
+    token_budget = token_budget or RESUME_PROMPT_TOKEN_BUDGET
+    budget_chars = token_budget * CHARS_PER_TOKEN
+    normalized = normalize_text(text)
+    sections = split_sections(normalized)
+
+    if all(name == "header" for name, _ in sections):
+        # No recognisable structure: fall back to whitespace cleanup plus the budget.
+        compacted = _truncate_lines(normalized, budget_chars)
+    else:
+        candidates = {}
+        for name in SECTION_PRIORITY:
+            bodies = [body.strip() for n, body in sections if n == name and body.strip()]
+            if not bodies: continue
+            body = "\n".join(bodies)
+            if name == "header":
+                body = "\n".join(body.splitlines()[:HEADER_MAX_LINES])
+            candidates[name] = body if name == "header" else f"{name.upper()}\n{body}"
+
+        # Water-filling: short sections (skills, education) are kept whole and
+        # whatever they leave over goes to the long ones (usually experience).
+        kept = {}
+        remaining = budget_chars
+        by_size = sorted(candidates, key=lambda n: (len(candidates[n]), SECTION_PRIORITY.index(n)))
+        for i, name in enumerate(by_size):
+            share = remaining // (len(by_size) - i)
+            chunk = _truncate_lines(candidates[name], share)
+            if chunk.count("\n") == 0 and name != "header" and chunk != candidates[name]: continue
+            kept[name] = chunk
+            remaining -= len(chunk)
+
+        order = []
+        for name, _ in sections:
+            if name in kept and name not in order: order.append(name)
+        compacted = "\n\n".join(kept[name] for name in order)
+
+    stats = {"original": estimate_tokens(text), "compacted": estimate_tokens(compacted)}
+    return compacted, stats
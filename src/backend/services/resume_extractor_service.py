@@ -0,0 +1,267 @@
+# src/backend/services/resume_extractor_service.py
+"""
+Deterministic resume field extraction that runs before the LLM.
+
+Fields extracted here with confidence are not sent to the LLM at all,
+so the prompt only asks for what regex and dictionaries cannot answer.
+"""
+import re
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..models.skill_models import CANONICAL_SKILLS, iter_skill_aliases
+
+MIN_CONFIDENT_SKILLS = 3
+
+# --- Sections ---
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "professional profile", "objective", "career objective", "about me"],
+    "experience": ["experience", "work experience", "professional experience", "employment", "employment history",
+                   "work history", "career history", "relevant experience", "professional background"],
+    "education": ["education", "academic background", "academic qualifications", "qualifications", "education and training"],
+    "skills": ["skills", "technical skills", "core competencies", "key skills", "technologies", "tech stack",
+               "areas of expertise", "competencies"],
+    "projects": ["projects", "key projects", "personal projects", "academic projects"],
+    "certifications": ["certifications", "certificates", "licenses and certifications", "licenses & certifications"],
+    "awards": ["awards", "honors", "honours", "achievements", "awards and honors"],
+    "publications": ["publications"],
+    "languages": ["languages"],
+    "volunteering": ["volunteer", "volunteering", "volunteer experience"],
+    "interests": ["interests", "hobbies", "hobbies and interests", "personal interests"],
+    "references": ["references", "referees"],
+}
+_HEADING_LOOKUP = {h: name for name, headings in SECTION_HEADINGS.items() for h in headings}
+
+def heading_name(line: str) -> Optional[str]:
+    key = re.sub(r"[^a-z& ]", "", line.strip().lower()).strip()
+    if not key or len(key.split()) > 5: return None
+    return _HEADING_LOOKUP.get(key)
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """
+    Splits resume text into (section_name, body) pairs in document order.
+    Text before the first recognised heading is returned as the "header" section.
+    """
+    sections, name, buf = [], "header", []
+    for line in text.splitlines():
+        heading = heading_name(line)
+        if heading:
+            sections.append((name, "\n".join(buf)))
+            name, buf = heading, []
+        else:
+            buf.append(line)
+    sections.append((name, "\n".join(buf)))
+    return [(n, body) for n, body in sections if body.strip() or n != "header"]
+
+def _section_text(sections: List[Tuple[str, str]], name: str) -> str:
+    return "\n".join(body for n, body in sections if n == name)
+
+# --- Experience: date ranges -> merged months ---
+_MONTHS = {m: i for i, m in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])}
+_MONTH_RE = r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+_DATE_RE = rf"(?:{_MONTH_RE}\.?,?\s*'?\d{{4}}|\d{{1,2}}\s*/\s*\d{{4}}|\d{{4}})"
+_RANGE_RE = re.compile(
+    rf"(?<![\d/])({_DATE_RE})\s*(?:-|–|—|to|until|till)\s*({_DATE_RE}|present|current|now|today|date)",
+    re.IGNORECASE,
+)
+
+def _parse_month(token: str, is_end: bool, now: datetime) -> Optional[int]:
+    """Returns an absolute month index (year * 12 + month); end dates are exclusive."""
+    token = token.strip().lower()
+    if token in ("present", "current", "now", "today", "date"):
+        return now.year * 12 + now.month  # exclusive end -> includes the current month
+    year_match = re.search(r"\d{4}", token)
+    if not year_match: return None
+    year = int(year_match.group())
+    if year < 1950 or year > now.year: return None
+
+    month = None
+    if "/" in token:
+        month = int(token.split("/")[0]) - 1
+        if not 0 <= month <= 11: return None
+    else:
+        name = re.match(r"[a-z]+", token)
+        if name: month = _MONTHS.get(name.group()[:3])
+
+    if month is None:
+        # Year-only dates: "2016 - 2019" counts as three years.
+        return year * 12
+    return year * 12 + month + (1 if is_end else 0)
+
+def merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merges overlapping/adjacent half-open intervals."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]: merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def extract_experience_months(text: str, now: Optional[datetime] = None) -> Tuple[int, int]:
+    """Returns (total_months, ranges_found) with overlapping roles counted once."""
+    now = now or datetime.utcnow()
+    intervals = []
+    for start_tok, end_tok in _RANGE_RE.findall(text):
+        start = _parse_month(start_tok, False, now)
+        end = _parse_month(end_tok, True, now)
+        if start is None or end is None or end <= start: continue
+        intervals.append((start, end))
+    return sum(e - s for s, e in merge_intervals(intervals)), len(intervals)
+
+# --- Skills: single-pass Aho-Corasick over the canonical alias dictionary ---
+class SkillMatcher:
+    """Aho-Corasick automaton over lowercase aliases; reports canonical IDs on word boundaries."""
+
+    def __init__(self, aliases):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str]]] = [[]]
+        for alias, skill_id in aliases:
+            self._add(alias, skill_id)
+        self._build()
+
+    def _add(self, alias: str, skill_id: str):
+        node = 0
+        for ch in alias:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(alias), skill_id))
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> List[str]:
+        """Returns canonical IDs in order of first appearance, preferring the longest match at each position."""
+        text = text.lower()
+        hits = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, skill_id in self._out[node]:
+                start = i - length + 1
+                before = text[start - 1] if start > 0 else " "
+                after = text[i + 1] if i + 1 < len(text) else " "
+                if before.isalnum() or after.isalnum(): continue
+                hits.append((start, -length, skill_id))
+
+        found, seen, covered_until = [], set(), -1
+        for start, neg_len, skill_id in sorted(hits):
+            if start < covered_until: continue
+            covered_until = start - neg_len
+            if skill_id not in seen:
+                seen.add(skill_id)
+                found.append(skill_id)
+        return found
+
+_skill_matcher: Optional[SkillMatcher] = None
+
+def get_skill_matcher() -> SkillMatcher:
+    global _skill_matcher
+    if _skill_matcher is None:
+        _skill_matcher = SkillMatcher(iter_skill_aliases())
+    return _skill_matcher
+
+def extract_skills(text: str) -> List[str]:
+    """Returns canonical display names for every dictionary skill mentioned in the text."""
+    return [CANONICAL_SKILLS[skill_id][0] for skill_id in get_skill_matcher().find(text)]
+
+# --- Citizenship ---
+_US = r"(?:u\.?\s?s\.?(?:\s?a\.?)?|united states(?: of america)?|american)"
+_CITIZEN_NEGATIVE_RE = re.compile(
+    rf"\bnot\s+(?:a\s+)?{_US}\s+citizen|\brequires?\s+(?:visa\s+)?sponsorship|\bh-?1b\b|\bgreen\s+card\b|\bpermanent\s+resident\b",
+    re.IGNORECASE,
+)
+_CITIZEN_POSITIVE_RE = re.compile(
+    rf"(?<![a-z]){_US}\s+citizen(?:ship)?\b|\bcitizenship\s*[:\-]\s*{_US}(?![a-z])",
+    re.IGNORECASE,
+)
+
+def extract_us_citizenship(text: str) -> bool:
+    """Mirrors the LLM rule: true only when the text states US citizenship, otherwise false."""
+    if _CITIZEN_NEGATIVE_RE.search(text): return False
+    return bool(_CITIZEN_POSITIVE_RE.search(text))
+
+# --- Degrees ---
+# (level, label, long-form pattern, abbreviation pattern); abbreviations are only trusted inside an Education section.
+_DEGREE_PATTERNS = [
+    (4, "PhD", r"\bph\.?\s?d\b|\bdoctor(?:ate)?\s+of\b|\bdoctorate\b", r""),
+    (3, "Master's", r"\bmasters?\b|\bmaster'?s\b", r"\bm\.?\s?sc?\b\.?|\bm\.?\s?tech\b|\bmba\b|\bm\.?\s?eng\b|\bm\.a\.|\bm\.s\."),
+    (2, "Bachelor's", r"\bbachelors?\b|\bbachelor'?s\b", r"\bb\.?\s?sc\b|\bb\.s\.|\bbs\b|\bb\.?\s?tech\b|\bb\.e\.|\bb\.a\.|\bb\.?\s?com\b|\bb\.?\s?eng\b"),
+    (1, "Associate", r"\bassociate'?s?\s+(?:degree|of)\b", r""),
+]
+_YEAR_RE = re.compile(r"\b(19[5-9]\d|20\d\d)\b")
+
+def extract_degree(text: str, education_text: str, now: Optional[datetime] = None) -> Tuple[Optional[str], Optional[int]]:
+    """Returns (highest_qualification, highest_degree_year) for the highest-level degree mentioned."""
+    now = now or datetime.utcnow()
+    scoped = bool(education_text.strip())
+    lines = (education_text if scoped else text).splitlines()
+
+    best = (0, None, None)  # (level, label, year)
+    for idx, line in enumerate(lines):
+        low = line.lower()
+        for level, label, long_form, short_form in _DEGREE_PATTERNS:
+            pattern = long_form + ("|" + short_form if scoped and short_form else "")
+            if not re.search(pattern, low): continue
+            window = " ".join(lines[idx:idx + 2])
+            years = [int(y) for y in _YEAR_RE.findall(window) if int(y) <= now.year + 6]
+            year = max(years) if years else None
+            if level > best[0] or (level == best[0] and (year or 0) > (best[2] or 0)):
+                best = (level, label, year)
+            break
+    return best[1], best[2]
+
+# --- Entry point ---
+def extract_resume_fields(text: str, now: Optional[datetime] = None) -> Tuple[dict, Set[str]]:
+    """
+    Runs every deterministic extractor over the resume text.
+    Returns (fields, confident) where `confident` names the fields the LLM does not need to fill.
+    """
+    now = now or datetime.utcnow()
+    sections = split_sections(text)
+    fields: dict = {}
+    confident: Set[str] = set()
+
+    experience_text = _section_text(sections, "experience")
+    if experience_text:
+        months, ranges = extract_experience_months(experience_text, now)
+        if ranges:
+            fields["calculated_years_of_experience"] = int(round(months / 12))
+            confident.add("calculated_years_of_experience")
+
+    skills = extract_skills(text)
+    fields["skills"] = skills
+    if len(skills) >= MIN_CONFIDENT_SKILLS:
+        confident.add("skills")
+
+    fields["is_us_citizen"] = extract_us_citizenship(text)
+    confident.add("is_us_citizen")
+
+    qualification, degree_year = extract_degree(text, _section_text(sections, "education"), now)
+    if qualification:
+        fields["highest_qualification"] = qualification
+        confident.add("highest_qualification")
+    if degree_year:
+        fields["highest_degree_year"] = degree_year
+        confident.add("highest_degree_year")
+
+    return fields, confident
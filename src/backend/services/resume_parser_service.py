@@ -1,61 +1,99 @@
 # src/backend/services/resume_parser_service.py
 import os
 import json
-from typing import Optional, Dict
-import pypdf
-import docx
+import hashlib
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple
 import requests
 
 # Reuse existing configuration from the NL2GQL service
 from .nl2gql_service import OLLAMA_HOST, OLLAMA_MODEL, OLLAMA_API_KEY
-from ..repository import user_repo, resume_repo
+from ..repository import user_repo, resume_repo, resume_cache_repo
+from . import text_extraction_service, resume_extractor_service, resume_compaction_service, embedding_service, skill_service
 
-def _extract_text_from_pdf(file_path: str) -> str:
-    """Extracts text content from a PDF file."""
+# Bump whenever the LLM prompt or the shape of parsed_data changes,
+# so cached parses from the old prompt are not reused.
+PROMPT_VERSION = "v3"
+HASH_CHUNK_SIZE = 64 * 1024
+
+def save_upload(file_storage, file_path: str) -> str:
+    """
+    Streams an uploaded file to disk and returns its SHA-256 hex digest,
+    computed on the same pass so the file is never read twice.
+    """
+    digest = hashlib.sha256()
+    stream = file_storage.stream
+    with open(file_path, 'wb') as out:
+        while True:
+            chunk = stream.read(HASH_CHUNK_SIZE)
+            if not chunk: break
+            digest.update(chunk)
+            out.write(chunk)
+    return digest.hexdigest()
+
+def hash_file(file_path: str) -> str:
+    """Computes the SHA-256 hex digest of a file already on disk."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _extract_text_from_pdf(file_path: str) -> Tuple[str, bool]:
+    """
+    Extracts text content from a PDF file (page ranges run in the extraction process pool).
+    Returns (text, complete); complete is False when a page range timed out and was skipped.
+    """
     try:
-        with open(file_path, 'rb') as f:
-            reader = pypdf.PdfReader(f)
-            text = "".join(page.extract_text() for page in reader.pages)
-        return text
+        return text_extraction_service.read_pdf_text(file_path)
     except Exception as e:
         print(f"Error reading PDF: {e}")
-        return ""
+        return "", True
 
 def _extract_text_from_docx(file_path: str) -> str:
     """Extracts text content from a DOCX file."""
     try:
-        doc = docx.Document(file_path)
-        return "\n".join(para.text for para in doc.paragraphs)
+        return "".join(text_extraction_service.iter_docx_text(file_path))
     except Exception as e:
         print(f"Error reading DOCX: {e}")
         return ""
 
-def _get_llm_parsed_data(resume_text: str) -> Optional[dict]:
-    """Sends resume text to the LLM for structured data extraction."""
-    
-    # --- UPDATED PROMPT FOR CALCULATED EXPERIENCE ---
-    prompt = (
-        "You are an expert HR assistant. Your task is to extract data and ACCURATELY calculate "
-        "professional experience based on dates found in the resume.\n"
-        "1. Identify all 'Work Experience' or 'Employment' entries.\n"
-        "2. For each entry, extract the Start Date and End Date.\n"
-        "3. Calculate the duration for each role in months.\n"
-        "4. Sum the total duration in months and convert to years (round to nearest whole number).\n"
-        "5. Extract the other specified fields.\n\n"
+# Fields the LLM can be asked for, with the per-field instruction used in the prompt.
+LLM_FIELD_SPECS = {
+    "calculated_years_of_experience": "(integer, the sum you calculated from dates)",
+    "skills": "(list of strings)",
+    "is_us_citizen": "(boolean, strictly based on text 'US Citizen' etc, else false)",
+    "highest_degree_year": "(integer)",
+    "professionalTitle": "(string)",
+    "city": "(string)",
+    "country": "(string)",
+    "highest_qualification": "(string)",
+}
+
+def _build_llm_prompt(resume_text: str, fields: List[str]) -> str:
+    field_lines = "".join(f"- '{f}': {LLM_FIELD_SPECS[f]}\n" for f in fields)
+    if "calculated_years_of_experience" in fields:
+        instructions = (
+            "You are an expert HR assistant. Your task is to extract data and ACCURATELY calculate "
+            "professional experience based on dates found in the resume.\n"
+            "1. Identify all 'Work Experience' or 'Employment' entries.\n"
+            "2. For each entry, extract the Start Date and End Date.\n"
+            "3. Calculate the duration for each role in months.\n"
+            "4. Sum the total duration in months and convert to years (round to nearest whole number).\n"
+            "5. Extract the other specified fields.\n\n"
+        )
+    else:
+        instructions = "You are an expert HR assistant. Extract the specified fields from the resume.\n\n"
+    return (
+        f"{instructions}"
         "Return ONLY a JSON object with these fields:\n"
-        "- 'calculated_years_of_experience': (integer, the sum you calculated from dates)\n"
-        "- 'skills': (list of strings)\n"
-        "- 'is_us_citizen': (boolean, strictly based on text 'US Citizen' etc, else false)\n"
-        "- 'highest_degree_year': (integer)\n"
-        "- 'professionalTitle': (string)\n"
-        "- 'city': (string)\n"
-        "- 'country': (string)\n"
-        "- 'highest_qualification': (string)\n\n"
+        f"{field_lines}\n"
         f"Resume Text:\n---\n{resume_text}"
     )
-    # ------------------------------------------------
-    
-    # RE-INSERTING THE LOGIC FOR CONTEXT (Since I cannot rely on '...' in valid python)
+
+def _get_llm_parsed_data(resume_text: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+    """Sends resume text to the LLM for structured data extraction of the requested fields."""
+    prompt = _build_llm_prompt(resume_text, fields or list(LLM_FIELD_SPECS))
     headers = {"Authorization": f"Bearer {OLLAMA_API_KEY}"}
     api_url = f"{OLLAMA_HOST}/api/generate"
 
@@ -74,64 +112,147 @@ def _get_llm_parsed_data(resume_text: str) -> Optional[dict]:
         print(f"Error parsing resume with LLM: {e}")
         return None
 
-def process_uploaded_resume(file_path: str, user_id: int, original_filename: str, url: str):
+def _parse_resume_text(raw_text: str) -> Tuple[Optional[dict], bool]:
+    """
+    Runs the deterministic extractor first and only asks the LLM for the fields it could not fill confidently.
+    Skills found locally are merged with any the LLM adds. Returns (parsed_data, complete): complete is False
+    when fields were left to the LLM and the LLM call failed, so the result must not be cached.
+    """
+    local_fields, confident = resume_extractor_service.extract_resume_fields(raw_text)
+    missing = [f for f in LLM_FIELD_SPECS if f not in confident]
+
+    # The extractor sees the full text; only the LLM prompt gets the compacted version.
+    prompt_tokens = {"original": resume_compaction_service.estimate_tokens(raw_text), "compacted": 0}
+    llm_fields, complete = {}, True
+    if missing:
+        compacted_text, prompt_tokens = resume_compaction_service.compact_resume_text(raw_text)
+        print(f"Resume prompt compacted from ~{prompt_tokens['original']} to ~{prompt_tokens['compacted']} tokens.")
+        llm_result = _get_llm_parsed_data(compacted_text, missing)
+        complete = llm_result is not None
+        llm_fields = llm_result or {}
+
+    parsed_data = {k: v for k, v in local_fields.items() if k in confident}
+    for field in missing:
+        if field == "skills":
+            parsed_data["skills"] = skill_service.canonicalize_skills(
+                list(local_fields.get("skills") or []) + list(llm_fields.get("skills") or [])
+            )
+        elif llm_fields.get(field) is not None:
+            parsed_data[field] = llm_fields[field]
+        elif local_fields.get(field) is not None:
+            parsed_data[field] = local_fields[field]
+
+    if not llm_fields and not confident - {"is_us_citizen"}:
+        # Neither the extractor nor the LLM produced anything useful.
+        return None, complete
+    parsed_data["prompt_tokens"] = prompt_tokens
+    return parsed_data, complete
+
+def _extract_text(file_path: str) -> Tuple[str, bool]:
+    """Dispatches to the extractor matching the file extension. Returns (text, complete)."""
+    _, file_extension = os.path.splitext(file_path)
+    if file_extension.lower() == '.pdf':
+        return _extract_text_from_pdf(file_path)
+    if file_extension.lower() == '.docx':
+        return _extract_text_from_docx(file_path), True
+    print(f"Unsupported file type: {file_extension}")
+    return "", True
+
+def _extract_and_parse(file_path: str, content_hash: Optional[str] = None) -> Tuple[str, Optional[dict]]:
+    """
+    Returns (raw_text, parsed_data) for a resume file, reusing the parse cache for identical content.
+    Only a cache miss pays for text extraction and the LLM call.
+    """
+    content_hash = content_hash or hash_file(file_path)
+
+    cached = resume_cache_repo.find_cached_parse(content_hash, PROMPT_VERSION)
+    if cached and cached.get("parsedData"):
+        print(f"Resume parse cache hit for {content_hash[:12]}.")
+        return cached.get("rawText") or "", dict(cached["parsedData"])
+
+    raw_text, text_complete = resume_cache_repo.find_cached_text(content_hash), True
+    if not raw_text: raw_text, text_complete = _extract_text(file_path)
+    if not raw_text: return "", None
+    return raw_text, parse_and_cache_text(raw_text, content_hash, text_complete)
+
+def parse_and_cache_text(raw_text: str, content_hash: str, text_complete: bool = True) -> Optional[dict]:
+    """
+    Parses already-extracted text and stores the result in the parse cache. A parse degraded by a failed
+    LLM call, or of text missing a page range that timed out, is returned but not cached, so the next
+    upload of the same file tries again (find_cached_text would otherwise serve the truncated text forever).
+    """
+    parsed_data, complete = _parse_resume_text(raw_text)
+    if parsed_data and complete and text_complete:
+        resume_cache_repo.save_cached_parse(content_hash, PROMPT_VERSION, raw_text, parsed_data)
+    return parsed_data
+
+def build_resume_doc(resume_id: int, user_id: int, original_filename: str, url: str,
+                     raw_text: str, parsed_data: dict, content_hash: Optional[str]) -> dict:
+    """Builds the 'resumes' document for a parsed upload (shared with the bulk ingest script)."""
+    return {
+        "resumeId": resume_id,
+        "userId": user_id,
+        "filename": original_filename,
+        "url": url,
+        "parsedTextSnippet": raw_text[:200], # Store preview
+        "contentHash": content_hash,
+        "uploadedAt": datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "calculatedExperience": parsed_data.get("calculated_years_of_experience", 0),
+        "skills": parsed_data.get("skills", []),
+        "promptTokens": parsed_data.get("prompt_tokens"),
+    }
+
+def build_user_update(parsed_data: dict) -> Tuple[dict, List[str]]:
+    """Returns (set_fields, skills_to_add) for syncing parsed resume data onto the user profile."""
+    update_doc = {}
+    if "calculated_years_of_experience" in parsed_data:
+        update_doc["years_of_experience"] = parsed_data["calculated_years_of_experience"]
+
+    # Reuse existing logic for other fields
+    for k in ['is_us_citizen', 'highest_degree_year', 'professionalTitle', 'city', 'country', 'highest_qualification']:
+        if k in parsed_data and parsed_data[k] is not None:
+            update_doc[k] = parsed_data[k]
+    return update_doc, skill_service.canonicalize_skills(parsed_data.get("skills"))
+
+def process_uploaded_resume(file_path: str, user_id: int, original_filename: str, url: str, content_hash: Optional[str] = None):
     """
     New handler for the Multi-Resume workflow.
     Parses the file, stores metadata in 'resumes' collection, and optionally updates the User profile.
     """
     print(f"Processing new resume upload for User {user_id}...")
     try:
-        # 1. Extract Text
-        _, file_extension = os.path.splitext(file_path)
-        raw_text = ""
-        if file_extension.lower() == '.pdf':
-            raw_text = _extract_text_from_pdf(file_path)
-        elif file_extension.lower() == '.docx':
-            raw_text = _extract_text_from_docx(file_path)
-            
-        if not raw_text: return
+        content_hash = content_hash or hash_file(file_path)
 
-        # 2. LLM Extraction
-        parsed_data = _get_llm_parsed_data(raw_text)
-        if not parsed_data: return
+        # 1 + 2. Extract Text and LLM Extraction (served from the parse cache for duplicate files)
+        raw_text, parsed_data = _extract_and_parse(file_path, content_hash)
+        if not raw_text or not parsed_data: return
 
         # 3. Save to Resumes Collection
-        resume_doc = {
-            "resumeId": resume_repo.next_resume_id(),
-            "userId": user_id,
-            "filename": original_filename,
-            "url": url,
-            "parsedTextSnippet": raw_text[:200], # Store preview
-            "uploadedAt": "2025-12-02T00:00:00Z", # In real code use datetime.utcnow().isoformat()
-            "calculatedExperience": parsed_data.get("calculated_years_of_experience", 0),
-            "skills": parsed_data.get("skills", [])
-        }
+        resume_doc = build_resume_doc(
+            resume_repo.next_resume_id(), user_id, original_filename, url, raw_text, parsed_data, content_hash
+        )
         resume_repo.insert_resume(resume_doc)
         print(f"Resume {resume_doc['resumeId']} saved to library.")
 
         # 4. Optional: Update User Profile (Additive logic)
         # We only update the profile if this is likely their "primary" info
         # For now, we sync the skills and experience to the main profile to keep data fresh
-        update_doc = {}
-        if "calculated_years_of_experience" in parsed_data:
-            update_doc["years_of_experience"] = parsed_data["calculated_years_of_experience"]
-        
-        # Reuse existing logic for other fields
-        for k in ['is_us_citizen', 'highest_degree_year', 'professionalTitle', 'city', 'country', 'highest_qualification']:
-            if k in parsed_data and parsed_data[k] is not None:
-                update_doc[k] = parsed_data[k]
+        update_doc, skills = build_user_update(parsed_data)
 
         if update_doc:
             user_repo.update_one({"UserID": user_id}, update_doc)
             
-        if "skills" in parsed_data and parsed_data["skills"]:
-             user_repo.add_skills_to_user(user_id, parsed_data["skills"])
+        if skills:
+             user_repo.add_skills_to_user(user_id, skills)
+             skill_service.record_skills(skill_service.USER, user_id, skills)
+
+        embedding_service.index_candidate(user_id)
 
     except Exception as e:
         print(f"Error in multi-resume processing: {e}")
 
 # ... (Keep existing parse_resume_and_update_user for legacy compatibility) ...
-def parse_resume_and_update_user(file_path: str, user_id: int):
+def parse_resume_and_update_user(file_path: str, user_id: int, content_hash: Optional[str] = None):
     # This function remains exactly as is to support the existing legacy upload endpoint
     # I am not pasting it here to save space, but DO NOT REMOVE IT.
     pass
@@ -141,21 +262,15 @@ def parse_resume_and_update_user(file_path: str, user_id: int):
     print(f"Starting resume parsing for user {user_id} from file {file_path}...")
     try:
         _, file_extension = os.path.splitext(file_path)
-        raw_text = ""
-        
-        if file_extension.lower() == '.pdf':
-            raw_text = _extract_text_from_pdf(file_path)
-        elif file_extension.lower() == '.docx':
-            raw_text = _extract_text_from_docx(file_path)
-        else:
+        if file_extension.lower() not in ('.pdf', '.docx'):
             print(f"Unsupported file type: {file_extension}")
             return
 
+        raw_text, parsed_data = _extract_and_parse(file_path, content_hash)
         if not raw_text:
             print("Could not extract text from resume.")
             return
 
-        parsed_data = _get_llm_parsed_data(raw_text)
         if not parsed_data:
             print("LLM parsing failed or returned no data.")
             return
@@ -177,13 +292,15 @@ def parse_resume_and_update_user(file_path: str, user_id: int):
             # Handle skills specially (addToSet usually, but here we might merge)
             if 'skills' in update_doc and isinstance(update_doc['skills'], list):
                 # We pull skills out to use the specific repo method that appends them
-                skills_to_add = update_doc.pop('skills')
+                skills_to_add = skill_service.canonicalize_skills(update_doc.pop('skills'))
                 user_repo.add_skills_to_user(user_id, skills_to_add)
+                skill_service.record_skills(skill_service.USER, user_id, skills_to_add)
 
             # Update the rest of the fields (including is_us_citizen)
             if update_doc:
                 user_repo.update_one({"UserID": user_id}, update_doc)
-            
+
+            embedding_service.index_candidate(user_id)
             print(f"Successfully updated user {user_id} profile from resume. Data: {update_doc}")
 
     except Exception as e:
@@ -0,0 +1,136 @@
+# src/backend/services/rollup_service.py
+"""
+Daily hiring rollups built from the `application_events` time series.
+
+A run aggregates status transitions into one `rollups` document per UTC
+day and dimension key (job, company, hiring manager) holding funnel
+counts and time-to-hire samples, and $merges them on a deterministic _id.
+A watermark in `rollup_state` limits each run to events since the last
+one: the run recomputes from the start of the watermark's day up to
+now - ROLLUP_SAFETY_LAG_SECONDS, so touched days are always rebuilt
+whole and re-running is idempotent. The lag leaves room for in-flight
+writes, whose ts is taken before the insert lands.
+
+hiringMetrics reads only from `rollups`.
+"""
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from ..db import application_events_collection, rollups_collection, rollup_state_collection
+
+ROLLUP_SAFETY_LAG_SECONDS = int(os.getenv("ROLLUP_SAFETY_LAG_SECONDS", 300))
+ROLLUP_NAME = "hiring"
+
+# Rollup field -> status the application moved into
+FUNNEL = {
+    "invites": "InterviewInviteSent",
+    "interviews": "Interviewing",
+    "offers": "Offered",
+    "hires": "Hired",
+    "rejections": "Rejected",
+}
+COUNTERS = ["applications"] + list(FUNNEL)
+DIMENSIONS = ("job", "company", "manager")
+
+_EPOCH = datetime(1970, 1, 1)
+_DAY_MS = 24 * 60 * 60 * 1000
+
+def day_start(moment: datetime) -> datetime:
+    return datetime(moment.year, moment.month, moment.day)
+
+# --- Building ---
+def rollup_pipeline(start: datetime, end: datetime) -> list:
+    """Daily buckets for every dimension from events with start <= ts < end."""
+    counters = {"applications": {"$sum": {"$cond": [{"$eq": [{"$ifNull": ["$from", None]}, None]}, 1, 0]}}}
+    for field, status in FUNNEL.items():
+        counters[field] = {"$sum": {"$cond": [{"$eq": ["$to", status]}, 1, 0]}}
+
+    return [
+        {"$match": {"ts": {"$gte": start, "$lt": end}}},
+        {"$lookup": {"from": "jobs", "localField": "meta.jobId", "foreignField": "jobId", "as": "job"}},
+        # Archived jobs keep their company/manager buckets on rebuild (archive_service)
+        {"$lookup": {"from": "jobs_archive", "localField": "meta.jobId", "foreignField": "jobId", "as": "archivedJob"}},
+        {"$project": {
+            "_id": 0,
+            "from": 1,
+            "to": 1,
+            "day": {"$dateFromParts": {"year": {"$year": "$ts"}, "month": {"$month": "$ts"}, "day": {"$dayOfMonth": "$ts"}}},
+            "tth": {"$cond": [
+                {"$and": [{"$eq": ["$to", "Hired"]}, {"$eq": [{"$type": "$appliedAt"}, "date"]}]},
+                {"$divide": [{"$subtract": ["$ts", "$appliedAt"]}, _DAY_MS]},
+                None,
+            ]},
+            "job": {"$ifNull": [{"$arrayElemAt": ["$job", 0]}, {"$arrayElemAt": ["$archivedJob", 0]}]},
+            "jobId": "$meta.jobId",
+        }},
+        {"$project": {
+            "from": 1, "to": 1, "day": 1, "tth": 1,
+            "dims": [
+                {"dim": "job", "key": "$jobId", "label": "$job.title"},
+                {"dim": "company", "key": "$job.company", "label": "$job.company"},
+                {"dim": "manager", "key": "$job.hiringManagerId", "label": "$job.hiringManagerName"},
+            ],
+        }},
+        {"$unwind": "$dims"},
+        {"$match": {"dims.key": {"$ne": None}}},  # Deleted jobs keep only their job bucket
+        {"$group": {
+            "_id": {"dim": "$dims.dim", "key": "$dims.key", "day": "$day"},
+            "label": {"$last": "$dims.label"},
+            **counters,
+            "tth": {"$push": "$tth"},
+        }},
+        {"$project": {
+            "dim": "$_id.dim",
+            "key": "$_id.key",
+            "day": "$_id.day",
+            "label": 1,
+            **{field: 1 for field in counters},
+            "timeToHireDays": {"$filter": {"input": "$tth", "cond": {"$ne": ["$$this", None]}}},
+        }},
+    ]
+
+def watermark() -> Optional[datetime]:
+    return (rollup_state_collection().find_one({"_id": ROLLUP_NAME}) or {}).get("watermark")
+
+def run(now: Optional[datetime] = None) -> Dict:
+    """One incremental run. Returns the [start, end) window that was (re)aggregated, or None values if idle."""
+    now = now or datetime.utcnow()
+    end = now - timedelta(seconds=ROLLUP_SAFETY_LAG_SECONDS)
+    last = watermark()
+    if last and end <= last:
+        return {"start": None, "end": None}
+
+    start = day_start(last) if last else _EPOCH
+    application_events_collection().aggregate(rollup_pipeline(start, end) + [{"$merge": {
+        "into": "rollups", "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert",
+    }}])
+    # $max: a slower concurrent run never moves the watermark back.
+    rollup_state_collection().update_one(
+        {"_id": ROLLUP_NAME}, {"$max": {"watermark": end}, "$set": {"lastRunAt": now}}, upsert=True
+    )
+    return {"start": start, "end": end}
+
+def rebuild(now: Optional[datetime] = None) -> Dict:
+    """Drops every bucket and the watermark, then aggregates all events again."""
+    rollups_collection().delete_many({})
+    rollup_state_collection().delete_one({"_id": ROLLUP_NAME})
+    return run(now)
+
+# --- Reads ---
+def load_metrics(dim: str, start: datetime, end: datetime, keys: Optional[Iterable] = None) -> List[dict]:
+    """Sums the daily buckets of one dimension over [start day, end day], per key, busiest first."""
+    q = {"dim": dim, "day": {"$gte": day_start(start), "$lte": day_start(end)}}
+    if keys is not None: q["key"] = {"$in": list(keys)}
+
+    groups: Dict = {}
+    for row in rollups_collection().find(q, {"_id": 0}).sort("day", 1):
+        g = groups.setdefault(row["key"], {
+            "key": row["key"], "label": None, **{field: 0 for field in COUNTERS},
+            "timeToHireDays": [], "daily": [],
+        })
+        g["label"] = row.get("label") or g["label"]
+        for field in COUNTERS: g[field] += row.get(field) or 0
+        g["timeToHireDays"] += row.get("timeToHireDays") or []
+        g["daily"].append({"day": row["day"], "applications": row.get("applications") or 0, "hires": row.get("hires") or 0})
+    return sorted(groups.values(), key=lambda g: (-g["applications"], str(g["key"])))
@@ -1,13 +1,22 @@
+import os
+import threading
+from collections import deque
 from datetime import datetime, timedelta
+from bisect import bisect_right
 import logging
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from . import availability_service, reminder_service, event_log_service, job_stats_service
 
 logger = logging.getLogger(__name__)
 
-# Helper to handle ISO strings safely
+# Bookings reserve every granule they touch per participant; back-to-back bookings
+# that are not aligned to the granule will conflict, so keep it a divisor of slot lengths.
+SLOT_GRANULE_MINUTES = int(os.getenv("INTERVIEW_SLOT_GRANULE_MINUTES", 15))
+
+# Helper to handle ISO strings safely (stored times are already datetimes and pass through)
 def parse_iso(date_str):
-    if not date_str: return None
-    if date_str.endswith('Z'): date_str = date_str[:-1]
-    return datetime.fromisoformat(date_str)
+    from ..db import parse_datetime
+    return parse_datetime(date_str)
 
 def set_recruiter_availability(recruiter_id: int, availability_data: list):
     """
@@ -16,9 +25,16 @@ def set_recruiter_availability(recruiter_id: int, availability_data: list):
     from ..db import schedules_collection
     
     try:
+        # Compile the weekly bitmap once here instead of on every slot search.
+        bitmap, exact = availability_service.compile_availability(availability_data)
         schedules_collection().update_one(
             {"recruiterId": recruiter_id},
-            {"$set": {"availability": availability_data, "recruiterId": recruiter_id}},
+            {"$set": {
+                "availability": availability_data,
+                "recruiterId": recruiter_id,
+                "availabilityBitmap": availability_service.to_hex(bitmap),
+                "availabilityExact": exact,
+            }},
             upsert=True
         )
         return True # <--- CRITICAL: Must return True for GraphQL Boolean! field
@@ -26,6 +42,123 @@ def set_recruiter_availability(recruiter_id: int, availability_data: list):
         logger.error(f"Error setting availability: {e}")
         return False
 
+DAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+def _compile_rules(availability: list) -> dict:
+    """
+    Parses weekly availability rules once: {weekday_index: [(start_time, end_time), ...]} in rule order.
+    Malformed rules are logged and skipped.
+    """
+    compiled = {}
+    for rule in availability or []:
+        try:
+            day = DAY_NAMES.index(rule.get("dayOfWeek", "").lower())
+            s_time = datetime.strptime(rule["startTime"], "%H:%M").time()
+            e_time = datetime.strptime(rule["endTime"], "%H:%M").time()
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.error(f"Skipping malformed availability rule {rule}: {e}")
+            continue
+        compiled.setdefault(day, []).append((s_time, e_time))
+    return compiled
+
+def _expand_windows(compiled: dict, start_date: datetime, end_date: datetime):
+    """Yields concrete (window_start, window_end) datetimes per day in [start_date, end_date], in rule order."""
+    current = start_date
+    while current <= end_date:
+        for s_time, e_time in compiled.get(current.weekday(), ()):
+            yield datetime.combine(current.date(), s_time), datetime.combine(current.date(), e_time)
+        current += timedelta(days=1)
+
+def _merge_intervals(intervals) -> list:
+    """Sorts and merges overlapping or touching (start, end) intervals into a disjoint list."""
+    merged = []
+    for s, e in sorted(intervals):
+        if merged and s <= merged[-1][1]:
+            if e > merged[-1][1]: merged[-1][1] = e
+        else:
+            merged.append([s, e])
+    return [(s, e) for s, e in merged]
+
+def _sweep_slots(windows, busy: list, duration_minutes: int, now: datetime) -> list:
+    """
+    Steps each window in duration-sized slots and keeps slots that start after `now` and
+    overlap no busy interval. `busy` must be merged (disjoint, sorted); within a window the
+    pointer into it only moves forward, so each window costs O(slots + log bookings).
+    """
+    step = timedelta(minutes=duration_minutes)
+    busy_ends = [e for _, e in busy]
+    open_slots = []
+    for window_start, window_end in windows:
+        slot_start = window_start
+        i = bisect_right(busy_ends, slot_start)
+        while slot_start + step <= window_end:
+            slot_end = slot_start + step
+            while i < len(busy) and busy[i][1] <= slot_start: i += 1
+            if slot_start > now and not (i < len(busy) and busy[i][0] < slot_end):
+                open_slots.append(slot_start.isoformat())
+            slot_start = slot_end
+    return open_slots
+
+def compute_open_slots(availability: list, busy_intervals, start_date: datetime, end_date: datetime,
+                       duration_minutes: int = 30, now: datetime = None) -> list:
+    """Pure slot computation: weekly rules minus busy (start, end) datetimes, as ISO start strings."""
+    compiled = _compile_rules(availability)
+    if not compiled: return []
+    windows = _expand_windows(compiled, start_date, end_date)
+    return _sweep_slots(windows, _merge_intervals(busy_intervals), duration_minutes, now or datetime.utcnow())
+
+def _parse_bookings(bookings) -> list:
+    intervals = []
+    for b in bookings:
+        try:
+            intervals.append((parse_iso(b.get("startTime")), parse_iso(b.get("endTime"))))
+        except (ValueError, TypeError, AttributeError): continue
+    return [(s, e) for s, e in intervals if s is not None and e is not None]
+
+def _interviewer_busy_weeks(interviewer_id: int, version: tuple, weeks: list) -> dict:
+    """Busy bitmaps for the interviewer per week, from the cache when bookingsVersion still matches."""
+    from ..db import interviews_collection
+
+    busy, missing = {}, []
+    for week in weeks:
+        cached = availability_service.get_cached_busy(interviewer_id, week, version)
+        if cached is None: missing.append(week)
+        else: busy[week] = cached
+    if missing:
+        range_start, range_end = missing[0], missing[-1] + timedelta(days=7)
+        booked = interviews_collection().find({
+            "$or": [{"recruiterId": interviewer_id}, {"hiringManagerId": interviewer_id}],
+            "startTime": {"$lt": range_end},
+            "endTime": {"$gt": range_start}
+        }, {"_id": 0, "startTime": 1, "endTime": 1})
+        fresh = availability_service.build_week_bitmaps(_parse_bookings(booked), missing)
+        for week, bitmap in fresh.items():
+            availability_service.put_cached_busy(interviewer_id, week, version, bitmap)
+        busy.update(fresh)
+    return busy
+
+def _find_open_slots_bitmap(schedule: dict, bitmap_hex: str, interviewer_id: int, candidate_id: int,
+                            start_date: datetime, end_date: datetime, duration_minutes: int) -> list:
+    from ..db import interviews_collection
+
+    weeks, week = [], availability_service.week_start(start_date)
+    while week <= end_date:
+        weeks.append(week)
+        week += timedelta(days=7)
+
+    # The document _id is part of the version so a re-seeded schedule never matches stale entries.
+    version = (str(schedule.get("_id")), schedule.get("bookingsVersion", 0))
+    busy = _interviewer_busy_weeks(interviewer_id, version, weeks)
+    candidate_booked = interviews_collection().find({
+        "candidateId": candidate_id,
+        "startTime": {"$gte": start_date},
+        "endTime": {"$lte": end_date}
+    }, {"_id": 0, "startTime": 1, "endTime": 1})
+    for week, bitmap in availability_service.build_week_bitmaps(_parse_bookings(candidate_booked), weeks).items():
+        busy[week] = busy.get(week, 0) | bitmap
+
+    return availability_service.open_slots(bitmap_hex, busy, start_date, end_date, duration_minutes, datetime.utcnow())
+
 def find_open_slots(interviewer_id: int, candidate_id: int, start_date: datetime, end_date: datetime, duration_minutes: int = 30):
     from ..db import schedules_collection, interviews_collection
 
@@ -35,85 +168,176 @@ def find_open_slots(interviewer_id: int, candidate_id: int, start_date: datetime
     if not schedule or not schedule.get("availability"):
         return [] # No availability set
 
+    if duration_minutes > 0 and duration_minutes % availability_service.GRANULE_MINUTES == 0:
+        bitmap_hex, exact = schedule.get("availabilityBitmap"), schedule.get("availabilityExact")
+        if bitmap_hex is None:
+            # Schedules saved before bitmaps existed
+            bitmap, exact = availability_service.compile_availability(schedule["availability"])
+            bitmap_hex = availability_service.to_hex(bitmap)
+        if exact:
+            return _find_open_slots_bitmap(schedule, bitmap_hex, interviewer_id, candidate_id, start_date, end_date, duration_minutes)
+
     # 2. Get Bookings
     # Check if this person is booked as a Recruiter OR as a Hiring Manager
-    booked = list(interviews_collection().find({
+    booked = interviews_collection().find({
         "$or": [
             {"recruiterId": interviewer_id}, 
             {"hiringManagerId": interviewer_id},
             {"candidateId": candidate_id}
         ],
-        "startTime": {"$gte": start_date.isoformat()},
-        "endTime": {"$lte": end_date.isoformat()}
-    }))
-    
-    booked_slots = []
-    for b in booked:
-        try:
-            booked_slots.append((parse_iso(b.get("startTime")), parse_iso(b.get("endTime"))))
-        except: continue
+        "startTime": {"$gte": start_date},
+        "endTime": {"$lte": end_date}
+    }, {"_id": 0, "startTime": 1, "endTime": 1})
 
     # 3. Generate Slots
-    open_slots = []
-    day_map = {0: "Monday", 1: "Tuesday", 2: "Wednesday", 3: "Thursday", 4: "Friday", 5: "Saturday", 6: "Sunday"}
-    current = start_date
-    now = datetime.utcnow()
+    return compute_open_slots(schedule["availability"], _parse_bookings(booked), start_date, end_date, duration_minutes)
 
-    while current <= end_date:
-        day_name = day_map[current.weekday()]
-        
-        for rule in schedule["availability"]:
-            if rule.get("dayOfWeek", "").lower() != day_name.lower(): continue
-            
-            try:
-                s_time = datetime.strptime(rule["startTime"], "%H:%M").time()
-                e_time = datetime.strptime(rule["endTime"], "%H:%M").time()
-                
-                slot_start = datetime.combine(current.date(), s_time)
-                limit = datetime.combine(current.date(), e_time)
-                
-                while slot_start + timedelta(minutes=duration_minutes) <= limit:
-                    slot_end = slot_start + timedelta(minutes=duration_minutes)
-                    
-                    # Skip past slots and conflicts
-                    if slot_start > now:
-                        conflict = any(bs < slot_end and be > slot_start for bs, be in booked_slots)
-                        if not conflict:
-                            open_slots.append(slot_start.isoformat())
-                    
-                    slot_start += timedelta(minutes=duration_minutes)
-            except Exception as e:
-                logger.error(f"Error processing slot: {e}")
-                continue
-                
-        current += timedelta(days=1)
-        
-    return open_slots
+def _intersect_intervals(a: list, b: list) -> list:
+    """Two-pointer intersection of two disjoint, sorted interval lists."""
+    result, i, j = [], 0, 0
+    while i < len(a) and j < len(b):
+        s, e = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+        if s < e: result.append((s, e))
+        if a[i][1] < b[j][1]: i += 1
+        else: j += 1
+    return result
 
-def book_interview(job_id, candidate_id, recruiter_id, start_time, end_time, hiring_manager_id=None):
-    from ..db import interviews_collection, next_interview_id
-    from ..repository.application_repo import update_one_application
-    from ..repository import user_repo, job_repo
-    from ..services.email_service import send_interview_invitation
-    
-    # Identify who needs to be checked for conflicts (The Interviewer)
-    # If a Manager is assigned, they are the interviewer. If not, the Recruiter is.
-    interviewer_to_check = hiring_manager_id if hiring_manager_id else recruiter_id
-    
-    # Conflict Check
-    conflict_query = {
+def compute_panel_slots(availabilities: list, busy_intervals, start_date: datetime, end_date: datetime,
+                        duration_minutes: int = 30, now: datetime = None) -> list:
+    """
+    Common free slots for several people: each person's weekly rules become a merged window list,
+    the lists are intersected pairwise, and the union of everyone's bookings is swept out once.
+    """
+    windows = None
+    for availability in availabilities:
+        compiled = _compile_rules(availability)
+        if not compiled: return []
+        person = _merge_intervals(_expand_windows(compiled, start_date, end_date))
+        windows = person if windows is None else _intersect_intervals(windows, person)
+        if not windows: return []
+    if windows is None: return []
+    return _sweep_slots(windows, _merge_intervals(busy_intervals), duration_minutes, now or datetime.utcnow())
+
+def find_panel_slots(panel_ids: list, candidate_id: int, start_date: datetime, end_date: datetime, duration_minutes: int = 30):
+    from ..db import schedules_collection, interviews_collection
+
+    panel_ids = list(dict.fromkeys(int(p) for p in panel_ids))
+    schedules = {s["recruiterId"]: s.get("availability") for s in schedules_collection().find(
+        {"recruiterId": {"$in": panel_ids}}, {"_id": 0, "recruiterId": 1, "availability": 1}
+    )}
+    if any(not schedules.get(p) for p in panel_ids):
+        return [] # Someone on the panel has no availability set
+
+    booked = interviews_collection().find({
         "$or": [
-            {"recruiterId": interviewer_to_check},
-            {"hiringManagerId": interviewer_to_check}, # <--- Checks new field
+            {"recruiterId": {"$in": panel_ids}},
+            {"hiringManagerId": {"$in": panel_ids}},
             {"candidateId": candidate_id}
         ],
-        "startTime": {"$lt": end_time.isoformat()},
-        "endTime": {"$gt": start_time.isoformat()}
-    }
-    
-    conflict = interviews_collection().find_one(conflict_query)
-    if conflict: raise ValueError("Conflict detected. Slot unavailable.")
+        "startTime": {"$gte": start_date},
+        "endTime": {"$lte": end_date}
+    }, {"_id": 0, "startTime": 1, "endTime": 1})
+
+    return compute_panel_slots([schedules[p] for p in panel_ids], _parse_bookings(booked), start_date, end_date, duration_minutes)
+
+def _filter_slots(slots: list, busy: list, duration_minutes: int) -> list:
+    """Drops ISO slot starts overlapping any merged busy interval (bisect per slot)."""
+    if not busy: return list(slots)
+    step = timedelta(minutes=duration_minutes)
+    busy_ends = [e for _, e in busy]
+    kept = []
+    for iso in slots:
+        slot_start = datetime.fromisoformat(iso)
+        i = bisect_right(busy_ends, slot_start)
+        if not (i < len(busy) and busy[i][0] < slot_start + step):
+            kept.append(iso)
+    return kept
+
+def find_slots_for_candidates(interviewer_id: int, candidate_ids: list, start_date: datetime, end_date: datetime, duration_minutes: int = 30) -> dict:
+    """
+    Open slots for many candidates against one interviewer: {candidateId: [iso, ...]}.
+    The schedule and all bookings are read once; the interviewer's free slots are computed
+    once and then filtered by each candidate's own bookings.
+    """
+    from ..db import schedules_collection, interviews_collection
+
+    candidate_ids = list(dict.fromkeys(int(c) for c in candidate_ids))
+    schedule = schedules_collection().find_one({"recruiterId": interviewer_id})
+    if not schedule or not schedule.get("availability"):
+        return {c: [] for c in candidate_ids}
 
+    booked = interviews_collection().find({
+        "$or": [
+            {"recruiterId": interviewer_id},
+            {"hiringManagerId": interviewer_id},
+            {"candidateId": {"$in": candidate_ids}}
+        ],
+        "startTime": {"$gte": start_date},
+        "endTime": {"$lte": end_date}
+    }, {"_id": 0, "recruiterId": 1, "hiringManagerId": 1, "candidateId": 1, "startTime": 1, "endTime": 1})
+
+    interviewer_busy, candidate_busy = [], {c: [] for c in candidate_ids}
+    for b in booked:
+        interval = _parse_bookings([b])
+        if not interval: continue
+        if interviewer_id in (b.get("recruiterId"), b.get("hiringManagerId")):
+            interviewer_busy.extend(interval)
+        if b.get("candidateId") in candidate_busy:
+            candidate_busy[b["candidateId"]].extend(interval)
+
+    base_slots = compute_open_slots(schedule["availability"], interviewer_busy, start_date, end_date, duration_minutes)
+    return {c: _filter_slots(base_slots, _merge_intervals(candidate_busy[c]), duration_minutes) for c in candidate_ids}
+
+def slot_granules(start_time: datetime, end_time: datetime) -> list:
+    """Granule start times (ISO strings) overlapped by [start_time, end_time)."""
+    granule = timedelta(minutes=SLOT_GRANULE_MINUTES)
+    day_start = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
+    current = day_start + ((start_time - day_start) // granule) * granule
+    granules = []
+    while current < end_time:
+        granules.append(current.isoformat())
+        current += granule
+    return granules
+
+def build_slot_reservations(interview_id: int, person_ids, start_time: datetime, end_time: datetime) -> list:
+    granules = slot_granules(start_time, end_time)
+    people = dict.fromkeys(p for p in person_ids if p is not None)
+    return [{"personId": p, "slotStart": g, "interviewId": interview_id} for p in people for g in granules]
+
+def slot_participants(recruiter_id, hiring_manager_id, candidate_id) -> list:
+    """
+    Whose calendars a booking blocks: the interviewer (the hiring manager, else the poster)
+    and the candidate. The coordinating recruiter is not an attendee when a hiring manager
+    interviews, matching what the slot search treats as busy.
+    """
+    return [hiring_manager_id or recruiter_id, candidate_id]
+
+def reserve_slots(interview_id: int, person_ids, start_time: datetime, end_time: datetime):
+    """
+    Atomically claims every granule of the booking for every participant via the unique
+    (personId, slotStart) index. On any duplicate the partial claim is rolled back and
+    the conflict is reported as a ValueError.
+    """
+    from ..db import interview_slots_collection
+
+    reservations = build_slot_reservations(interview_id, person_ids, start_time, end_time)
+    if not reservations: return
+    try:
+        interview_slots_collection().insert_many(reservations, ordered=True)
+    except (BulkWriteError, DuplicateKeyError):
+        release_slots(interview_id)
+        raise ValueError("Conflict detected. Slot unavailable.")
+
+def release_slots(interview_id: int):
+    from ..db import interview_slots_collection
+    interview_slots_collection().delete_many({"interviewId": interview_id})
+
+def book_interview(job_id, candidate_id, recruiter_id, start_time, end_time, hiring_manager_id=None, actor=None):
+    from ..db import interviews_collection, schedules_collection, next_interview_id
+    from ..repository.application_repo import transition_application_status
+    from ..repository import user_repo, job_repo
+    from ..services.email_service import send_interview_invitation
+    
     # Save Document with Separate Fields
     doc = {
         "interviewId": next_interview_id(),
@@ -121,17 +345,252 @@ def book_interview(job_id, candidate_id, recruiter_id, start_time, end_time, hir
         "candidateId": candidate_id, 
         "recruiterId": recruiter_id,          # The Coordinator (Alice)
         "hiringManagerId": hiring_manager_id, # The Interviewer (Sarah)
-        "startTime": start_time.isoformat(), 
-        "endTime": end_time.isoformat()
+        "startTime": start_time,
+        "endTime": end_time,
+        "updatedAt": datetime.utcnow()  # Calendar feed version (calendar_service)
     }
-    interviews_collection().insert_one(doc)
+
+    # Conflict Check: reserving the slot for the interviewer and candidate is the check (no read round trip).
+    reserve_slots(doc["interviewId"], slot_participants(recruiter_id, hiring_manager_id, candidate_id), start_time, end_time)
+    try:
+        interviews_collection().insert_one(doc)
+    except DuplicateKeyError:
+        # Legacy (recruiterId, startTime) unique index from repair_indexes.py
+        release_slots(doc["interviewId"])
+        raise ValueError("Conflict detected. Slot unavailable.")
+    except Exception:
+        release_slots(doc["interviewId"])
+        raise
+
+    # Invalidate cached busy bitmaps (here and, via the version bump, in other processes)
+    busy_people = [p for p in (hiring_manager_id, recruiter_id) if p is not None]
+    schedules_collection().update_many({"recruiterId": {"$in": busy_people}}, {"$inc": {"bookingsVersion": 1}})
+    availability_service.invalidate_busy(busy_people)
     
+    reminder_service.schedule_interview_reminders([doc])
+
     # Update Status & Email
-    app = update_one_application({"userId": candidate_id, "jobId": job_id}, {"status": "Interviewing"})
+    before, app = transition_application_status({"userId": candidate_id, "jobId": job_id}, "Interviewing")
+    event_log_service.record_transition(before, "Interviewing", actor)
     cand = user_repo.find_one_by_id(candidate_id)
     job = job_repo.find_job_by_id(job_id)
     
     if cand and job:
         send_interview_invitation(cand["email"], cand["firstName"], job["title"], job["company"], app["appId"] if app else 0)
         
-    return doc
\ No newline at end of file
+    return doc
+
+# --- Batch auto-scheduling ---
+# Candidates past this point (interviewing, offered, rejected, hired, ...) are never batch-booked.
+INVITEABLE_STATUSES = ["Applied", "InterviewInviteSent"]
+
+def _non_overlapping(slots: list, duration_minutes: int) -> list:
+    """
+    Unique slot starts in time order, dropping any that would reserve a granule of an earlier kept slot
+    (overlapping rules, or rule times not aligned to SLOT_GRANULE_MINUTES), so the batch never conflicts
+    with itself on insert.
+    """
+    step = timedelta(minutes=duration_minutes)
+    kept, last_granule = [], None
+    for iso in sorted(set(slots)):
+        start = datetime.fromisoformat(iso)
+        granules = slot_granules(start, start + step)
+        if last_granule is None or datetime.fromisoformat(granules[0]) > last_granule:
+            kept.append(iso)
+            last_granule = datetime.fromisoformat(granules[-1])
+    return kept
+
+def maximum_matching(options: dict) -> dict:
+    """
+    Hopcroft-Karp maximum bipartite matching of left keys to right items.
+    options: {left: [right, ...]} in preference order. A greedy pass (most constrained
+    left first, earliest free right) seeds the matching; BFS layering plus iterative DFS
+    augments it to maximum without recursion limits.
+    """
+    match_left, match_right = {}, {}
+    for left in sorted(options, key=lambda l: len(options[l])):
+        for right in options[left]:
+            if right not in match_right:
+                match_left[left], match_right[right] = right, left
+                break
+
+    INF = float("inf")
+    while True:
+        # BFS from free left vertices builds the layered graph.
+        dist, queue, found = {}, deque(), False
+        for left in options:
+            if left not in match_left:
+                dist[left] = 0
+                queue.append(left)
+        while queue:
+            left = queue.popleft()
+            for right in options[left]:
+                nxt = match_right.get(right)
+                if nxt is None: found = True
+                elif nxt not in dist:
+                    dist[nxt] = dist[left] + 1
+                    queue.append(nxt)
+        if not found: break
+
+        # Iterative DFS along the layers for vertex-disjoint augmenting paths.
+        for root in [l for l in options if l not in match_left]:
+            stack, path = [(root, iter(options[root]))], []
+            while stack:
+                left, it = stack[-1]
+                advanced = False
+                for right in it:
+                    nxt = match_right.get(right)
+                    if nxt is None:
+                        # Flip the path root -> ... -> left -> right.
+                        for l, r in path + [(left, right)]:
+                            match_left[l], match_right[r] = r, l
+                        stack = []
+                        advanced = True
+                        break
+                    if dist.get(nxt) == dist[left] + 1:
+                        path.append((left, right))
+                        stack.append((nxt, iter(options[nxt])))
+                        advanced = True
+                        break
+                if not advanced:
+                    dist[left] = INF  # Dead end: prune for the rest of this phase
+                    stack.pop()
+                    if path: path.pop()
+    return match_left
+
+def _send_invitations(job: dict, booked: list):
+    """Emails every batch-booked candidate; runs off the request thread, so failures are logged per candidate."""
+    from ..repository import user_repo, application_repo
+    from ..services.email_service import send_interview_invitation
+
+    try:
+        users = {u["UserID"]: u for u in user_repo.find_users_by_ids([b["candidateId"] for b in booked])}
+        apps = {a["userId"]: a for a in application_repo.find_applications({"jobId": job["jobId"], "userId": {"$in": list(users)}})}
+    except Exception as e:
+        logger.error(f"Interview invitations for job {job.get('jobId')} not sent ({len(booked)} candidates): {e}")
+        return
+    for b in booked:
+        cand = users.get(b["candidateId"])
+        if not cand:
+            logger.warning(f"Interview invitation skipped: candidate {b['candidateId']} not found.")
+            continue
+        app = apps.get(b["candidateId"])
+        try:
+            send_interview_invitation(cand["email"], cand["firstName"], job["title"], job["company"], app["appId"] if app else 0)
+        except Exception as e:
+            logger.error(f"Interview invitation to candidate {b['candidateId']} failed: {e}")
+
+def auto_schedule_interviews(job: dict, candidate_ids: list, start_date: datetime, end_date: datetime, duration_minutes: int = 30, actor: dict = None) -> dict:
+    """
+    Assigns distinct interviewer slots to as many candidates as possible and books them in bulk.
+    Returns {"assignments": [interview docs], "unplaceable": [{"candidateId", "reason"}]}.
+    """
+    from ..db import interviews_collection, interview_slots_collection, schedules_collection, reserve_interview_ids
+    from ..repository import application_repo
+
+    recruiter_id = job.get("posterUserId")
+    hiring_manager_id = job.get("hiringManagerId")
+    interviewer_id = hiring_manager_id or recruiter_id
+    if not interviewer_id: raise ValueError("This job has no assigned Hiring Manager or Poster to schedule with.")
+
+    candidate_ids = list(dict.fromkeys(int(c) for c in candidate_ids))
+    applications = {a["userId"]: a for a in application_repo.find_applications({"jobId": job["jobId"], "userId": {"$in": candidate_ids}})}
+    applied = {c: a for c, a in applications.items() if a.get("status") in INVITEABLE_STATUSES}
+    unplaceable = []
+    for c in candidate_ids:
+        if c not in applications:
+            unplaceable.append({"candidateId": c, "reason": "No application for this job."})
+        elif c not in applied:
+            unplaceable.append({"candidateId": c, "reason": f"Application is '{applications[c].get('status')}'; only Applied or InterviewInviteSent candidates can be scheduled."})
+    candidate_ids = [c for c in candidate_ids if c in applied]
+
+    # 1. Free slots: interviewer once, each candidate filtered by their own bookings (one read each).
+    per_candidate = find_slots_for_candidates(interviewer_id, candidate_ids, start_date, end_date, duration_minutes)
+    # The slot search walks whole days up to end_date; keep only slots that fit inside the window.
+    step = timedelta(minutes=duration_minutes)
+    last_start = (end_date - step).isoformat()
+    slots = _non_overlapping([iso for opts in per_candidate.values() for iso in opts if iso <= last_start], duration_minutes)
+    allowed = set(slots)
+    options = {c: [iso for iso in sorted(set(per_candidate[c])) if iso in allowed] for c in candidate_ids}
+
+    # 2. Assignment
+    matching = maximum_matching(options)
+    for c in candidate_ids:
+        if c not in matching:
+            reason = "No common free slot." if not options[c] else "All common free slots were taken by other candidates."
+            unplaceable.append({"candidateId": c, "reason": reason})
+    if not matching: return {"assignments": [], "unplaceable": unplaceable}
+
+    # 3. Commit: one id block, one unordered reservation insert, one interview insert.
+    first_id = reserve_interview_ids(len(matching))
+    booked_at = datetime.utcnow()
+    docs, reservations = [], []
+    for offset, (c, iso) in enumerate(sorted(matching.items(), key=lambda kv: kv[1])):
+        start_time = datetime.fromisoformat(iso)
+        doc = {
+            "interviewId": first_id + offset,
+            "jobId": job["jobId"],
+            "candidateId": c,
+            "recruiterId": recruiter_id,
+            "hiringManagerId": hiring_manager_id,
+            "startTime": start_time,
+            "endTime": start_time + step,
+            "updatedAt": booked_at
+        }
+        docs.append(doc)
+        reservations.extend(build_slot_reservations(
+            doc["interviewId"], slot_participants(recruiter_id, hiring_manager_id, c), start_time, start_time + step
+        ))
+
+    conflicted = set()
+    try:
+        interview_slots_collection().insert_many(reservations, ordered=False)
+    except BulkWriteError as e:
+        # Someone booked concurrently: drop just the interviews whose granules were taken.
+        errors = e.details.get("writeErrors", [])
+        conflicted = {err["op"]["interviewId"] for err in errors if err.get("code") == 11000}
+        if any(err.get("code") != 11000 for err in errors):
+            interview_slots_collection().delete_many({"interviewId": {"$in": [d["interviewId"] for d in docs]}})
+            raise
+        interview_slots_collection().delete_many({"interviewId": {"$in": list(conflicted)}})
+
+    booked = [d for d in docs if d["interviewId"] not in conflicted]
+    if booked:
+        try:
+            interviews_collection().insert_many([dict(d) for d in booked], ordered=False)
+        except BulkWriteError as e:
+            # Legacy (recruiterId, startTime) unique index from repair_indexes.py: free the losers' granules.
+            errors = e.details.get("writeErrors", [])
+            failed = {err["op"]["interviewId"] for err in errors}
+            if any(err.get("code") != 11000 for err in errors):
+                ids = [d["interviewId"] for d in booked]
+                interviews_collection().delete_many({"interviewId": {"$in": ids}})
+                interview_slots_collection().delete_many({"interviewId": {"$in": ids}})
+                raise
+            interview_slots_collection().delete_many({"interviewId": {"$in": list(failed)}})
+            conflicted |= failed
+            booked = [d for d in booked if d["interviewId"] not in failed]
+        except Exception:
+            interview_slots_collection().delete_many({"interviewId": {"$in": [d["interviewId"] for d in booked]}})
+            raise
+    for d in docs:
+        if d["interviewId"] in conflicted:
+            unplaceable.append({"candidateId": d["candidateId"], "reason": "Slot was booked concurrently; please retry."})
+    if not booked: return {"assignments": [], "unplaceable": unplaceable}
+
+    reminder_service.schedule_interview_reminders(booked)
+    application_repo.update_many_applications(
+        {"jobId": job["jobId"], "userId": {"$in": [d["candidateId"] for d in booked]}, "status": {"$in": INVITEABLE_STATUSES}},
+        {"status": "Interviewing", "statusUpdatedAt": booked_at}
+    )
+    befores = [applied[d["candidateId"]] for d in booked]
+    job_stats_service.apply_changes([(b.get("jobId"), b.get("status"), "Interviewing") for b in befores], booked_at)
+    event_log_service.record_transitions(befores, "Interviewing", actor)
+
+    busy_people = [p for p in (hiring_manager_id, recruiter_id) if p is not None]
+    schedules_collection().update_many({"recruiterId": {"$in": busy_people}}, {"$inc": {"bookingsVersion": 1}})
+    availability_service.invalidate_busy(busy_people)
+
+    # Invitations can be slow (SMTP); send them off the request thread.
+    threading.Thread(target=_send_invitations, args=(job, booked), daemon=True).start()
+    return {"assignments": booked, "unplaceable": unplaceable}
@@ -0,0 +1,130 @@
+# src/backend/services/skill_service.py
+"""
+Skill normalisation and posting-list lookups.
+
+Skills are stored on users/jobs as canonical display names ("Python", not
+"python3"). Alongside, skill_postings keeps one id list per (kind, skill),
+split into bounded id-range buckets (skill_repo), so multi-skill filters
+become sorted-array intersections instead of a multikey scan over every
+user.
+"""
+import re
+import logging
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.skill_models import CANONICAL_SKILLS
+from ..repository import skill_repo
+
+logger = logging.getLogger(__name__)
+
+USER, JOB = "user", "job"
+
+_SPACES_RE = re.compile(r"\s+")
+_COMPACT_RE = re.compile(r"[\s.\-_/]")
+_VERSION_SUFFIX_RE = re.compile(r"\s*v?\d+(?:\.\d+)*$")
+_SLUG_RE = re.compile(r"[^a-z0-9+#]+")
+
+def _key(text: str) -> str:
+    return _SPACES_RE.sub(" ", text.strip().lower())
+
+def _build_lookup() -> Tuple[Dict[str, str], Dict[str, str]]:
+    exact, compact = {}, {}
+    for skill_id, (display, aliases) in CANONICAL_SKILLS.items():
+        # Whole-value matching is unambiguous, so display names like "Go" are safe here
+        # even though they are excluded from free-text scanning.
+        for form in [skill_id, display, *aliases]:
+            exact.setdefault(_key(form), skill_id)
+            compact.setdefault(_COMPACT_RE.sub("", _key(form)), skill_id)
+    return exact, compact
+
+_EXACT, _COMPACT = _build_lookup()
+
+@lru_cache(maxsize=50000)
+def _resolve(key: str) -> Tuple[str, Optional[str]]:
+    """Returns (skill_id, display) for a normalised key; display is None for skills outside the catalog."""
+    candidates = [key]
+    stripped = _VERSION_SUFFIX_RE.sub("", key)
+    if stripped and stripped != key: candidates.append(stripped)
+    for candidate in candidates:
+        skill_id = _EXACT.get(candidate) or _COMPACT.get(_COMPACT_RE.sub("", candidate))
+        if skill_id: return skill_id, CANONICAL_SKILLS[skill_id][0]
+    return _SLUG_RE.sub("-", key).strip("-"), None
+
+def skill_id(skill) -> Optional[str]:
+    """Stable ID for a skill string: the catalog ID, or a slug for skills outside the catalog."""
+    if not isinstance(skill, str) or not skill.strip(): return None
+    return _resolve(_key(skill))[0] or None
+
+def canonicalize_skill(skill) -> Optional[str]:
+    """Maps an alias to its canonical display name; unknown skills keep their (trimmed) spelling."""
+    if not isinstance(skill, str) or not skill.strip(): return None
+    _, display = _resolve(_key(skill))
+    return display or _SPACES_RE.sub(" ", skill.strip())
+
+def canonicalize_skills(skills: Optional[Iterable[str]]) -> List[str]:
+    """Canonical display names, de-duplicated by skill ID, first spelling wins, order preserved."""
+    seen, result = set(), []
+    for s in skills or []:
+        sid = skill_id(s)
+        if not sid or sid in seen: continue
+        seen.add(sid)
+        result.append(canonicalize_skill(s))
+    return result
+
+def _skill_ids(skills: Optional[Iterable[str]]) -> set:
+    return {sid for sid in (skill_id(s) for s in skills or []) if sid}
+
+# --- Posting-list maintenance (write paths; failures are logged, the rebuild script repairs drift) ---
+def record_skills(kind: str, item_id: int, skills: Optional[Iterable[str]]):
+    record_many(kind, [(item_id, skills)])
+
+def record_many(kind: str, items: Iterable[Tuple[int, Optional[Iterable[str]]]]):
+    try:
+        skill_repo.add_postings(kind, [(item_id, sid) for item_id, skills in items for sid in _skill_ids(skills)])
+    except Exception as e:
+        logger.error(f"Failed to update {kind} skill postings: {e}")
+
+def replace_skills(kind: str, item_id: int, old_skills: Optional[Iterable[str]], new_skills: Optional[Iterable[str]]):
+    old_ids, new_ids = _skill_ids(old_skills), _skill_ids(new_skills)
+    try:
+        skill_repo.remove_postings(kind, [(item_id, sid) for sid in old_ids - new_ids])
+        skill_repo.add_postings(kind, [(item_id, sid) for sid in new_ids - old_ids])
+    except Exception as e:
+        logger.error(f"Failed to update {kind} skill postings for {item_id}: {e}")
+
+def forget_item(kind: str, item_id: int, skills: Optional[Iterable[str]]):
+    replace_skills(kind, item_id, skills, None)
+
+# --- Queries ---
+_built = set()
+
+def _postings_built(kind: str) -> bool:
+    # Only the positive answer is cached: once built, the index is maintained on every write.
+    if kind not in _built and skill_repo.postings_built(kind): _built.add(kind)
+    return kind in _built
+
+def find_ids(kind: str, all_of: Optional[List[str]] = None, any_of: Optional[List[str]] = None) -> Optional[List[int]]:
+    """
+    Sorted ids having every skill in all_of and at least one in any_of.
+    Returns None when the posting lists have not been built yet, so callers can fall back to a collection scan.
+    """
+    if not _postings_built(kind): return None
+    all_ids, any_ids = _skill_ids(all_of), _skill_ids(any_of)
+    postings = skill_repo.find_postings(kind, all_ids | any_ids)
+
+    result = None
+    if all_ids:
+        if any(sid not in postings for sid in all_ids): return []
+        # Intersect smallest-first so the working set only shrinks.
+        for ids in sorted((postings[sid] for sid in all_ids), key=len):
+            arr = np.asarray(ids, dtype=np.int64)
+            result = arr if result is None else np.intersect1d(result, arr, assume_unique=True)
+            if result.size == 0: return []
+    if any_ids:
+        lists = [np.asarray(postings[sid], dtype=np.int64) for sid in any_ids if sid in postings]
+        union = np.unique(np.concatenate(lists)) if lists else np.empty(0, dtype=np.int64)
+        result = union if result is None else np.intersect1d(result, union, assume_unique=True)
+    return [] if result is None else result.tolist()
@@ -0,0 +1,180 @@
+# src/backend/services/text_extraction_service.py
+import os
+import time
+import threading
+import logging
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, List, Optional, Tuple
+import pypdf
+import docx
+
+logger = logging.getLogger(__name__)
+
+# --- Configuration (budgets keep a single huge CV from pinning a worker) ---
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", 20))
+RESUME_MAX_CHARS = int(os.getenv("RESUME_MAX_CHARS", 60000))
+RESUME_PAGES_PER_TASK = int(os.getenv("RESUME_PAGES_PER_TASK", 4))
+RESUME_EXTRACT_WORKERS = int(os.getenv("RESUME_EXTRACT_WORKERS", min(4, os.cpu_count() or 1)))
+RESUME_EXTRACT_TIMEOUT = int(os.getenv("RESUME_EXTRACT_TIMEOUT", 60))
+
+# Separates PDF pages in extracted text: a form feed on its own line, so line-based
+# consumers just see a blank line while compaction can still find page boundaries.
+PAGE_BREAK = "\n\f\n"
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=RESUME_EXTRACT_WORKERS)
+        return _pool
+
+def _reset_pool(terminate: bool = False):
+    """
+    Drops a broken pool so the next request starts fresh workers. With terminate=True the worker
+    processes are killed first: cancel() and shutdown() cannot stop a worker stuck on a page.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            if terminate:
+                for process in list((getattr(_pool, "_processes", None) or {}).values()):
+                    process.terminate()
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+def _extract_page_range(file_path: str, start: int, end: int, char_budget: int) -> str:
+    """
+    Worker entry point: extracts pages [start, end) and stops early once the char budget is spent.
+    Runs in a child process, so it re-opens the file instead of receiving a reader.
+    """
+    reader = pypdf.PdfReader(file_path)
+    parts, total = [], 0
+    for i in range(start, end):
+        text = reader.pages[i].extract_text() or ""
+        parts.append(text)
+        total += len(text)
+        if total >= char_budget: break
+    return PAGE_BREAK.join(parts)
+
+def _page_ranges(page_count: int, pages_per_task: int) -> List[Tuple[int, int]]:
+    return [(s, min(s + pages_per_task, page_count)) for s in range(0, page_count, pages_per_task)]
+
+def _clip(chunks: Iterator[Optional[str]], max_chars: int) -> Iterator[Optional[str]]:
+    """Yields chunks until max_chars have been produced, truncating the last one. None (a skipped range) passes through."""
+    remaining = max_chars
+    for chunk in chunks:
+        if chunk is None:
+            yield None
+            continue
+        if not chunk: continue
+        if len(chunk) >= remaining:
+            yield chunk[:remaining]
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+def _iter_serial(file_path: str, ranges: List[Tuple[int, int]], max_chars: int) -> Iterator[str]:
+    for start, end in ranges:
+        yield _extract_page_range(file_path, start, end, max_chars)
+
+def _iter_pooled(file_path: str, ranges: List[Tuple[int, int]], max_chars: int) -> Iterator[Optional[str]]:
+    """
+    Fans page ranges out to the process pool and yields results in page order as they complete.
+    The whole document shares one RESUME_EXTRACT_TIMEOUT deadline; ranges not finished by then are
+    skipped and yielded as None (retrying in-process would block on the same page with no timeout at
+    all), and the pool is recycled so the hung workers give their slots back. If the pool dies, the
+    remaining ranges are extracted in-process.
+    """
+    try:
+        pool = _get_pool()
+        futures = [pool.submit(_extract_page_range, file_path, s, e, max_chars) for s, e in ranges]
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        logger.warning(f"Extraction pool unavailable, extracting in-process: {e}")
+        _reset_pool()
+        yield from _iter_serial(file_path, ranges, max_chars)
+        return
+
+    deadline = time.monotonic() + RESUME_EXTRACT_TIMEOUT
+    timed_out = False
+    try:
+        for i, future in enumerate(futures):
+            try:
+                yield future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                start, end = ranges[i]
+                logger.warning(f"Skipping pages {start + 1}-{end} of {file_path}: extraction exceeded {RESUME_EXTRACT_TIMEOUT}s")
+                timed_out = True
+                yield None
+            except BrokenProcessPool as e:
+                logger.warning(f"Extraction pool crashed, finishing in-process: {e}")
+                _reset_pool()
+                yield from _iter_serial(file_path, ranges[i:], max_chars)
+                return
+    finally:
+        # Stop queued ranges once the consumer has enough text (or bailed out).
+        for future in futures: future.cancel()
+        if timed_out: _reset_pool(terminate=True)
+
+def _iter_pdf_ranges(file_path: str, max_pages: Optional[int], max_chars: Optional[int],
+                     in_process: bool) -> Iterator[Optional[str]]:
+    max_pages = max_pages or RESUME_MAX_PAGES
+    max_chars = max_chars or RESUME_MAX_CHARS
+
+    page_count = min(len(pypdf.PdfReader(file_path).pages), max_pages)
+    ranges = _page_ranges(page_count, max(1, RESUME_PAGES_PER_TASK))
+    if in_process or len(ranges) <= 1:
+        yield from _clip(_iter_serial(file_path, ranges, max_chars), max_chars)
+    else:
+        yield from _clip(_iter_pooled(file_path, ranges, max_chars), max_chars)
+
+def iter_pdf_text(file_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                  in_process: bool = False) -> Iterator[str]:
+    """
+    Streams PDF text in page order, one chunk per page range, within the page/char budgets.
+    Single-range documents are extracted in-process; the pool only pays off when there is work to split.
+    Callers that already parallelise across documents (bulk ingest workers) pass in_process=True.
+    Chunks do not end with a separator; join them with PAGE_BREAK (see join_ranges).
+    """
+    return (chunk for chunk in _iter_pdf_ranges(file_path, max_pages, max_chars, in_process) if chunk is not None)
+
+def join_ranges(chunks: Iterable[Optional[str]]) -> Tuple[str, bool]:
+    """Joins page-range chunks on page breaks. Returns (text, complete); complete is False if a range was skipped."""
+    chunks = list(chunks)
+    return PAGE_BREAK.join(c for c in chunks if c), None not in chunks
+
+def read_pdf_text(file_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                  in_process: bool = False) -> Tuple[str, bool]:
+    """Whole-document PDF text as (text, complete); complete is False if a page range timed out."""
+    return join_ranges(_iter_pdf_ranges(file_path, max_pages, max_chars, in_process))
+
+def iter_docx_text(file_path: str, max_chars: Optional[int] = None) -> Iterator[str]:
+    """Streams DOCX paragraphs within the char budget."""
+    max_chars = max_chars or RESUME_MAX_CHARS
+    doc = docx.Document(file_path)
+    yield from _clip((para.text + "\n" for para in doc.paragraphs), max_chars)
+
+def iter_resume_text(file_path: str, in_process: bool = False) -> Iterator[str]:
+    """Dispatches to the streaming extractor matching the file extension."""
+    _, file_extension = os.path.splitext(file_path)
+    if file_extension.lower() == '.pdf':
+        return iter_pdf_text(file_path, in_process=in_process)
+    if file_extension.lower() == '.docx':
+        return iter_docx_text(file_path)
+    return iter(())
+
+def extract_resume_text(file_path: str) -> str:
+    """
+    Process-pool worker entry point for bulk ingestion: extracts one whole document in-process.
+    Errors are swallowed so one corrupt file cannot fail a whole batch.
+    """
+    try:
+        if os.path.splitext(file_path)[1].lower() == '.pdf':
+            return read_pdf_text(file_path, in_process=True)[0]
+        return "".join(iter_resume_text(file_path, in_process=True))
+    except Exception as e:
+        logger.warning(f"Failed to extract text from {file_path}: {e}")
+        return ""
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from src.backend.models.application import Application
+from src.backend.models.interview import Interview
+from src.backend.models.job import Job
+from src.backend.models.user import User
+
+POSTED = datetime(2031, 4, 2, 9, 30)
+SUBMITTED = datetime(2031, 4, 3, 17, 5, 9)
+
+def test_user_output_matches_the_old_dict_and_drops_private_fields():
+    doc = {"_id": ObjectId(), "password": b"hash", "UserID": 7, "email": "a@example.com", "firstName": "Ann",
+           "lastName": "Lee", "role": "Applicant", "createdAt": SUBMITTED, "skills": ["Python"], "years_of_experience": 4}
+    out = User.from_bson(doc).to_dict()
+    assert "password" not in out and "_id" not in out
+    assert out["createdAt"] == "2031-04-03T17:05:09"
+    assert {k: out[k] for k in ("UserID", "email", "firstName", "lastName", "role", "skills", "years_of_experience", "dob")} == {
+        "UserID": 7, "email": "a@example.com", "firstName": "Ann", "lastName": "Lee", "role": "Applicant",
+        "skills": ["Python"], "years_of_experience": 4, "dob": None,
+    }
+    assert (out["applicationStatus"], out["resume_url"], out["interviewTime"]) == (None, None, None)
+
+def test_job_output_casts_ids_and_formats_dates():
+    doc = {"jobId": "12", "title": "Engineer", "company": "Acme", "postedAt": POSTED, "status": "Open",
+           "hiringManagerId": 2, "archivedAt": SUBMITTED, "internal": "ignored"}
+    out = Job.from_bson(doc).to_dict()
+    assert out["jobId"] == 12
+    assert (out["postedAt"], out["archivedAt"]) == ("2031-04-02", "2031-04-03T17:05:09Z")
+    assert "internal" not in out and out["location"] is None
+
+def test_application_output_keeps_unmigrated_string_dates():
+    doc = {"appId": 3.0, "userId": "7", "jobId": 12, "status": "Applied", "submittedAt": "2031-04-03T17:05:09Z",
+           "notes": [{"text": "long history"}], "noteCount": 1}
+    out = Application.from_bson(doc).to_dict()
+    assert (out["appId"], out["userId"], out["jobId"]) == (3, 7, 12)
+    assert out["submittedAt"] == "2031-04-03T17:05:09Z" and out["archivedAt"] is None
+    assert "notes" not in out and out["noteCount"] == 1
+
+def test_interview_output_formats_times_as_iso():
+    out = Interview.from_bson({"interviewId": 5, "startTime": POSTED, "endTime": "2031-04-02T10:00:00"}).to_dict()
+    assert (out["startTime"], out["endTime"]) == ("2031-04-02T09:30:00", "2031-04-02T10:00:00")
+
+@pytest.mark.parametrize("model", [User, Job, Application, Interview])
+def test_empty_documents_give_none(model):
+    assert model.from_bson(None) is None and model.from_bson({}) is None
+
+def test_records_behave_like_the_old_output_dicts():
+    job = Job.from_bson({"jobId": 1, "title": "Engineer"})
+    assert job["title"] == job.get("title") == job.title == "Engineer"
+    assert job.get("missing", "default") == "default" and "title" in job and "missing" not in job
+    assert list(job.keys()) == list(Job.__slots__)
+    job["status"] = "Closed"
+    assert job.status == "Closed"
+    with pytest.raises(KeyError): job["missing"]
+    with pytest.raises(KeyError): job["missing"] = 1
+    assert job == Job.from_bson({"jobId": 1, "title": "Engineer", "status": "Closed"})
+    assert not hasattr(job, "__dict__")
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+import mongomock
+import pytest
+
+from src.backend import db
+from src.backend.repository import application_repo
+
+LEGACY = "Strong portfolio.\n--- Recruiter Note (2031-02-01): Moved to onsite.\n--- Recruiter Note (2031-02-09): Offer sent."
+
+@pytest.fixture(autouse=True)
+def mock_db(monkeypatch):
+    monkeypatch.setattr(db, "_db", mongomock.MongoClient()["jap_test"])
+    return db._db
+
+def test_legacy_string_is_split_into_dated_entries():
+    entries = application_repo.parse_legacy_notes(LEGACY, datetime(2031, 1, 15))
+    assert [(e["createdAt"], e["role"], e["text"]) for e in entries] == [
+        (datetime(2031, 1, 15), None, "Strong portfolio."),
+        (datetime(2031, 2, 1), "Manager", "Moved to onsite."),
+        (datetime(2031, 2, 9), "Manager", "Offer sent."),
+    ]
+
+@pytest.mark.parametrize("collection, archived", [("applications", False), ("applications_archive", True)])
+def test_legacy_notes_are_converted_on_first_page_read(mock_db, collection, archived):
+    mock_db[collection].insert_one({"appId": 1, "jobId": 10, "notes": LEGACY, "submittedAt": datetime(2031, 1, 15)})
+
+    notes, total = application_repo.find_note_page(1, 1, 5, archived=archived)
+    assert total == 3 and [n["text"] for n in notes] == ["Moved to onsite.", "Offer sent."]
+    stored = mock_db[collection].find_one({"appId": 1})
+    assert stored["noteCount"] == 3 and isinstance(stored["notes"], list)
+
+def test_note_pages_slice_in_append_order(mock_db):
+    mock_db["applications"].insert_one({"appId": 2, "jobId": 10, "notes": [], "noteCount": 0})
+    for i in range(5):
+        application_repo.append_note({"appId": 2}, application_repo.build_note(f"note {i}", "Rita", 1, "Recruiter"))
+
+    assert application_repo.find_note_page(2, 0, 2) == (mock_db["applications"].find_one({"appId": 2})["notes"][:2], 5)
+    assert [n["text"] for n in application_repo.find_note_page(2, 4, 2)[0]] == ["note 4"]
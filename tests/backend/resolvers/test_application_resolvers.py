@@ -0,0 +1,26 @@
+import mongomock
+import pytest
+
+from src.backend import db
+from src.backend.resolvers.application_resolvers import resolve_application_notes
+
+@pytest.fixture(autouse=True)
+def mock_db(monkeypatch):
+    monkeypatch.setattr(db, "_db", mongomock.MongoClient()["jap_test"])
+    notes = [{"author": "Rita", "authorId": 1, "role": "Recruiter", "createdAt": None, "text": f"note {i}"} for i in range(5)]
+    db._db["applications"].insert_one({"appId": 1, "jobId": 10, "notes": notes, "noteCount": 5})
+    return db._db
+
+def test_following_end_cursor_walks_every_note_once():
+    seen, after = [], None
+    while True:
+        page = resolve_application_notes({"appId": 1}, None, first=2, after=after)
+        seen += [(n["cursor"], n["text"]) for n in page["items"]]
+        if not page["hasNextPage"]: break
+        after = page["endCursor"]
+    assert seen == [(str(i), f"note {i}") for i in range(5)]
+
+@pytest.mark.parametrize("after", ["-3", "-1", "x"])
+def test_negative_or_malformed_cursor_is_rejected(after):
+    with pytest.raises(ValueError, match="Invalid 'after' cursor."):
+        resolve_application_notes({"appId": 1}, None, first=2, after=after)
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import mongomock
+import pytest
+
+from src.backend import db
+from src.backend.repository import application_repo
+from src.backend.services import job_stats_service
+
+@pytest.fixture(autouse=True)
+def mock_db(monkeypatch):
+    monkeypatch.setattr(db, "_db", mongomock.MongoClient()["jap_test"])
+    db.ensure_job_stats_index()
+    return db._db
+
+def _apply(app_id, job_id=10):
+    application_repo.insert_application({"appId": app_id, "userId": app_id, "jobId": job_id, "status": "Applied",
+                                         "submittedAt": datetime(2031, 1, app_id)})
+
+def test_counters_move_with_each_application_write():
+    job_stats_service.create_for_job(10)
+    _apply(1)
+    _apply(2)
+    application_repo.transition_application_status({"appId": 2}, "Interviewing")
+
+    stats = job_stats_service.load_stats([10])[10]
+    assert stats["total"] == 2
+    assert {k: v for k, v in stats["byStatus"].items() if v} == {"Applied": 1, "Interviewing": 1}
+
+def test_untracked_job_is_upserted_as_partial_and_counted_from_applications(mock_db):
+    # Applications that predate job_stats: the upserted document only holds the deltas since.
+    mock_db["applications"].insert_many([{"appId": a, "jobId": 20, "status": "Applied"} for a in (5, 6, 7)])
+    _apply(8, job_id=20)
+
+    assert db.job_stats_collection().find_one({"jobId": 20})["partial"] is True
+    assert job_stats_service.load_stats([20])[20]["total"] == 4
+
+def test_archived_job_without_stats_is_counted_from_the_archive(mock_db):
+    mock_db["applications_archive"].insert_many([
+        {"appId": 1, "jobId": 30, "status": "Hired", "submittedAt": datetime(2030, 5, 1)},
+        {"appId": 2, "jobId": 30, "status": "Rejected", "submittedAt": datetime(2030, 5, 2)},
+    ])
+    stats = job_stats_service.load_stats([30])[30]
+    assert stats["total"] == 2 and stats["byStatus"] == {"Hired": 1, "Rejected": 1}
+    assert stats["lastActivityAt"] == datetime(2030, 5, 2)
@@ -0,0 +1,33 @@
+from src.backend.services.resume_compaction_service import normalize_text, compact_resume_text
+from src.backend.services.text_extraction_service import PAGE_BREAK
+
+def test_repeated_job_titles_survive_normalization():
+    text = PAGE_BREAK.join([
+        "Jane Doe\nSoftware Engineer\nEXPERIENCE\nSoftware Engineer\nAcme, 2020 - 2023\nBuilt APIs",
+        "Software Engineer\nGlobex, 2017 - 2020\nRan migrations\nSoftware Engineer\nInitech, 2015 - 2017",
+    ])
+    out = normalize_text(text)
+    assert out.splitlines().count("Software Engineer") == 4
+
+    compacted, _ = compact_resume_text(text)
+    assert compacted.count("Software Engineer") == 4
+
+def test_running_header_and_footer_on_every_page_are_kept_once():
+    pages = [
+        "Jane Doe - jane@example.com\nSUMMARY\nBackend engineer\nPage 1 of 3\nConfidential draft",
+        "Jane Doe - jane@example.com\nSKILLS\nPython, Go\nPage 2 of 3\nConfidential draft",
+        "Jane Doe - jane@example.com\nEDUCATION\nBSc Computer Science\nPage 3 of 3\nConfidential draft",
+    ]
+    out = normalize_text(PAGE_BREAK.join(pages)).splitlines()
+    assert out.count("Jane Doe - jane@example.com") == 1
+    assert out.count("Confidential draft") == 1
+    assert not any(line.startswith("Page ") for line in out)
+    assert "Python, Go" in out and "BSc Computer Science" in out
+
+def test_lines_repeated_on_some_pages_or_without_page_breaks_are_kept():
+    # Three copies on one page are not a running header.
+    single = "Team Lead\nAcme\nTeam Lead\nGlobex\nTeam Lead\nInitech"
+    assert normalize_text(single).splitlines().count("Team Lead") == 3
+    # On the edge of two pages out of three: still content.
+    pages = ["Team Lead\nAcme", "Team Lead\nGlobex", "Initech\nStaff Engineer"]
+    assert normalize_text(PAGE_BREAK.join(pages)).splitlines().count("Team Lead") == 2
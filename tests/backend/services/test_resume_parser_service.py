@@ -0,0 +1,63 @@
+import mongomock
+import pytest
+
+from src.backend import db
+from src.backend.services import resume_parser_service
+
+PARSED = {"skills": ["Python"], "calculated_years_of_experience": 4}
+
+@pytest.fixture(autouse=True)
+def mock_db(monkeypatch):
+    monkeypatch.setattr(db, "_db", mongomock.MongoClient()["jap_test"])
+    db.ensure_resume_parse_cache_index()
+    return db._db
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+    def parse(raw_text):
+        calls.append(raw_text)
+        return dict(PARSED), True
+    monkeypatch.setattr(resume_parser_service, "_parse_resume_text", parse)
+    return calls
+
+def test_text_missing_a_timed_out_range_is_not_cached(mock_db, llm_calls, monkeypatch):
+    monkeypatch.setattr(resume_parser_service, "_extract_text", lambda path: ("pages 1-4 only", False))
+    raw_text, parsed = resume_parser_service._extract_and_parse("cv.pdf", "hash-a")
+
+    assert (raw_text, parsed) == ("pages 1-4 only", PARSED)
+    assert mock_db["resume_parse_cache"].count_documents({}) == 0
+
+    # The next upload extracts again instead of reusing the truncated text.
+    monkeypatch.setattr(resume_parser_service, "_extract_text", lambda path: ("all pages", True))
+    assert resume_parser_service._extract_and_parse("cv.pdf", "hash-a")[0] == "all pages"
+    assert mock_db["resume_parse_cache"].find_one({"contentHash": "hash-a"})["rawText"] == "all pages"
+
+def test_parse_cache_is_keyed_by_content_hash_and_prompt_version(mock_db, llm_calls, monkeypatch):
+    extracted = []
+    def extract(path):
+        extracted.append(path)
+        return "resume text", True
+    monkeypatch.setattr(resume_parser_service, "_extract_text", extract)
+
+    first = resume_parser_service._extract_and_parse("a.pdf", "hash-a")
+    again = resume_parser_service._extract_and_parse("copy-of-a.pdf", "hash-a")
+    assert first == again == ("resume text", PARSED)
+    assert (extracted, len(llm_calls)) == (["a.pdf"], 1)
+
+    # Different content: its own entry.
+    resume_parser_service._extract_and_parse("b.pdf", "hash-b")
+    assert (extracted, len(llm_calls)) == (["a.pdf", "b.pdf"], 2)
+
+    # A prompt bump re-parses, but reuses the extracted text.
+    monkeypatch.setattr(resume_parser_service, "PROMPT_VERSION", "v-next")
+    resume_parser_service._extract_and_parse("a.pdf", "hash-a")
+    assert (extracted, len(llm_calls)) == (["a.pdf", "b.pdf"], 3)
+    assert mock_db["resume_parse_cache"].count_documents({"contentHash": "hash-a"}) == 2
+
+def test_identical_bytes_hash_the_same(tmp_path):
+    a, b, c = tmp_path / "a.pdf", tmp_path / "b.pdf", tmp_path / "c.pdf"
+    a.write_bytes(b"%PDF same")
+    b.write_bytes(b"%PDF same")
+    c.write_bytes(b"%PDF other")
+    assert resume_parser_service.hash_file(str(a)) == resume_parser_service.hash_file(str(b)) != resume_parser_service.hash_file(str(c))
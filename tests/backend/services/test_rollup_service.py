@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+import mongomock
+import pytest
+
+from src.backend import db
+from src.backend.services import rollup_service
+
+@pytest.fixture(autouse=True)
+def mock_db(monkeypatch):
+    monkeypatch.setattr(db, "_db", mongomock.MongoClient()["jap_test"])
+    return db._db
+
+@pytest.fixture
+def windows(monkeypatch):
+    """Records each run's aggregation window (mongomock cannot execute the rollup pipeline itself)."""
+    seen = []
+    class Events:
+        def aggregate(self, pipeline):
+            seen.append((pipeline[0]["$match"]["ts"]["$gte"], pipeline[0]["$match"]["ts"]["$lt"]))
+            assert pipeline[-1]["$merge"]["into"] == "rollups"
+    monkeypatch.setattr(rollup_service, "application_events_collection", lambda: Events())
+    return seen
+
+def test_runs_rebuild_whole_days_from_the_watermark(windows):
+    lag = timedelta(seconds=rollup_service.ROLLUP_SAFETY_LAG_SECONDS)
+    first = datetime(2031, 3, 3, 14, 30)
+    rollup_service.run(first)
+    assert windows == [(datetime(1970, 1, 1), first - lag)]
+
+    # The next run restarts at midnight of the watermark's day, so that day is rebuilt whole.
+    second = datetime(2031, 3, 4, 9, 0)
+    assert rollup_service.run(second) == {"start": datetime(2031, 3, 3), "end": second - lag}
+    assert rollup_service.watermark() == second - lag
+
+    # Nothing new past the lag: idle, and the watermark never moves back.
+    assert rollup_service.run(second) == {"start": None, "end": None}
+    assert len(windows) == 2 and rollup_service.watermark() == second - lag
+
+def test_metrics_sum_daily_buckets_per_key_within_the_range(mock_db):
+    def bucket(dim, key, day, applications, hires=0, tth=()):
+        return {"_id": f"{dim}:{key}:{day}", "dim": dim, "key": key, "day": datetime(2031, 3, day), "label": f"{key}",
+                "applications": applications, "hires": hires, "timeToHireDays": list(tth)}
+    mock_db["rollups"].insert_many([
+        bucket("company", "Acme", 1, 4), bucket("company", "Acme", 2, 3, hires=1, tth=[12.5]),
+        bucket("company", "Globex", 2, 9), bucket("company", "Acme", 5, 100),  # Outside the range
+        bucket("job", 7, 2, 50),  # Other dimension
+    ])
+    rows = rollup_service.load_metrics("company", datetime(2031, 3, 1, 18, 0), datetime(2031, 3, 2, 6, 0))
+
+    assert [(r["key"], r["applications"], r["hires"]) for r in rows] == [("Globex", 9, 0), ("Acme", 7, 1)]
+    acme = rows[1]
+    assert acme["timeToHireDays"] == [12.5]
+    assert [d["day"] for d in acme["daily"]] == [datetime(2031, 3, 1), datetime(2031, 3, 2)]
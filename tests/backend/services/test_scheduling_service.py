@@ -0,0 +1,107 @@
+import threading
+from datetime import datetime, timedelta
+
+import mongomock
+import pytest
+
+from src.backend import db
+from src.backend.services import scheduling_service
+
+START = datetime(2031, 3, 3, 10, 0)
+END = START + timedelta(minutes=30)
+
+@pytest.fixture(autouse=True)
+def mock_db(monkeypatch):
+    monkeypatch.setattr(db, "_db", mongomock.MongoClient()["jap_test"])
+    db.ensure_interview_slot_index()
+    return db._db
+
+def test_concurrent_reservations_for_same_slot_admit_exactly_one():
+    workers = 8
+    barrier = threading.Barrier(workers)
+    won, lost = [], []
+
+    def book(interview_id):
+        barrier.wait()
+        try:
+            scheduling_service.reserve_slots(interview_id, [7, 100 + interview_id], START, END)
+            won.append(interview_id)
+        except ValueError:
+            lost.append(interview_id)
+
+    threads = [threading.Thread(target=book, args=(i,)) for i in range(1, workers + 1)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+    assert len(won) == 1 and len(lost) == workers - 1
+    # Losers roll back their partial claims; only the winner holds granules.
+    assert set(db.interview_slots_collection().distinct("interviewId")) == set(won)
+    assert db.interview_slots_collection().count_documents({"personId": 7}) == len(scheduling_service.slot_granules(START, END))
+
+def test_shared_coordinator_does_not_block_other_managers(mock_db):
+    mock_db["applications"].insert_many([
+        {"appId": 1, "jobId": 10, "userId": 31, "status": "Applied"},
+        {"appId": 2, "jobId": 20, "userId": 32, "status": "Applied"},
+    ])
+    # One recruiter (1) coordinates two jobs run by different hiring managers (2 and 3).
+    first = scheduling_service.book_interview(10, 31, recruiter_id=1, hiring_manager_id=2, start_time=START, end_time=END)
+    second = scheduling_service.book_interview(20, 32, recruiter_id=1, hiring_manager_id=3, start_time=START, end_time=END)
+
+    assert first["interviewId"] != second["interviewId"]
+    assert db.interview_slots_collection().count_documents({"personId": 1}) == 0
+    with pytest.raises(ValueError, match="Conflict detected"):
+        scheduling_service.book_interview(20, 33, recruiter_id=1, hiring_manager_id=3, start_time=START, end_time=END)
+
+@pytest.fixture
+def auto_job(mock_db, monkeypatch):
+    scheduling_service.set_recruiter_availability(2, [{"dayOfWeek": "Monday", "startTime": "09:00", "endTime": "12:00"}])
+    mock_db["users"].insert_many([{"UserID": u, "email": f"c{u}@example.com", "firstName": f"C{u}"} for u in (31, 32, 33, 34)])
+    mock_db["applications"].insert_many([
+        {"appId": 1, "jobId": 10, "userId": 31, "status": "Applied"},
+        {"appId": 2, "jobId": 10, "userId": 32, "status": "InterviewInviteSent"},
+        {"appId": 3, "jobId": 10, "userId": 33, "status": "Rejected"},
+        {"appId": 4, "jobId": 10, "userId": 34, "status": "Hired"},
+    ])
+    sent = []
+    monkeypatch.setattr("src.backend.services.email_service.send_interview_invitation", lambda *args: sent.append(args[0]))
+
+    class InlineThread:  # Run the invitation sender before the assertions
+        def __init__(self, target, args=(), daemon=None): self.target, self.args = target, args
+        def start(self): self.target(*self.args)
+    monkeypatch.setattr(scheduling_service.threading, "Thread", InlineThread)
+    job = {"jobId": 10, "title": "Engineer", "company": "Acme", "posterUserId": 1, "hiringManagerId": 2}
+    return job, sent
+
+def test_auto_schedule_books_only_inviteable_candidates_and_invites_them(mock_db, auto_job):
+    job, sent = auto_job
+    result = scheduling_service.auto_schedule_interviews(job, [31, 32, 33, 34], START.replace(hour=9), START.replace(hour=12))
+
+    assert sorted(d["candidateId"] for d in result["assignments"]) == [31, 32]
+    assert sorted(u["candidateId"] for u in result["unplaceable"]) == [33, 34]
+    statuses = {a["userId"]: a["status"] for a in mock_db["applications"].find()}
+    assert statuses == {31: "Interviewing", 32: "Interviewing", 33: "Rejected", 34: "Hired"}
+    assert sorted(sent) == ["c31@example.com", "c32@example.com"]
+
+def test_auto_schedule_releases_reservations_on_legacy_index_conflict(mock_db, auto_job):
+    job, sent = auto_job
+    # Legacy unique (recruiterId, startTime) index: the coordinator already has an interview at 09:00 for another manager.
+    mock_db["interviews"].create_index([("recruiterId", 1), ("startTime", 1)], unique=True)
+    mock_db["interviews"].insert_one({"interviewId": 900, "jobId": 20, "candidateId": 40, "recruiterId": 1,
+                                      "hiringManagerId": 3, "startTime": START.replace(hour=9), "endTime": START.replace(hour=9, minute=30)})
+    result = scheduling_service.auto_schedule_interviews(job, [31], START.replace(hour=9), START.replace(hour=12))
+
+    assert result["assignments"] == []
+    assert result["unplaceable"] == [{"candidateId": 31, "reason": "Slot was booked concurrently; please retry."}]
+    assert db.interview_slots_collection().count_documents({}) == 0
+    assert mock_db["applications"].find_one({"userId": 31})["status"] == "Applied"
+    assert sent == []
+
+def test_auto_schedule_on_unaligned_availability_does_not_conflict_with_itself(mock_db, auto_job):
+    job, sent = auto_job
+    # 09:10-09:40 and 09:40-10:10 would both reserve the 09:30 granule.
+    scheduling_service.set_recruiter_availability(2, [{"dayOfWeek": "Monday", "startTime": "09:10", "endTime": "10:40"}])
+    result = scheduling_service.auto_schedule_interviews(job, [31, 32], START.replace(hour=9), START.replace(hour=11))
+
+    assert result["unplaceable"] == []
+    starts = sorted(d["startTime"] for d in result["assignments"])
+    assert starts == [START.replace(hour=9, minute=10), START.replace(hour=10, minute=10)]
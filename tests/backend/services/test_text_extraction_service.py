@@ -0,0 +1,56 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pypdf
+import pytest
+
+from src.backend.services import text_extraction_service as extraction
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    writer = pypdf.PdfWriter()
+    for _ in range(8): writer.add_blank_page(width=200, height=200)
+    path = tmp_path / "cv.pdf"
+    with open(path, "wb") as f: writer.write(f)
+    return str(path)
+
+@pytest.fixture
+def fake_pages(monkeypatch):
+    """Page i reads 'first i' / 'last i'; ranges in `slow` sleep first. Runs in a thread pool (no pickling)."""
+    slow = {}
+    def extract(file_path, start, end, char_budget):
+        time.sleep(slow.get(start, 0))
+        return "\n".join(f"first {i}\nlast {i}" for i in range(start, end))
+    pool = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(extraction, "_extract_page_range", extract)
+    monkeypatch.setattr(extraction, "_get_pool", lambda: pool)
+    monkeypatch.setattr(extraction, "_reset_pool", lambda terminate=False: None)
+    monkeypatch.setattr(extraction, "RESUME_PAGES_PER_TASK", 2)
+    yield slow
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def lines(text):
+    return [line for line in text.split("\n") if line != "\f"]
+
+def test_ranges_are_joined_on_line_boundaries(pdf_path, fake_pages):
+    for in_process in (True, False):
+        text, complete = extraction.read_pdf_text(pdf_path, in_process=in_process)
+        assert complete
+        # No "last 1first 2" tokens glued across a range boundary.
+        assert lines(text) == [line for i in range(8) for line in (f"first {i}", f"last {i}")]
+        assert text.count(extraction.PAGE_BREAK) == 3
+
+def test_timed_out_ranges_share_one_deadline_and_mark_the_text_incomplete(pdf_path, fake_pages, monkeypatch):
+    monkeypatch.setattr(extraction, "RESUME_EXTRACT_TIMEOUT", 0.3)
+    fake_pages.update({2: 1.0, 4: 1.0})
+
+    started = time.monotonic()
+    text, complete = extraction.read_pdf_text(pdf_path)
+    # Per-future timeouts would wait 0.3s for each hung range.
+    assert time.monotonic() - started < 0.55
+    assert not complete
+    assert lines(text) == ["first 0", "last 0", "first 1", "last 1", "first 6", "last 6", "first 7", "last 7"]
+
+def test_char_budget_clips_the_joined_text(pdf_path, fake_pages):
+    text, complete = extraction.read_pdf_text(pdf_path, max_chars=20, in_process=True)
+    assert complete and text == "first 0\nlast 0\nfirst"
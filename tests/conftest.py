@@ -0,0 +1,7 @@
+import mongomock
+
+from src.backend import db
+
+# Some repositories touch the database at import time (e.g. resume_repo's counter);
+# point them at an in-memory database before any test module imports them.
+db._db = mongomock.MongoClient()["jap_test"]